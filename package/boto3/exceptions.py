@@ -85,6 +85,10 @@ class S3UploadFailedError(Boto3Error):
     pass
 
 
+class S3SelectIncompleteError(Boto3Error):
+    """The S3 Select event stream ended without an End event."""
+
+
 class DynamoDBOperationNotSupportedError(Boto3Error):
     """Raised for operations that are not supported for an operand."""
 
@@ -10,9 +10,18 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import collections
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
 from botocore.exceptions import ClientError
 
 from boto3 import utils
+from boto3.exceptions import S3SelectIncompleteError
+from boto3.s3.query import DEFAULT_OUTPUT_SERIALIZATION, create_record_decoder
 from boto3.s3.transfer import (
     ProgressCallbackInvoker,
     S3Transfer,
@@ -20,6 +29,12 @@ from boto3.s3.transfer import (
     create_transfer_manager,
 )
 
+# Marks the end of a shard's pages in list_objects_parallel().
+_SHARD_DONE = object()
+# How often a shard blocked on a full page queue checks whether the
+# listing was abandoned.
+_SHARD_QUEUE_POLL_INTERVAL = 0.1
+
 
 def inject_s3_transfer_methods(class_attributes, **kwargs):
     utils.inject_attribute(class_attributes, 'upload_file', upload_file)
@@ -31,6 +46,18 @@ def inject_s3_transfer_methods(class_attributes, **kwargs):
     )
 
 
+def inject_s3_listing_methods(class_attributes, **kwargs):
+    utils.inject_attribute(
+        class_attributes, 'list_objects_parallel', list_objects_parallel
+    )
+
+
+def inject_s3_select_methods(class_attributes, **kwargs):
+    utils.inject_attribute(
+        class_attributes, 'select_object_records', select_object_records
+    )
+
+
 def inject_bucket_methods(class_attributes, **kwargs):
     utils.inject_attribute(class_attributes, 'load', bucket_load)
     utils.inject_attribute(class_attributes, 'upload_file', bucket_upload_file)
@@ -889,3 +916,241 @@ def object_download_fileobj(
         Callback=Callback,
         Config=Config,
     )
+
+
+def list_objects_parallel(
+    self,
+    Bucket,
+    Prefix='',
+    Delimiter='/',
+    MaxWorkers=8,
+    PrefetchPages=1,
+    ExtraArgs=None,
+):
+    """List the objects under a prefix, listing its sub-prefixes concurrently.
+
+    The keyspace is first split into shards with a delimited listing of
+    ``Prefix``.  Every common prefix returned is then listed in full, with
+    up to ``MaxWorkers`` shards listed at the same time.  Objects directly
+    under ``Prefix`` are yielded first, followed by the objects of each
+    shard in the order the shards were returned.
+
+    Usage::
+
+        import boto3
+        s3 = boto3.client('s3')
+        for obj in s3.list_objects_parallel('mybucket', 'user-uploads/'):
+            print(obj['Key'], obj['Size'])
+
+    :type Bucket: str
+    :param Bucket: The name of the bucket to list.
+
+    :type Prefix: str
+    :param Prefix: Only list keys beginning with this prefix.
+
+    :type Delimiter: str
+    :param Delimiter: The delimiter used to split the keyspace into shards.
+
+    :type MaxWorkers: int
+    :param MaxWorkers: The maximum number of shards listed concurrently.
+        Each shard holds at most ``PrefetchPages + 1`` listed pages in
+        memory until they are consumed.
+
+    :type PrefetchPages: int
+    :param PrefetchPages: The number of pages each listing requests ahead
+        of the page being processed.
+
+    :type ExtraArgs: dict
+    :param ExtraArgs: Extra arguments passed to each ListObjectsV2 call,
+        e.g. ``RequestPayer``.
+
+    :rtype: iterator
+    :returns: An iterator of the ``Contents`` entries of ListObjectsV2.
+    """
+    paginator = self.get_paginator('list_objects_v2')
+    extra_args = ExtraArgs or {}
+    pagination_config = {'PrefetchPages': PrefetchPages}
+    # Set once the caller stops iterating, so that shards still being
+    # listed stop at their next page.
+    abandoned = threading.Event()
+
+    def _put_page(page_queue, item):
+        while not abandoned.is_set():
+            try:
+                page_queue.put(item, timeout=_SHARD_QUEUE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _list_shard(shard_prefix, page_queue):
+        pages = paginator.paginate(
+            Bucket=Bucket,
+            Prefix=shard_prefix,
+            PaginationConfig=pagination_config,
+            **extra_args,
+        )
+        try:
+            with closing(iter(pages)) as page_iterator:
+                for page in page_iterator:
+                    if not _put_page(page_queue, page.get('Contents', [])):
+                        return
+        except Exception as e:
+            _put_page(page_queue, e)
+            return
+        _put_page(page_queue, _SHARD_DONE)
+
+    def _submit_shard(executor, shard_prefix):
+        # Each shard buffers at most a bounded number of pages ahead of
+        # the caller, however many objects it has.
+        page_queue = queue.Queue(PrefetchPages + 1)
+        future = executor.submit(_list_shard, shard_prefix, page_queue)
+        return future, page_queue
+
+    shard_prefixes = []
+    pages = paginator.paginate(
+        Bucket=Bucket,
+        Prefix=Prefix,
+        Delimiter=Delimiter,
+        PaginationConfig=pagination_config,
+        **extra_args,
+    )
+    with closing(iter(pages)) as page_iterator:
+        for page in page_iterator:
+            yield from page.get('Contents', [])
+            for common_prefix in page.get('CommonPrefixes', []):
+                shard_prefixes.append(common_prefix['Prefix'])
+
+    executor = ThreadPoolExecutor(max_workers=MaxWorkers)
+    pending = collections.deque()
+    try:
+        shard_prefixes = iter(shard_prefixes)
+        for shard_prefix in itertools.islice(shard_prefixes, MaxWorkers):
+            pending.append(_submit_shard(executor, shard_prefix))
+        while pending:
+            _, page_queue = pending[0]
+            while True:
+                item = page_queue.get()
+                if item is _SHARD_DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield from item
+            pending.popleft()
+            for shard_prefix in itertools.islice(shard_prefixes, 1):
+                pending.append(_submit_shard(executor, shard_prefix))
+    finally:
+        abandoned.set()
+        for future, _ in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def select_object_records(
+    self,
+    Bucket,
+    Key,
+    Expression,
+    InputSerialization,
+    OutputSerialization=None,
+    ExpressionType='SQL',
+    FieldNames=None,
+    StatsCallback=None,
+    ExtraArgs=None,
+):
+    """Run an S3 Select query, yielding the decoded result records.
+
+    The projection and filter of ``Expression`` are evaluated by S3, so
+    only the selected fields of matching records are transferred. Records
+    are decoded as they are consumed: the response is read from the network
+    only as fast as the returned iterator is advanced, so a slow consumer
+    does not cause results to accumulate in memory.
+
+    Usage::
+
+        import boto3
+        s3 = boto3.client('s3')
+        records = s3.select_object_records(
+            'mybucket',
+            'exports/metadata.jsonl',
+            "SELECT s.id, s.title FROM S3Object s WHERE s.lang = 'en'",
+            InputSerialization={'JSON': {'Type': 'LINES'}},
+        )
+        for record in records:
+            print(record['id'], record['title'])
+
+    :type Bucket: str
+    :param Bucket: The name of the bucket containing the object.
+
+    :type Key: str
+    :param Key: The name of the object to query.
+
+    :type Expression: str
+    :param Expression: The query expression.
+
+    :type InputSerialization: dict
+    :param InputSerialization: The format of the object, as for
+        ``select_object_content``.
+
+    :type OutputSerialization: dict
+    :param OutputSerialization: The format of the results, as for
+        ``select_object_content``. Defaults to JSON lines. JSON records
+        are yielded as dicts and CSV records as lists of strings.
+
+    :type ExpressionType: str
+    :param ExpressionType: The type of ``Expression``.
+
+    :type FieldNames: list
+    :param FieldNames: For CSV output, the names of the selected columns.
+        When given, CSV records are yielded as dicts keyed by these names.
+
+    :type StatsCallback: function
+    :param StatsCallback: A method which is called with the ``Stats``
+        details (``BytesScanned``, ``BytesProcessed`` and ``BytesReturned``)
+        of the query.
+
+    :type ExtraArgs: dict
+    :param ExtraArgs: Extra arguments passed to the SelectObjectContent
+        call, e.g. ``ScanRange`` or ``SSECustomerKey``.
+
+    :rtype: iterator
+    :returns: An iterator of the decoded records.
+    """
+    if OutputSerialization is None:
+        OutputSerialization = DEFAULT_OUTPUT_SERIALIZATION
+    splitter, decode_record = create_record_decoder(
+        OutputSerialization, FieldNames
+    )
+    response = self.select_object_content(
+        Bucket=Bucket,
+        Key=Key,
+        Expression=Expression,
+        ExpressionType=ExpressionType,
+        InputSerialization=InputSerialization,
+        OutputSerialization=OutputSerialization,
+        **(ExtraArgs or {}),
+    )
+    event_stream = response['Payload']
+    end_event_received = False
+    try:
+        for event in event_stream:
+            if 'Records' in event:
+                payload = event['Records']['Payload']
+                for record in splitter.feed(payload):
+                    if record:
+                        yield decode_record(record)
+            elif 'Stats' in event:
+                if StatsCallback is not None:
+                    StatsCallback(event['Stats']['Details'])
+            elif 'End' in event:
+                end_event_received = True
+    finally:
+        # Also releases the connection if iteration stops early.
+        event_stream.close()
+    if not end_event_received:
+        raise S3SelectIncompleteError(
+            f'S3 Select query of {Bucket}/{Key} ended without an End event, '
+            'the results are incomplete.'
+        )
+    for record in splitter.flush():
+        yield decode_record(record)
@@ -0,0 +1,151 @@
+# Copyright 2015 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# https://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Record decoding for S3 Select queries.
+
+S3 Select returns query results as ``Records`` events whose payloads are
+arbitrary slices of the serialized output, so a record (or a multi-byte
+character) may be split across events.  ``RecordSplitter`` reassembles the
+payloads into complete records and ``create_record_decoder`` builds the
+function that turns each record into a Python value, based on the
+``OutputSerialization`` of the query.
+"""
+import csv
+import json
+
+DEFAULT_OUTPUT_SERIALIZATION = {'JSON': {'RecordDelimiter': '\n'}}
+
+
+class RecordSplitter:
+    """Splits ``Records`` event payloads into complete records.
+
+    :param delimiter: The record delimiter of the query output.
+    :param quote_char: For CSV output, the quote character. A delimiter
+        within a quoted field does not end the record.
+    :param escape_char: For CSV output, the character that escapes quote
+        characters within quoted fields, if they are not escaped by
+        doubling them.
+    """
+
+    def __init__(self, delimiter=b'\n', quote_char=None, escape_char=None):
+        self._delimiter = delimiter
+        self._quote_char = quote_char
+        if escape_char == quote_char:
+            escape_char = None
+        self._escape_char = escape_char
+        self._pending = b''
+
+    def feed(self, data):
+        """Add a payload, returning the records it completes.
+
+        :rtype: list
+        :returns: The complete records, as bytes without the delimiter.
+        """
+        pieces = (self._pending + data).split(self._delimiter)
+        self._pending = pieces.pop()
+        if self._quote_char is None:
+            return pieces
+        records = []
+        partial = None
+        for piece in pieces:
+            if partial is not None:
+                piece = partial + self._delimiter + piece
+            if self._has_open_quote(piece):
+                partial = piece
+            else:
+                partial = None
+                records.append(piece)
+        if partial is not None:
+            self._pending = partial + self._delimiter + self._pending
+        return records
+
+    def _has_open_quote(self, piece):
+        quote_char = self._quote_char
+        escape_char = self._escape_char
+        if escape_char is None or escape_char not in piece:
+            # Quotes are escaped by doubling them (or not at all), so a
+            # record with an odd number of quotes has a quoted field that
+            # is still open.
+            return piece.count(quote_char) % 2 == 1
+        quoted = False
+        position = 0
+        quote_index = piece.find(quote_char)
+        while quote_index != -1:
+            if quoted:
+                escape_index = piece.find(escape_char, position, quote_index)
+                if escape_index != -1:
+                    # Skip the escaped character, which may be the quote.
+                    position = escape_index + len(escape_char) + 1
+                    if quote_index < position:
+                        quote_index = piece.find(quote_char, position)
+                    continue
+            quoted = not quoted
+            position = quote_index + len(quote_char)
+            quote_index = piece.find(quote_char, position)
+        return quoted
+
+    def flush(self):
+        """Return the final record if the output did not end with a
+        delimiter."""
+        pending, self._pending = self._pending, b''
+        if pending:
+            return [pending]
+        return []
+
+
+def create_record_decoder(output_serialization, field_names=None):
+    """Create the splitter and decoder for a query's output records.
+
+    :type output_serialization: dict
+    :param output_serialization: The ``OutputSerialization`` of the query.
+
+    :type field_names: list
+    :param field_names: For CSV output, the names of the selected columns.
+        When given, CSV records are decoded to dicts instead of lists.
+
+    :rtype: (RecordSplitter, function)
+    :returns: The splitter for the output's records and a function that
+        decodes a record to a dict (JSON) or a list or dict (CSV).
+    """
+    if 'CSV' in output_serialization:
+        return _create_csv_record_decoder(
+            output_serialization['CSV'], field_names
+        )
+    json_serialization = output_serialization.get('JSON', {})
+    delimiter = json_serialization.get('RecordDelimiter', '\n')
+    return RecordSplitter(delimiter.encode('utf-8')), json.loads
+
+
+def _create_csv_record_decoder(csv_serialization, field_names):
+    delimiter = csv_serialization.get('RecordDelimiter', '\n')
+    quote_char = csv_serialization.get('QuoteCharacter', '"')
+    reader_kwargs = {
+        'delimiter': csv_serialization.get('FieldDelimiter', ','),
+        'quotechar': quote_char,
+    }
+    quote_escape_char = csv_serialization.get('QuoteEscapeCharacter', '"')
+    if quote_escape_char != quote_char:
+        reader_kwargs['escapechar'] = quote_escape_char
+        reader_kwargs['doublequote'] = False
+    splitter = RecordSplitter(
+        delimiter.encode('utf-8'),
+        quote_char.encode('utf-8'),
+        quote_escape_char.encode('utf-8'),
+    )
+
+    def decode_record(record):
+        row = next(csv.reader([record.decode('utf-8')], **reader_kwargs))
+        if field_names is not None:
+            return dict(zip(field_names, row))
+        return row
+
+    return splitter, decode_record
@@ -177,6 +177,7 @@ class TransferConfig(S3TransferConfig):
         io_chunksize=256 * KB,
         use_threads=True,
         max_bandwidth=None,
+        adaptive_tuning=False,
     ):
         """Configuration object for managed S3 transfers
 
@@ -217,6 +218,12 @@ class TransferConfig(S3TransferConfig):
         :param max_bandwidth: The maximum bandwidth that will be consumed
             in uploading and downloading file content. The value is an integer
             in terms of bytes per second.
+
+        :param adaptive_tuning: If True, the number of concurrent requests
+            and the part size of multipart transfers are tuned from the
+            observed throughput and latency of the transfer. In this mode
+            ``max_concurrency`` and ``multipart_chunksize`` are only the
+            starting points.
         """
         super().__init__(
             multipart_threshold=multipart_threshold,
@@ -226,6 +233,7 @@ class TransferConfig(S3TransferConfig):
             max_io_queue_size=max_io_queue,
             io_chunksize=io_chunksize,
             max_bandwidth=max_bandwidth,
+            adaptive_tuning=adaptive_tuning,
         )
         # Some of the argument names are not the same as the inherited
         # S3TransferConfig so we add aliases so you can still access the
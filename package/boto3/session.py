@@ -486,6 +486,18 @@ class Session:
                 'boto3.s3.inject.inject_s3_transfer_methods'
             ),
         )
+        self._session.register(
+            'creating-client-class.s3',
+            boto3.utils.lazy_call(
+                'boto3.s3.inject.inject_s3_listing_methods'
+            ),
+        )
+        self._session.register(
+            'creating-client-class.s3',
+            boto3.utils.lazy_call(
+                'boto3.s3.inject.inject_s3_select_methods'
+            ),
+        )
         self._session.register(
             'creating-resource-class.s3.Bucket',
             boto3.utils.lazy_call('boto3.s3.inject.inject_bucket_methods'),
@@ -0,0 +1,794 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Asyncio support for botocore clients.
+
+This module provides an HTTP session built on ``httpcore``'s async
+connection pool and an awaitable facade over an existing client::
+
+    import botocore.session
+    from botocore.aio import AsyncClient
+
+    client = botocore.session.get_session().create_client('s3')
+    async with AsyncClient(client) as s3:
+        response = await s3.get_object(Bucket='bucket', Key='key')
+        body = await response['Body'].read()
+
+Request serialization, endpoint resolution, signing and response parsing
+are shared with the synchronous client; only the network I/O (and the
+sleep between retries) is asynchronous, so many requests can be in flight
+on a single event loop without a thread per request. Event handlers
+registered on the client are still called synchronously.
+"""
+import base64
+import logging
+import socket
+import ssl
+
+from botocore.awsrequest import AWSResponse
+from botocore.compat import urlparse
+from botocore.compress import maybe_compress_request
+from botocore.endpoint import Endpoint, convert_to_response_dict
+from botocore.exceptions import (
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    FlexibleChecksumError,
+    HTTPClientError,
+    IncompleteReadError,
+    MissingDependencyException,
+    ProxyConnectionError,
+    ReadTimeoutError,
+    ResponseStreamingError,
+    SSLError,
+)
+from botocore.history import get_global_history_recorder
+from botocore.hooks import first_non_none_response
+from botocore.httpchecksum import (
+    StreamingChecksumBody,
+    apply_request_checksum,
+    handle_checksum_body,
+    resolve_checksum_context,
+)
+from botocore.httpsession import (
+    DEFAULT_TIMEOUT,
+    MAX_POOL_CONNECTIONS,
+    ProxyConfiguration,
+    create_urllib3_context,
+    get_cert_path,
+    mask_proxy_url,
+)
+
+try:
+    import anyio
+    import httpcore
+except ImportError:
+    httpcore = None
+
+logger = logging.getLogger(__name__)
+history_recorder = get_global_history_recorder()
+
+# Headers that urllib3 handles itself but that h11 would send verbatim.
+# ``Expect: 100-continue`` is never signed so it is safe to drop.
+_STRIPPED_REQUEST_HEADERS = frozenset(['expect'])
+_REQUEST_BODY_CHUNK_SIZE = 64 * 1024
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+class AsyncAWSResponse(AWSResponse):
+    """An :class:`AWSResponse` whose body is read asynchronously.
+
+    ``content`` is only available once :meth:`read` has been awaited.
+    """
+
+    async def read(self):
+        if self._content is None:
+            try:
+                self._content = await self.raw.aread()
+            finally:
+                await self.raw.aclose()
+        return self._content
+
+    @property
+    def content(self):
+        if self._content is None:
+            raise RuntimeError(
+                'The response body has not been read, '
+                'await AsyncAWSResponse.read() first.'
+            )
+        return self._content
+
+
+class AsyncStreamingBody:
+    """Asynchronous counterpart of :class:`botocore.response.StreamingBody`.
+
+    Content length (and, when requested, the response checksum) is
+    validated once the stream has been fully read.
+    """
+
+    _DEFAULT_CHUNK_SIZE = 1024
+
+    def __init__(
+        self, raw_stream, content_length, checksum=None, expected=None
+    ):
+        self._raw_stream = raw_stream
+        self._content_length = content_length
+        self._checksum = checksum
+        self._expected = expected
+        self._amount_read = 0
+        self._chunks = None
+        self._buffer = bytearray()
+        self._eof = False
+
+    async def _next_raw_chunk(self):
+        if self._chunks is None:
+            self._chunks = self._raw_stream.aiter_stream().__aiter__()
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b''
+        except httpcore.ReadTimeout as e:
+            raise ReadTimeoutError(endpoint_url=None, error=e)
+        except (httpcore.ReadError, httpcore.RemoteProtocolError) as e:
+            raise ResponseStreamingError(error=e)
+
+    async def read(self, amt=None):
+        """Read at most amt bytes from the stream.
+
+        If the amt argument is omitted, read all data.
+        """
+        while not self._eof and (amt is None or len(self._buffer) < amt):
+            chunk = await self._next_raw_chunk()
+            if not chunk:
+                self._eof = True
+                # Release the connection back to the pool.
+                await self._raw_stream.aclose()
+                break
+            self._buffer += chunk
+        if amt is None or amt >= len(self._buffer):
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            chunk = bytes(self._buffer[:amt])
+            del self._buffer[:amt]
+        self._amount_read += len(chunk)
+        if self._checksum is not None:
+            self._checksum.update(chunk)
+        if amt is None or (not chunk and amt > 0):
+            self._verify_content_length()
+            if self._checksum is not None:
+                self._validate_checksum()
+        return chunk
+
+    async def iter_chunks(self, chunk_size=_DEFAULT_CHUNK_SIZE):
+        """Return an async iterator to yield chunks of chunk_size bytes."""
+        while True:
+            current_chunk = await self.read(chunk_size)
+            if current_chunk == b"":
+                break
+            yield current_chunk
+
+    async def iter_lines(self, chunk_size=_DEFAULT_CHUNK_SIZE, keepends=False):
+        """Return an async iterator to yield lines from the stream."""
+        pending = b''
+        async for chunk in self.iter_chunks(chunk_size):
+            lines = (pending + chunk).splitlines(True)
+            for line in lines[:-1]:
+                yield line.splitlines(keepends)[0]
+            pending = lines[-1]
+        if pending:
+            yield pending.splitlines(keepends)[0]
+
+    def __aiter__(self):
+        return self.iter_chunks(self._DEFAULT_CHUNK_SIZE)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.close()
+
+    def _verify_content_length(self):
+        if self._content_length is not None and self._amount_read != int(
+            self._content_length
+        ):
+            raise IncompleteReadError(
+                actual_bytes=self._amount_read,
+                expected_bytes=int(self._content_length),
+            )
+
+    def _validate_checksum(self):
+        if self._checksum.digest() != base64.b64decode(self._expected):
+            error_msg = (
+                f"Expected checksum {self._expected} did not match calculated "
+                f"checksum: {self._checksum.b64digest()}"
+            )
+            raise FlexibleChecksumError(error_msg=error_msg)
+
+    def tell(self):
+        return self._amount_read
+
+    async def close(self):
+        """Close the underlying http response stream."""
+        await self._raw_stream.aclose()
+
+
+async def _iter_file_body(body):
+    # Reads from file-like bodies are synchronous; they are typically
+    # in-memory or local files and are chunked so a large body does not
+    # hold the event loop for the whole upload.
+    while True:
+        chunk = body.read(_REQUEST_BODY_CHUNK_SIZE)
+        if not chunk:
+            break
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        yield chunk
+
+
+class AsyncHTTPCoreSession:
+    """An asyncio HTTP session backed by ``httpcore.AsyncConnectionPool``.
+
+    The constructor accepts the same arguments as
+    :class:`botocore.httpsession.URLLib3Session`. :meth:`send` and
+    :meth:`close` are coroutines.
+    """
+
+    def __init__(
+        self,
+        verify=True,
+        proxies=None,
+        timeout=None,
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        socket_options=None,
+        client_cert=None,
+        proxies_config=None,
+    ):
+        if httpcore is None:
+            raise MissingDependencyException(
+                msg='Using AsyncHTTPCoreSession requires httpcore and anyio.'
+            )
+        self._verify = verify
+        self._proxy_config = ProxyConfiguration(
+            proxies=proxies, proxies_settings=proxies_config
+        )
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT
+        if isinstance(timeout, (int, float)):
+            timeout = (timeout, timeout)
+        connect_timeout, read_timeout = timeout
+        self._timeouts = {
+            'connect': connect_timeout,
+            'read': read_timeout,
+            'write': read_timeout,
+            'pool': connect_timeout,
+        }
+        self._max_pool_connections = max_pool_connections
+        self._socket_options = socket_options
+        self._ssl_context = self._get_ssl_context(verify, client_cert)
+        self._pool = self._create_pool()
+        self._proxy_pools = {}
+
+    def _get_ssl_context(self, verify, client_cert):
+        if verify:
+            context = create_urllib3_context()
+            context.load_verify_locations(cafile=get_cert_path(verify))
+        else:
+            context = create_urllib3_context(cert_reqs=ssl.CERT_NONE)
+        if isinstance(client_cert, str):
+            context.load_cert_chain(client_cert)
+        elif isinstance(client_cert, tuple):
+            context.load_cert_chain(*client_cert)
+        return context
+
+    def _create_pool(self, proxy=None):
+        return httpcore.AsyncConnectionPool(
+            ssl_context=self._ssl_context,
+            proxy=proxy,
+            max_connections=self._max_pool_connections,
+            socket_options=self._socket_options,
+        )
+
+    def _get_pool(self, proxy_url):
+        if not proxy_url:
+            return self._pool
+        pool = self._proxy_pools.get(proxy_url)
+        if pool is None:
+            proxy_headers = self._proxy_config.proxy_headers_for(proxy_url)
+            parsed = urlparse(proxy_url)
+            if parsed.password is not None:
+                proxy_url = parsed._replace(
+                    netloc=parsed.netloc.rsplit('@', 1)[-1]
+                ).geturl()
+            proxy = httpcore.Proxy(
+                url=proxy_url, headers=proxy_headers or None
+            )
+            pool = self._create_pool(proxy=proxy)
+            self._proxy_pools[proxy_url] = pool
+        return pool
+
+    def _request_headers(self, request):
+        headers = [
+            (name, value)
+            for name, value in request.headers.items()
+            if name.lower() not in _STRIPPED_REQUEST_HEADERS
+        ]
+        if 'host' not in request.headers:
+            # urllib3 adds this implicitly, h11 requires it to be explicit.
+            # The default port is omitted the same way http.client does.
+            parsed = urlparse(request.url)
+            host = parsed.hostname
+            if ':' in host:
+                host = f'[{host}]'
+            if parsed.port and parsed.port != _DEFAULT_PORTS[parsed.scheme]:
+                host = f'{host}:{parsed.port}'
+            headers.insert(0, ('Host', host))
+        return headers
+
+    def _request_body(self, body):
+        if body is None or isinstance(body, bytes):
+            return body
+        if isinstance(body, (bytearray, memoryview)):
+            return bytes(body)
+        if isinstance(body, str):
+            return body.encode('utf-8')
+        return _iter_file_body(body)
+
+    async def close(self):
+        await self._pool.aclose()
+        for pool in self._proxy_pools.values():
+            await pool.aclose()
+
+    async def send(self, request):
+        proxy_url = self._proxy_config.proxy_url_for(request.url)
+        try:
+            pool = self._get_pool(proxy_url)
+            response = await pool.handle_async_request(
+                httpcore.Request(
+                    method=request.method,
+                    url=request.url,
+                    headers=self._request_headers(request),
+                    content=self._request_body(request.body),
+                    extensions={'timeout': self._timeouts},
+                )
+            )
+            http_response = AsyncAWSResponse(
+                request.url,
+                response.status,
+                [
+                    (name.decode('latin-1'), value.decode('latin-1'))
+                    for name, value in response.headers
+                ],
+                response,
+            )
+            if not request.stream_output:
+                await http_response.read()
+            return http_response
+        except httpcore.ConnectTimeout as e:
+            raise ConnectTimeoutError(endpoint_url=request.url, error=e)
+        except httpcore.ProxyError as e:
+            raise ProxyConnectionError(
+                proxy_url=mask_proxy_url(proxy_url), error=e
+            )
+        except httpcore.ConnectError as e:
+            if isinstance(e.__context__, ssl.SSLError):
+                raise SSLError(endpoint_url=request.url, error=e)
+            raise EndpointConnectionError(endpoint_url=request.url, error=e)
+        except (httpcore.ReadTimeout, httpcore.WriteTimeout) as e:
+            raise ReadTimeoutError(endpoint_url=request.url, error=e)
+        except (
+            httpcore.RemoteProtocolError,
+            httpcore.ReadError,
+            httpcore.WriteError,
+        ) as e:
+            raise ConnectionClosedError(
+                error=e, request=request, endpoint_url=request.url
+            )
+        except Exception as e:
+            message = 'Exception received when sending httpcore HTTP request'
+            logger.debug(message, exc_info=True)
+            raise HTTPClientError(error=e)
+
+
+def convert_to_async_response_dict(http_response, operation_model):
+    """Async counterpart of ``botocore.endpoint.convert_to_response_dict``.
+
+    The body of error and non-streaming responses must already have been
+    read; successful streaming responses are wrapped in an
+    :class:`AsyncStreamingBody`.
+    """
+    response_dict = {
+        'headers': http_response.headers,
+        'status_code': http_response.status_code,
+        'context': {
+            'operation_name': operation_model.name,
+        },
+    }
+    if response_dict['status_code'] >= 300:
+        response_dict['body'] = http_response.content
+    elif operation_model.has_streaming_output:
+        length = response_dict['headers'].get('content-length')
+        response_dict['body'] = AsyncStreamingBody(http_response.raw, length)
+    else:
+        response_dict['body'] = http_response.content
+    return response_dict
+
+
+class AsyncEndpoint(Endpoint):
+    """An :class:`Endpoint` that sends requests on an asyncio event loop.
+
+    Request creation, signing, retry decisions and response parsing reuse
+    the synchronous implementation; ``make_request`` is a coroutine.
+    """
+
+    async def close(self):
+        await self.http_session.close()
+
+    async def make_request(self, operation_model, request_dict):
+        logger.debug(
+            "Making request for %s with params: %s",
+            operation_model,
+            request_dict,
+        )
+        return await self._send_request(request_dict, operation_model)
+
+    async def _send_request(self, request_dict, operation_model):
+        attempts = 1
+        context = request_dict['context']
+        self._update_retries_context(context, attempts)
+        request = self.create_request(request_dict, operation_model)
+        success_response, exception = await self._get_response(
+            request, operation_model, context
+        )
+        while await self._needs_retry(
+            attempts,
+            operation_model,
+            request_dict,
+            success_response,
+            exception,
+        ):
+            attempts += 1
+            self._update_retries_context(context, attempts, success_response)
+            request.reset_stream()
+            request = self.create_request(request_dict, operation_model)
+            success_response, exception = await self._get_response(
+                request, operation_model, context
+            )
+        if (
+            success_response is not None
+            and 'ResponseMetadata' in success_response[1]
+        ):
+            total_retries = attempts - 1
+            success_response[1]['ResponseMetadata'][
+                'RetryAttempts'
+            ] = total_retries
+        if exception is not None:
+            raise exception
+        else:
+            return success_response
+
+    async def _get_response(self, request, operation_model, context):
+        success_response, exception = await self._do_get_response(
+            request, operation_model, context
+        )
+        kwargs_to_emit = {
+            'response_dict': None,
+            'parsed_response': None,
+            'context': context,
+            'exception': exception,
+        }
+        if success_response is not None:
+            http_response, parsed_response = success_response
+            kwargs_to_emit['parsed_response'] = parsed_response
+            kwargs_to_emit['response_dict'] = self._convert_to_response_dict(
+                http_response, operation_model
+            )
+        service_id = operation_model.service_model.service_id.hyphenize()
+        self._event_emitter.emit(
+            f"response-received.{service_id}.{operation_model.name}",
+            **kwargs_to_emit,
+        )
+        return success_response, exception
+
+    def _convert_to_response_dict(self, http_response, operation_model):
+        if isinstance(http_response, AsyncAWSResponse):
+            return convert_to_async_response_dict(
+                http_response, operation_model
+            )
+        # A ``before-send`` handler (such as the Stubber) supplied an
+        # already materialized response.
+        return convert_to_response_dict(http_response, operation_model)
+
+    def _handle_checksum_body(self, http_response, response_dict, context, op):
+        handle_checksum_body(http_response, response_dict, context, op)
+        body = response_dict['body']
+        if isinstance(body, StreamingChecksumBody) and isinstance(
+            http_response, AsyncAWSResponse
+        ):
+            response_dict['body'] = AsyncStreamingBody(
+                http_response.raw,
+                body._content_length,
+                checksum=body._checksum,
+                expected=body._expected,
+            )
+
+    async def _do_get_response(self, request, operation_model, context):
+        try:
+            logger.debug("Sending http request: %s", request)
+            history_recorder.record(
+                'HTTP_REQUEST',
+                {
+                    'method': request.method,
+                    'headers': request.headers,
+                    'streaming': operation_model.has_streaming_input,
+                    'url': request.url,
+                    'body': request.body,
+                },
+            )
+            service_id = operation_model.service_model.service_id.hyphenize()
+            event_name = f"before-send.{service_id}.{operation_model.name}"
+            responses = self._event_emitter.emit(event_name, request=request)
+            http_response = first_non_none_response(responses)
+            if http_response is None:
+                http_response = await self._send(request)
+                if http_response.status_code >= 300:
+                    await http_response.read()
+        except HTTPClientError as e:
+            return (None, e)
+        except Exception as e:
+            logger.debug(
+                "Exception received when sending HTTP request.", exc_info=True
+            )
+            return (None, e)
+        response_dict = self._convert_to_response_dict(
+            http_response, operation_model
+        )
+        self._handle_checksum_body(
+            http_response,
+            response_dict,
+            context,
+            operation_model,
+        )
+
+        http_response_record_dict = response_dict.copy()
+        http_response_record_dict[
+            'streaming'
+        ] = operation_model.has_streaming_output
+        history_recorder.record('HTTP_RESPONSE', http_response_record_dict)
+
+        protocol = operation_model.metadata['protocol']
+        parser = self._response_parser_factory.create_parser(protocol)
+        parsed_response = parser.parse(
+            response_dict, operation_model.output_shape
+        )
+        if http_response.status_code >= 300:
+            self._add_modeled_error_fields(
+                response_dict,
+                parsed_response,
+                operation_model,
+                parser,
+            )
+        history_recorder.record('PARSED_RESPONSE', parsed_response)
+        return (http_response, parsed_response), None
+
+    async def _needs_retry(
+        self,
+        attempts,
+        operation_model,
+        request_dict,
+        response=None,
+        caught_exception=None,
+    ):
+        service_id = operation_model.service_model.service_id.hyphenize()
+        event_name = f"needs-retry.{service_id}.{operation_model.name}"
+        responses = self._event_emitter.emit(
+            event_name,
+            response=response,
+            endpoint=self,
+            operation=operation_model,
+            attempts=attempts,
+            caught_exception=caught_exception,
+            request_dict=request_dict,
+        )
+        handler_response = first_non_none_response(responses)
+        if handler_response is None:
+            return False
+        else:
+            logger.debug(
+                "Response received to retry, sleeping for %s seconds",
+                handler_response,
+            )
+            await anyio.sleep(handler_response)
+            return True
+
+    async def _send(self, request):
+        return await self.http_session.send(request)
+
+
+def _sync_session_attribute(http_session, name, default):
+    # Shared sessions wrap the real URLLib3Session in a handle.
+    http_session = getattr(http_session, 'session', http_session)
+    return getattr(http_session, name, default)
+
+
+class AsyncClient:
+    """An awaitable facade over a botocore (or boto3) client.
+
+    Every operation of the wrapped client is available as a coroutine
+    method with the same name and parameters::
+
+        s3 = AsyncClient(boto3.client('s3'))
+        responses = await asyncio.gather(
+            *(s3.head_object(Bucket=bucket, Key=key) for key in keys)
+        )
+
+    Requests share a single :class:`AsyncHTTPCoreSession`, configured from
+    the wrapped client's config unless ``http_session`` is given. Streaming
+    response bodies are :class:`AsyncStreamingBody` instances. Operations
+    with event stream output are not supported.
+    """
+
+    def __init__(self, client, http_session=None):
+        self._client = client
+        endpoint = client._endpoint
+        if http_session is None:
+            http_session = self._create_http_session(client)
+        self._endpoint = AsyncEndpoint(
+            endpoint.host,
+            endpoint_prefix=endpoint._endpoint_prefix,
+            event_emitter=endpoint._event_emitter,
+            response_parser_factory=endpoint._response_parser_factory,
+            http_session=http_session,
+        )
+        self._methods = {}
+
+    @property
+    def meta(self):
+        return self._client.meta
+
+    @property
+    def exceptions(self):
+        return self._client.exceptions
+
+    def _create_http_session(self, client):
+        config = client.meta.config
+        sync_session = client._endpoint.http_session
+        return AsyncHTTPCoreSession(
+            verify=_sync_session_attribute(sync_session, '_verify', True),
+            proxies=config.proxies,
+            timeout=(config.connect_timeout, config.read_timeout),
+            max_pool_connections=config.max_pool_connections,
+            socket_options=_sync_session_attribute(
+                sync_session,
+                '_socket_options',
+                [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+            ),
+            client_cert=config.client_cert,
+            proxies_config=config.proxies_config,
+        )
+
+    def __getattr__(self, name):
+        try:
+            return self._methods[name]
+        except KeyError:
+            pass
+        operation_name = self._client.meta.method_to_api_mapping.get(name)
+        if operation_name is None:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute "
+                f"'{name}'"
+            )
+
+        async def _api_call(*args, **kwargs):
+            if args:
+                raise TypeError(f"{name}() only accepts keyword arguments.")
+            return await self._make_api_call(operation_name, kwargs)
+
+        _api_call.__name__ = name
+        self._methods[name] = _api_call
+        return _api_call
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the connections of the async HTTP session."""
+        await self._endpoint.close()
+
+    async def _make_api_call(self, operation_name, api_params):
+        client = self._client
+        service_model = client.meta.service_model
+        operation_model = service_model.operation_model(operation_name)
+        if operation_model.has_event_stream_output:
+            raise NotImplementedError(
+                f'{operation_name} has event stream output, which is not '
+                f'supported by AsyncClient.'
+            )
+        history_recorder.record(
+            'API_CALL',
+            {
+                'service': service_model.service_name,
+                'operation': operation_name,
+                'params': api_params,
+            },
+        )
+        request_context = {
+            'client_region': client.meta.region_name,
+            'client_config': client.meta.config,
+            'has_streaming_input': operation_model.has_streaming_input,
+            'auth_type': operation_model.auth_type,
+        }
+        api_params = client._emit_api_params(
+            api_params=api_params,
+            operation_model=operation_model,
+            context=request_context,
+        )
+        endpoint_url, additional_headers = client._resolve_endpoint_ruleset(
+            operation_model, api_params, request_context
+        )
+        request_dict = client._convert_to_request_dict(
+            api_params=api_params,
+            operation_model=operation_model,
+            endpoint_url=endpoint_url,
+            context=request_context,
+            headers=additional_headers,
+        )
+        resolve_checksum_context(request_dict, operation_model, api_params)
+
+        service_id = service_model.service_id.hyphenize()
+        handler, event_response = client.meta.events.emit_until_response(
+            f'before-call.{service_id}.{operation_name}',
+            model=operation_model,
+            params=request_dict,
+            request_signer=client._request_signer,
+            context=request_context,
+        )
+
+        if event_response is not None:
+            http, parsed_response = event_response
+        else:
+            maybe_compress_request(
+                client.meta.config, request_dict, operation_model
+            )
+            apply_request_checksum(request_dict)
+            try:
+                http, parsed_response = await self._endpoint.make_request(
+                    operation_model, request_dict
+                )
+            except Exception as e:
+                client.meta.events.emit(
+                    f'after-call-error.{service_id}.{operation_name}',
+                    exception=e,
+                    context=request_context,
+                )
+                raise
+
+        client.meta.events.emit(
+            f'after-call.{service_id}.{operation_name}',
+            http_response=http,
+            parsed=parsed_response,
+            model=operation_model,
+            context=request_context,
+        )
+
+        if http.status_code >= 300:
+            error_info = parsed_response.get("Error", {})
+            error_code = error_info.get("QueryErrorCode") or error_info.get(
+                "Code"
+            )
+            error_class = client.exceptions.from_code(error_code)
+            raise error_class(parsed_response, operation_name)
+        else:
+            return parsed_response
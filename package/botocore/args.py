@@ -25,6 +25,8 @@ import botocore.parsers
 import botocore.serialize
 from botocore.config import Config
 from botocore.endpoint import EndpointCreator
+from botocore.endpoint_provider import EndpointProvider
+from botocore.httpsession import get_shared_session_registry
 from botocore.regions import EndpointResolverBuiltins as EPRBuiltins
 from botocore.regions import EndpointRulesetResolver
 from botocore.signers import RequestSigner
@@ -71,8 +73,10 @@ class ClientArgsCreator:
         exceptions_factory,
         config_store,
         user_agent_creator=None,
+        client_cache=None,
     ):
         self._event_emitter = event_emitter
+        self._client_cache = client_cache
         self._response_parser_factory = response_parser_factory
         self._loader = loader
         self._exceptions_factory = exceptions_factory
@@ -134,6 +138,10 @@ class ClientArgsCreator:
         new_config = Config(**config_kwargs)
         endpoint_creator = EndpointCreator(event_emitter)
 
+        endpoint_kwargs = {}
+        if new_config.shared_connection_pools:
+            registry = get_shared_session_registry()
+            endpoint_kwargs['http_session_cls'] = registry.acquire
         endpoint = endpoint_creator.create_endpoint(
             service_model,
             region_name=endpoint_region_name,
@@ -146,6 +154,7 @@ class ClientArgsCreator:
             socket_options=socket_options,
             client_cert=new_config.client_cert,
             proxies_config=new_config.proxies_config,
+            **endpoint_kwargs,
         )
 
         serializer = botocore.serialize.create_serializer(
@@ -267,6 +276,7 @@ class ClientArgsCreator:
                     client_config.disable_request_compression
                 ),
                 client_context_params=client_config.client_context_params,
+                shared_connection_pools=client_config.shared_connection_pools,
             )
         self._compute_retry_config(config_kwargs)
         self._compute_connect_timeout(config_kwargs)
@@ -657,6 +667,19 @@ class ClientArgsCreator:
             if client_config is not None
             else None
         )
+        endpoint_provider = None
+        if self._client_cache is not None:
+            endpoint_provider = self._client_cache.get_or_create(
+                (
+                    'endpoint-provider',
+                    service_model.service_name,
+                    service_model.api_version,
+                ),
+                lambda: EndpointProvider(
+                    ruleset_data=endpoints_ruleset_data,
+                    partition_data=partition_data,
+                ),
+            )
         return EndpointRulesetResolver(
             endpoint_ruleset_data=endpoints_ruleset_data,
             partition_data=partition_data,
@@ -666,6 +689,7 @@ class ClientArgsCreator:
             event_emitter=event_emitter,
             use_ssl=is_secure,
             requested_auth_scheme=sig_version,
+            endpoint_provider=endpoint_provider,
         )
 
     def compute_endpoint_resolver_builtin_defaults(
@@ -13,11 +13,13 @@
 # language governing permissions and limitations under the License.
 import base64
 import calendar
+import collections
 import datetime
 import functools
 import hmac
 import json
 import logging
+import threading
 import time
 from collections.abc import Mapping
 from email.utils import formatdate
@@ -73,6 +75,15 @@ def _host_from_url(url):
     # 2) excludes port, if it was the default port
     # 3) excludes userinfo
     url_parts = urlsplit(url)
+    return _host_from_netloc(url_parts.scheme, url_parts.netloc)
+
+
+@functools.lru_cache(maxsize=128)
+def _host_from_netloc(scheme, netloc):
+    # The host header only depends on the scheme and netloc of the URL,
+    # which are the same for every request made to an endpoint.
+    url = f'{scheme}://{netloc}'
+    url_parts = urlsplit(url)
     host = url_parts.hostname  # urlsplit's hostname is always lowercase
     if is_valid_ipv6_endpoint_url(url):
         host = f'[{host}]'
@@ -86,6 +97,76 @@ def _host_from_url(url):
     return host
 
 
+_SIGNING_KEY_CACHE_SIZE = 128
+_signing_keys = collections.OrderedDict()
+_signing_keys_lock = threading.Lock()
+
+
+def _derive_signing_key(secret_key, datestamp, region_name, service_name):
+    # The signing key only depends on the secret key and the credential
+    # scope, so it is derived once per credentials, day, region and service
+    # rather than for every request. The cache is keyed by a digest of the
+    # secret key so the secret keys themselves are not kept around.
+    cache_key = (
+        sha256(secret_key.encode('utf-8')).digest(),
+        datestamp,
+        region_name,
+        service_name,
+    )
+    with _signing_keys_lock:
+        signing_key = _signing_keys.get(cache_key)
+        if signing_key is not None:
+            _signing_keys.move_to_end(cache_key)
+            return signing_key
+    k_date = hmac.new(
+        f"AWS4{secret_key}".encode(), datestamp.encode('utf-8'), sha256
+    ).digest()
+    k_region = hmac.new(k_date, region_name.encode('utf-8'), sha256).digest()
+    k_service = hmac.new(
+        k_region, service_name.encode('utf-8'), sha256
+    ).digest()
+    signing_key = hmac.new(k_service, b'aws4_request', sha256).digest()
+    with _signing_keys_lock:
+        _signing_keys[cache_key] = signing_key
+        if len(_signing_keys) > _SIGNING_KEY_CACHE_SIZE:
+            _signing_keys.popitem(last=False)
+    return signing_key
+
+
+# Signed headers that have the same value for every request made by a
+# client. Only these are cached: other headers change from request to
+# request or carry user data and keys (copy sources, metadata, SSE-C keys).
+_CACHED_HEADERS = frozenset(
+    [
+        'content-type',
+        'host',
+        'x-amz-api-version',
+        'x-amz-target',
+    ]
+)
+
+
+def _canonical_header(name, values):
+    if name in _CACHED_HEADERS:
+        return _cached_canonical_header(name, values)
+    return _format_canonical_header(name, values)
+
+
+def _format_canonical_header(name, values):
+    # From the sigv4 docs:
+    # Lowercase(HeaderName) + ':' + Trimall(HeaderValue)
+    #
+    # The Trimall function removes excess white space before and after
+    # values, and converts sequential spaces to a single space.
+    value = ','.join(' '.join(v.split()) for v in values)
+    return f'{name}:{ensure_unicode(value)}'
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_canonical_header(name, values):
+    return _format_canonical_header(name, values)
+
+
 def _get_body_as_dict(request):
     # For query services, request.data is form-encoded and is already a
     # dict, but for other services such as rest-json it could be a json
@@ -220,6 +301,7 @@ class SigV4Auth(BaseSigner):
         # later for real requests.
         self._region_name = region_name
         self._service_name = service_name
+        self._last_signed_headers = None
 
     def _sign(self, key, msg, hex=False):
         if hex:
@@ -297,20 +379,10 @@ class SigV4Auth(BaseSigner):
         headers = []
         sorted_header_names = sorted(set(headers_to_sign))
         for key in sorted_header_names:
-            value = ','.join(
-                self._header_value(v) for v in headers_to_sign.get_all(key)
-            )
-            headers.append(f'{key}:{ensure_unicode(value)}')
+            values = tuple(headers_to_sign.get_all(key))
+            headers.append(_canonical_header(key, values))
         return '\n'.join(headers)
 
-    def _header_value(self, value):
-        # From the sigv4 docs:
-        # Lowercase(HeaderName) + ':' + Trimall(HeaderValue)
-        #
-        # The Trimall function removes excess white space before and after
-        # values, and converts sequential spaces to a single space.
-        return ' '.join(value.split())
-
     def signed_headers(self, headers_to_sign):
         headers = sorted(n.lower().strip() for n in set(headers_to_sign))
         return ';'.join(headers)
@@ -330,12 +402,23 @@ class SigV4Auth(BaseSigner):
         request_body = request.body
         if request_body and hasattr(request_body, 'seek'):
             position = request_body.tell()
-            read_chunksize = functools.partial(
-                request_body.read, PAYLOAD_BUFFER
-            )
             checksum = sha256()
-            for chunk in iter(read_chunksize, b''):
-                checksum.update(chunk)
+            if hasattr(request_body, 'readinto'):
+                # Reuse a single buffer rather than allocating a new bytes
+                # object for every chunk of the body.
+                buffer = bytearray(PAYLOAD_BUFFER)
+                view = memoryview(buffer)
+                while True:
+                    amount_read = request_body.readinto(buffer)
+                    if not amount_read:
+                        break
+                    checksum.update(view[:amount_read])
+            else:
+                read_chunksize = functools.partial(
+                    request_body.read, PAYLOAD_BUFFER
+                )
+                for chunk in iter(read_chunksize, b''):
+                    checksum.update(chunk)
             hex_checksum = checksum.hexdigest()
             request_body.seek(position)
             return hex_checksum
@@ -362,8 +445,12 @@ class SigV4Auth(BaseSigner):
         cr.append(path)
         cr.append(self.canonical_query_string(request))
         headers_to_sign = self.headers_to_sign(request)
+        signed_headers = self.signed_headers(headers_to_sign)
+        # Remembered for _inject_signature_to_request, which runs right
+        # after this in add_auth and needs the same value.
+        self._last_signed_headers = (request, signed_headers)
         cr.append(self.canonical_headers(headers_to_sign) + '\n')
-        cr.append(self.signed_headers(headers_to_sign))
+        cr.append(signed_headers)
         if 'X-Amz-Content-SHA256' in request.headers:
             body_checksum = request.headers['X-Amz-Content-SHA256']
         else:
@@ -404,13 +491,12 @@ class SigV4Auth(BaseSigner):
         return '\n'.join(sts)
 
     def signature(self, string_to_sign, request):
-        key = self.credentials.secret_key
-        k_date = self._sign(
-            (f"AWS4{key}").encode(), request.context["timestamp"][0:8]
+        k_signing = _derive_signing_key(
+            self.credentials.secret_key,
+            request.context["timestamp"][0:8],
+            self._region_name,
+            self._service_name,
         )
-        k_region = self._sign(k_date, self._region_name)
-        k_service = self._sign(k_region, self._service_name)
-        k_signing = self._sign(k_service, 'aws4_request')
         return self._sign(k_signing, string_to_sign, hex=True)
 
     def add_auth(self, request):
@@ -433,10 +519,15 @@ class SigV4Auth(BaseSigner):
 
     def _inject_signature_to_request(self, request, signature):
         auth_str = ['AWS4-HMAC-SHA256 Credential=%s' % self.scope(request)]
-        headers_to_sign = self.headers_to_sign(request)
-        auth_str.append(
-            f"SignedHeaders={self.signed_headers(headers_to_sign)}"
-        )
+        last_signed_headers = self._last_signed_headers
+        if (
+            last_signed_headers is not None
+            and last_signed_headers[0] is request
+        ):
+            signed_headers = last_signed_headers[1]
+        else:
+            signed_headers = self.signed_headers(self.headers_to_sign(request))
+        auth_str.append(f"SignedHeaders={signed_headers}")
         auth_str.append('Signature=%s' % signature)
         request.headers['Authorization'] = ', '.join(auth_str)
         return request
@@ -10,6 +10,8 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import copy
+import functools
 import logging
 
 from botocore import waiter, xform_name
@@ -18,6 +20,7 @@ from botocore.auth import AUTH_TYPE_MAPS
 from botocore.awsrequest import prepare_request_dict
 from botocore.compress import maybe_compress_request
 from botocore.config import Config
+from botocore.credentials import Credentials
 from botocore.discovery import (
     EndpointDiscoveryHandler,
     EndpointDiscoveryManager,
@@ -28,6 +31,7 @@ from botocore.exceptions import (
     DataNotFoundError,
     InvalidEndpointDiscoveryConfigurationError,
     OperationNotPageableError,
+    PartialCredentialsError,
     UnknownServiceError,
     UnknownSignatureVersionError,
 )
@@ -40,6 +44,7 @@ from botocore.httpchecksum import (
 from botocore.model import ServiceModel
 from botocore.paginate import Paginator
 from botocore.retries import adaptive, standard
+from botocore.signers import RequestSigner
 from botocore.useragent import UserAgentString
 from botocore.utils import (
     CachedProperty,
@@ -79,6 +84,34 @@ logger = logging.getLogger(__name__)
 history_recorder = get_global_history_recorder()
 
 
+class ClientCache:
+    """Caches the parts of client creation that only depend on the service.
+
+    This holds client classes (along with the service model they were
+    created from), endpoint ruleset providers and legacy retry handlers,
+    keyed by what they are created from, e.g. service name and API version.
+    The session owns the cache and clears it whenever the handlers that
+    could change a client class are (un)registered.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def get_or_create(self, key, factory):
+        """Return the value cached for ``key``, creating it if needed.
+
+        :param key: A hashable key, starting with the kind of value.
+        :param factory: Called without arguments to create the value.
+        """
+        value = self._cache.get(key)
+        if value is None:
+            value = self._cache.setdefault(key, factory())
+        return value
+
+    def clear(self):
+        self._cache.clear()
+
+
 class ClientCreator:
     """Creates client objects for a service."""
 
@@ -94,6 +127,8 @@ class ClientCreator:
         exceptions_factory=None,
         config_store=None,
         user_agent_creator=None,
+        client_cache=None,
+        monitor=None,
     ):
         self._loader = loader
         self._endpoint_resolver = endpoint_resolver
@@ -109,6 +144,8 @@ class ClientCreator:
         # future).
         self._config_store = config_store
         self._user_agent_creator = user_agent_creator
+        self._client_cache = client_cache
+        self._monitor = monitor
 
     def create_client(
         self,
@@ -127,7 +164,7 @@ class ClientCreator:
             'choose-service-name', service_name=service_name
         )
         service_name = first_non_none_response(responses, default=service_name)
-        service_model = self._load_service_model(service_name, api_version)
+        service_model, cls = self._get_client_class(service_name, api_version)
         try:
             endpoints_ruleset_data = self._load_service_endpoints_ruleset(
                 service_name, api_version
@@ -142,7 +179,6 @@ class ClientCreator:
                 service_name,
             )
 
-        cls = self._create_client_class(service_name, service_model)
         region_name, client_config = self._normalize_fips_region(
             region_name, client_config
         )
@@ -170,7 +206,77 @@ class ClientCreator:
             endpoints_ruleset_data,
             partition_data,
         )
+        # Clones start from the session's handlers, not the handlers
+        # registered below for this client.
+        clone_event_emitter = copy.copy(client_args['event_emitter'])
         service_client = cls(**client_args)
+        self._register_client_handlers(
+            service_client, endpoint_url, client_config, scoped_config
+        )
+        service_client._clone_factory = functools.partial(
+            self._clone_client,
+            cls,
+            client_args,
+            clone_event_emitter,
+            endpoint_url,
+            client_config,
+            scoped_config,
+            auth_token,
+        )
+        return service_client
+
+    def _clone_client(
+        self,
+        cls,
+        client_args,
+        template_event_emitter,
+        endpoint_url,
+        client_config,
+        scoped_config,
+        auth_token,
+        credentials,
+    ):
+        event_emitter = copy.copy(template_event_emitter)
+        signer = client_args['request_signer']
+        ruleset_resolver = client_args['endpoint_ruleset_resolver']
+        if ruleset_resolver is not None:
+            ruleset_resolver = ruleset_resolver.with_event_emitter(
+                event_emitter
+            )
+        clone_args = dict(
+            client_args,
+            event_emitter=event_emitter,
+            request_signer=RequestSigner(
+                client_args['service_model'].service_id,
+                signer.region_name,
+                signer.signing_name,
+                signer.signature_version,
+                credentials,
+                event_emitter,
+                auth_token,
+            ),
+            endpoint=client_args['endpoint'].with_event_emitter(event_emitter),
+            endpoint_ruleset_resolver=ruleset_resolver,
+        )
+        service_client = cls(**clone_args)
+        self._register_client_handlers(
+            service_client, endpoint_url, client_config, scoped_config
+        )
+        service_client._clone_factory = functools.partial(
+            self._clone_client,
+            cls,
+            client_args,
+            template_event_emitter,
+            endpoint_url,
+            client_config,
+            scoped_config,
+            auth_token,
+        )
+        return service_client
+
+    def _register_client_handlers(
+        self, service_client, endpoint_url, client_config, scoped_config
+    ):
         self._register_retries(service_client)
         self._register_s3_events(
             client=service_client,
@@ -183,11 +289,23 @@ class ClientCreator:
         self._register_endpoint_discovery(
             service_client, endpoint_url, client_config
         )
-        return service_client
+        if self._monitor is not None:
+            self._monitor.register(service_client.meta.events)
 
     def create_client_class(self, service_name, api_version=None):
-        service_model = self._load_service_model(service_name, api_version)
-        return self._create_client_class(service_name, service_model)
+        return self._get_client_class(service_name, api_version)[1]
+
+    def _get_client_class(self, service_name, api_version):
+        def create_client_class():
+            service_model = self._load_service_model(service_name, api_version)
+            cls = self._create_client_class(service_name, service_model)
+            return service_model, cls
+
+        if self._client_cache is None:
+            return create_client_class()
+        return self._client_cache.get_or_create(
+            ('client-class', service_name, api_version), create_client_class
+        )
 
     def _create_client_class(self, service_name, service_model):
         class_attributes = self._create_methods(service_model)
@@ -272,20 +390,32 @@ class ClientCreator:
             return
 
         retries = self._transform_legacy_retries(client.meta.config.retries)
-        retry_config = self._retry_config_translator.build_retry_config(
-            endpoint_prefix,
-            original_config.get('retry', {}),
-            original_config.get('definitions', {}),
-            retries,
-        )
+
+        def create_retry_handler():
+            retry_config = self._retry_config_translator.build_retry_config(
+                endpoint_prefix,
+                original_config.get('retry', {}),
+                original_config.get('definitions', {}),
+                retries,
+            )
+            return self._retry_handler_factory.create_retry_handler(
+                retry_config, endpoint_prefix
+            )
 
         logger.debug(
             "Registering retry handlers for service: %s",
             client.meta.service_model.service_name,
         )
-        handler = self._retry_handler_factory.create_retry_handler(
-            retry_config, endpoint_prefix
-        )
+        # Legacy retry handlers are stateless, so clients with the same
+        # retry configuration can share one.
+        retries_key = tuple(sorted(retries.items())) if retries else None
+        if self._client_cache is None:
+            handler = create_retry_handler()
+        else:
+            handler = self._client_cache.get_or_create(
+                ('legacy-retry-handler', endpoint_prefix, retries_key),
+                create_retry_handler,
+            )
         unique_id = 'retry-config-%s' % service_event_name
         client.meta.events.register(
             f"needs-retry.{service_event_name}", handler, unique_id=unique_id
@@ -486,6 +616,7 @@ class ClientCreator:
             self._exceptions_factory,
             config_store=self._config_store,
             user_agent_creator=self._user_agent_creator,
+            client_cache=self._client_cache,
         )
         return args_creator.get_client_args(
             service_model,
@@ -831,6 +962,8 @@ class BaseClient:
     # xform_name() does the ListObjects->list_objects conversion, but
     # we need the reverse mapping here.
     _PY_TO_OP_NAME = {}
+    # Set by the ClientCreator that created this client.
+    _clone_factory = None
 
     def __init__(
         self,
@@ -891,8 +1024,61 @@ class BaseClient:
 
     def close(self):
         """Closes underlying endpoint connections."""
+        service_id = self._service_model.service_id.hyphenize()
+        self.meta.events.emit(f'before-close.{service_id}', client=self)
         self._endpoint.close()
 
+    def clone_for_credentials(
+        self,
+        aws_access_key_id=None,
+        aws_secret_access_key=None,
+        aws_session_token=None,
+        credentials=None,
+    ):
+        """Create a client like this one that uses different credentials.
+
+        The clone reuses everything this client was created with that does
+        not depend on credentials: the client class, resolved configuration,
+        endpoint resolution and connection pool. This makes it much cheaper
+        than creating a new client, e.g. for a client per tenant.
+
+        The clone is set up with the same handlers as a new client, so
+        handlers registered on this client after it was created are not
+        copied. Closing the clone does not close the shared connection pool.
+
+        :type aws_access_key_id: string
+        :param aws_access_key_id: The access key to use for the clone.
+
+        :type aws_secret_access_key: string
+        :param aws_secret_access_key: The secret key to use for the clone.
+
+        :type aws_session_token: string
+        :param aws_session_token: The session token to use for the clone.
+
+        :type credentials: botocore.credentials.Credentials
+        :param credentials: The credentials to use for the clone, instead of
+            the keys above. This may be refreshable credentials.
+
+        :rtype: botocore.client.BaseClient
+        :return: A botocore client instance
+        """
+        if credentials is None:
+            if aws_access_key_id is None or aws_secret_access_key is None:
+                raise PartialCredentialsError(
+                    provider='explicit',
+                    cred_var=(
+                        'aws_access_key_id'
+                        if aws_access_key_id is None
+                        else 'aws_secret_access_key'
+                    ),
+                )
+            credentials = Credentials(
+                access_key=aws_access_key_id,
+                secret_key=aws_secret_access_key,
+                token=aws_session_token,
+            )
+        return self._clone_factory(credentials)
+
     def _register_handlers(self):
         # Register the handler required to sign requests.
         service_id = self.meta.service_model.service_id.hyphenize()
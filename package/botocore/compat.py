@@ -348,3 +348,32 @@ try:
     HAS_GZIP = True
 except ImportError:
     HAS_GZIP = False
+
+# Detect if orjson is available for use as a faster JSON backend
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def json_dumps_bytes(value, encoding='utf-8'):
+    """Serialize ``value`` to JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # orjson is stricter than the json module (e.g. non str keys
+            # or integers wider than 64 bits), defer to json in that case.
+            pass
+    return json.dumps(value).encode(encoding)
+
+
+def json_loads_bytes(body, encoding='utf-8'):
+    """Deserialize JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(body)
+        except ValueError:
+            pass
+    return json.loads(body.decode(encoding))
@@ -162,6 +162,14 @@ class Config:
 
           * ``adaptive`` - Retries with additional client side throttling.
 
+        * ``rate_limiter_state`` -- Only used by the ``adaptive`` mode.
+          Either a string naming a rate limiter shared by every client in
+          the process configured with the same name, or a rate limiter
+          object such as
+          ``botocore.retries.adaptive.FileRateLimiter(path)``, which
+          shares the client side throttling state between processes.
+          By default each client learns its send rate independently.
+
     :type client_cert: str, (str, str)
     :param client_cert: The path to a certificate for TLS client authentication.
 
@@ -228,6 +236,20 @@ class Config:
         documentation. Invalid parameters or ones that are not used by the
         specified service will be ignored.
 
+        Defaults to None.
+
+    :type shared_connection_pools: bool
+    :param shared_connection_pools: Setting to True makes the client share
+        its HTTP connection pools with every other client in the process
+        that was created with the same connection settings (TLS
+        verification, client certificate, proxies, timeouts and
+        ``max_pool_connections``). Clients for the same endpoint then reuse
+        each other's keep-alive connections instead of performing their own
+        TCP and TLS handshakes. Pool statistics and connection pre-warming
+        are available from
+        ``botocore.httpsession.get_shared_session_registry()`` and from the
+        client's ``_endpoint.http_session``.
+
         Defaults to None.
     """
 
@@ -257,6 +279,7 @@ class Config:
             ('request_min_compression_size_bytes', None),
             ('disable_request_compression', None),
             ('client_context_params', None),
+            ('shared_connection_pools', None),
         ]
     )
 
@@ -328,7 +351,12 @@ class Config:
                 )
 
     def _validate_retry_configuration(self, retries):
-        valid_options = ('max_attempts', 'mode', 'total_max_attempts')
+        valid_options = (
+            'max_attempts',
+            'mode',
+            'total_max_attempts',
+            'rate_limiter_state',
+        )
         valid_modes = ('legacy', 'standard', 'adaptive')
         if retries is not None:
             for key, value in retries.items():
@@ -15,10 +15,17 @@ import configparser
 import copy
 import os
 import shlex
+import stat
 import sys
+import threading
 
 import botocore.exceptions
 
+# Parsed config files keyed by (path, parse_subsections).  Entries are
+# reused for as long as the file's stat signature is unchanged.
+_PARSED_CONFIG_CACHE = {}
+_PARSED_CONFIG_CACHE_LOCK = threading.Lock()
+
 
 def multi_file_load_config(*filenames):
     """Load and combine multiple INI configs with profiles.
@@ -141,31 +148,54 @@ def raw_config_parse(config_filename, parse_subsections=True):
     if path is not None:
         path = os.path.expandvars(path)
         path = os.path.expanduser(path)
-        if not os.path.isfile(path):
-            raise botocore.exceptions.ConfigNotFound(path=_unicode_path(path))
-        cp = configparser.RawConfigParser()
         try:
-            cp.read([path])
-        except (configparser.Error, UnicodeDecodeError) as e:
-            raise botocore.exceptions.ConfigParseError(
-                path=_unicode_path(path), error=e
-            ) from None
-        else:
-            for section in cp.sections():
-                config[section] = {}
-                for option in cp.options(section):
-                    config_value = cp.get(section, option)
-                    if parse_subsections and config_value.startswith('\n'):
-                        # Then we need to parse the inner contents as
-                        # hierarchical.  We support a single level
-                        # of nesting for now.
-                        try:
-                            config_value = _parse_nested(config_value)
-                        except ValueError as e:
-                            raise botocore.exceptions.ConfigParseError(
-                                path=_unicode_path(path), error=e
-                            ) from None
-                    config[section][option] = config_value
+            file_stat = os.stat(path)
+        except (OSError, ValueError):
+            file_stat = None
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            raise botocore.exceptions.ConfigNotFound(path=_unicode_path(path))
+        # Sessions are frequently created many times per process (e.g. once
+        # per Lambda invocation), so reuse the parse of an unchanged file.
+        key = (path, parse_subsections)
+        signature = (
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            file_stat.st_ino,
+        )
+        cached = _PARSED_CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+        config = _parse_config_file(path, parse_subsections)
+        with _PARSED_CONFIG_CACHE_LOCK:
+            _PARSED_CONFIG_CACHE[key] = (signature, copy.deepcopy(config))
+    return config
+
+
+def _parse_config_file(path, parse_subsections):
+    config = {}
+    cp = configparser.RawConfigParser()
+    try:
+        cp.read([path])
+    except (configparser.Error, UnicodeDecodeError) as e:
+        raise botocore.exceptions.ConfigParseError(
+            path=_unicode_path(path), error=e
+        ) from None
+    else:
+        for section in cp.sections():
+            config[section] = {}
+            for option in cp.options(section):
+                config_value = cp.get(section, option)
+                if parse_subsections and config_value.startswith('\n'):
+                    # Then we need to parse the inner contents as
+                    # hierarchical.  We support a single level
+                    # of nesting for now.
+                    try:
+                        config_value = _parse_nested(config_value)
+                    except ValueError as e:
+                        raise botocore.exceptions.ConfigParseError(
+                            path=_unicode_path(path), error=e
+                        ) from None
+                config[section][option] = config_value
     return config
 
 
@@ -161,6 +161,18 @@ BOTOCORE_DEFAUT_SESSION_VARIABLES = {
         False,
         utils.ensure_boolean,
     ),
+    'credential_resolution_cache': (
+        'credential_resolution_cache',
+        'AWS_CREDENTIAL_RESOLUTION_CACHE',
+        None,
+        None,
+    ),
+    'credential_background_refresh': (
+        'credential_background_refresh',
+        'AWS_CREDENTIAL_BACKGROUND_REFRESH',
+        False,
+        utils.ensure_boolean,
+    ),
 }
 # A mapping for the s3 specific configuration vars. These are the configuration
 # vars that typically go in the s3 section of the config file. This mapping
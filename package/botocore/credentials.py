@@ -13,12 +13,14 @@
 # language governing permissions and limitations under the License.
 import datetime
 import getpass
+import heapq
 import json
 import logging
 import os
 import subprocess
 import threading
 import time
+import weakref
 from collections import namedtuple
 from copy import deepcopy
 from hashlib import sha1
@@ -151,7 +153,17 @@ def create_credential_resolver(session, cache=None, region_name=None):
             ' because profile name was explicitly set.'
         )
 
-    resolver = CredentialResolver(providers=providers)
+    resolution_cache = None
+    resolution_cache_path = session.get_config_variable(
+        'credential_resolution_cache'
+    )
+    if resolution_cache_path:
+        resolution_cache = CredentialResolutionCache(resolution_cache_path)
+    resolver = CredentialResolver(
+        providers=providers,
+        resolution_cache=resolution_cache,
+        resolution_key=profile_name,
+    )
     return resolver
 
 
@@ -357,6 +369,8 @@ class RefreshableCredentials(Credentials):
     # The time at which all threads will block waiting for
     # refreshed credentials.
     _mandatory_refresh_timeout = _DEFAULT_MANDATORY_REFRESH_TIMEOUT
+    # Set by enable_background_refresh().
+    _background_refresher = None
 
     def __init__(
         self,
@@ -375,6 +389,7 @@ class RefreshableCredentials(Credentials):
         self._expiry_time = expiry_time
         self._time_fetcher = time_fetcher
         self._refresh_lock = threading.Lock()
+        self._refresh_stats = CredentialRefreshStats()
         self.method = method
         self._frozen_credentials = ReadOnlyCredentials(
             access_key, secret_key, token
@@ -478,6 +493,46 @@ class RefreshableCredentials(Credentials):
         # Checks if the current credentials are expired.
         return self.refresh_needed(refresh_in=0)
 
+    def enable_background_refresh(self, refresher=None):
+        """Refresh these credentials on a background thread.
+
+        Once enabled, the credentials are renewed by ``refresher`` as soon
+        as they enter the advisory refresh window, so request threads
+        only ever refresh (and wait on the refresh lock) if the background
+        refresh has not succeeded by the mandatory refresh window.
+
+        :type refresher: BackgroundCredentialRefresher
+        :param refresher: Defaults to the process wide refresher returned by
+            ``get_background_credential_refresher()``.
+        """
+        if refresher is None:
+            refresher = get_background_credential_refresher()
+        self._background_refresher = refresher
+        refresher.schedule(self)
+
+    def get_refresh_stats(self):
+        """Return refresh latency and lock wait metrics.
+
+        :rtype: dict
+        """
+        return self._refresh_stats.snapshot()
+
+    def _seconds_until_advisory_refresh(self):
+        if self._expiry_time is None:
+            return None
+        return self._seconds_remaining() - self._advisory_refresh_timeout
+
+    def _background_refresh(self):
+        # Called from the refresher thread.  Blocking on the lock here is
+        # fine as no request is waiting on this thread.
+        with self._refresh_lock:
+            if not self.refresh_needed(self._advisory_refresh_timeout):
+                return
+            is_mandatory_refresh = self.refresh_needed(
+                self._mandatory_refresh_timeout
+            )
+            self._protected_refresh(is_mandatory=is_mandatory_refresh)
+
     def _refresh(self):
         # In the common case where we don't need a refresh, we
         # can immediately exit and not require acquiring the
@@ -485,6 +540,17 @@ class RefreshableCredentials(Credentials):
         if not self.refresh_needed(self._advisory_refresh_timeout):
             return
 
+        if (
+            self._background_refresher is not None
+            and self._frozen_credentials is not None
+            and not self.refresh_needed(self._mandatory_refresh_timeout)
+        ):
+            # The background refresher owns advisory refreshes.  Make sure
+            # it knows they are due and carry on with the current
+            # credentials.
+            self._background_refresher.schedule(self)
+            return
+
         # acquire() doesn't accept kwargs, but False is indicating
         # that we should not block if we can't acquire the lock.
         # If we aren't able to acquire the lock, we'll trigger
@@ -503,7 +569,9 @@ class RefreshableCredentials(Credentials):
         elif self.refresh_needed(self._mandatory_refresh_timeout):
             # If we're within the mandatory refresh window,
             # we must block until we get refreshed credentials.
+            start = time.monotonic()
             with self._refresh_lock:
+                self._refresh_stats.record_lock_wait(time.monotonic() - start)
                 if not self.refresh_needed(self._mandatory_refresh_timeout):
                     return
                 self._protected_refresh(is_mandatory=True)
@@ -511,9 +579,13 @@ class RefreshableCredentials(Credentials):
     def _protected_refresh(self, is_mandatory):
         # precondition: this method should only be called if you've acquired
         # the self._refresh_lock.
+        start = time.monotonic()
         try:
             metadata = self._refresh_using()
         except Exception:
+            self._refresh_stats.record_refresh(
+                time.monotonic() - start, failed=True
+            )
             period_name = 'mandatory' if is_mandatory else 'advisory'
             logger.warning(
                 "Refreshing temporary credentials failed "
@@ -530,10 +602,13 @@ class RefreshableCredentials(Credentials):
             # The end result will be that we'll use the current
             # set of temporary credentials we have.
             return
+        self._refresh_stats.record_refresh(time.monotonic() - start)
         self._set_from_data(metadata)
         self._frozen_credentials = ReadOnlyCredentials(
             self._access_key, self._secret_key, self._token
         )
+        if self._background_refresher is not None:
+            self._background_refresher.schedule(self)
         if self._is_expired():
             # We successfully refreshed credentials but for whatever
             # reason, our refreshing function returned credentials
@@ -626,6 +701,7 @@ class DeferredRefreshableCredentials(RefreshableCredentials):
         self._expiry_time = None
         self._time_fetcher = time_fetcher
         self._refresh_lock = threading.Lock()
+        self._refresh_stats = CredentialRefreshStats()
         self.method = method
         self._frozen_credentials = None
 
@@ -635,6 +711,157 @@ class DeferredRefreshableCredentials(RefreshableCredentials):
         return super().refresh_needed(refresh_in)
 
 
+class CredentialRefreshStats:
+    """Thread safe refresh latency and lock wait counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._refreshes = 0
+        self._failures = 0
+        self._last_refresh_latency = None
+        self._total_refresh_latency = 0.0
+        self._lock_waits = 0
+        self._total_lock_wait = 0.0
+        self._max_lock_wait = 0.0
+
+    def record_refresh(self, latency, failed=False):
+        with self._lock:
+            self._refreshes += 1
+            if failed:
+                self._failures += 1
+            self._last_refresh_latency = latency
+            self._total_refresh_latency += latency
+
+    def record_lock_wait(self, seconds):
+        with self._lock:
+            self._lock_waits += 1
+            self._total_lock_wait += seconds
+            self._max_lock_wait = max(self._max_lock_wait, seconds)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'refreshes': self._refreshes,
+                'refresh_failures': self._failures,
+                'last_refresh_latency': self._last_refresh_latency,
+                'total_refresh_latency': self._total_refresh_latency,
+                'lock_waits': self._lock_waits,
+                'total_lock_wait': self._total_lock_wait,
+                'max_lock_wait': self._max_lock_wait,
+            }
+
+
+class BackgroundCredentialRefresher:
+    """Renews refreshable credentials on a daemon thread.
+
+    Credentials are scheduled to be refreshed as soon as they enter their
+    advisory refresh window.  A failed (or premature) refresh is retried
+    after ``retry_interval`` seconds, and the request threads fall back to
+    refreshing themselves once the mandatory window is reached.  Only weak
+    references to the credentials are held.
+    """
+
+    _DEFAULT_RETRY_INTERVAL = 10
+
+    def __init__(self, retry_interval=_DEFAULT_RETRY_INTERVAL):
+        self._retry_interval = retry_interval
+        self._condition = threading.Condition()
+        self._queue = []
+        self._scheduled = weakref.WeakKeyDictionary()
+        self._counter = 0
+        self._thread = None
+        self._stopped = False
+
+    def schedule(self, credentials):
+        """Schedule ``credentials`` for their next advisory refresh.
+
+        This is a no-op if a refresh (or a retry of a failed refresh) is
+        already scheduled.
+        """
+        delay = credentials._seconds_until_advisory_refresh()
+        if delay is None:
+            # Deferred credentials that have not been loaded yet; they are
+            # rescheduled by their first refresh.
+            return
+        self._schedule_in(credentials, max(delay, 0))
+
+    def _schedule_in(self, credentials, delay):
+        due = time.monotonic() + delay
+        with self._condition:
+            if self._stopped or credentials in self._scheduled:
+                return
+            self._scheduled[credentials] = due
+            self._counter += 1
+            heapq.heappush(
+                self._queue, (due, self._counter, weakref.ref(credentials))
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name='botocore-credential-refresher',
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._queue = []
+            self._condition.notify()
+
+    def _next_due(self):
+        with self._condition:
+            while not self._stopped:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                due, _, ref = self._queue[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                heapq.heappop(self._queue)
+                credentials = ref()
+                if credentials is None:
+                    continue
+                del self._scheduled[credentials]
+                return credentials
+            return None
+
+    def _run(self):
+        while True:
+            credentials = self._next_due()
+            if credentials is None:
+                return
+            try:
+                credentials._background_refresh()
+            except Exception:
+                logger.debug(
+                    "Background credential refresh failed.", exc_info=True
+                )
+            if credentials.refresh_needed(
+                credentials._advisory_refresh_timeout
+            ):
+                self._schedule_in(credentials, self._retry_interval)
+            else:
+                self.schedule(credentials)
+            del credentials
+
+
+_BACKGROUND_REFRESHER = None
+_BACKGROUND_REFRESHER_LOCK = threading.Lock()
+
+
+def get_background_credential_refresher():
+    """Return the process wide :class:`BackgroundCredentialRefresher`."""
+    global _BACKGROUND_REFRESHER
+    with _BACKGROUND_REFRESHER_LOCK:
+        if _BACKGROUND_REFRESHER is None:
+            _BACKGROUND_REFRESHER = BackgroundCredentialRefresher()
+        return _BACKGROUND_REFRESHER
+
+
 class CachedCredentialFetcher:
     DEFAULT_EXPIRY_WINDOW_SECONDS = 60 * 15
 
@@ -1949,14 +2176,68 @@ class ContainerProvider(CredentialProvider):
         return self.ENV_VAR in self._environ
 
 
+class CredentialResolutionCache:
+    """Remembers which credential provider resolved credentials.
+
+    The winning provider's method name is persisted (per profile) in a small
+    JSON file so later processes, such as subsequent Lambda cold starts, can
+    try that provider before walking the rest of the chain.
+    """
+
+    def __init__(self, path):
+        self._path = os.path.expanduser(os.path.expandvars(path))
+        self._methods = None
+
+    def _load(self):
+        if self._methods is None:
+            try:
+                with open(self._path) as f:
+                    methods = json.load(f)
+            except (OSError, ValueError):
+                methods = {}
+            self._methods = methods if isinstance(methods, dict) else {}
+        return self._methods
+
+    def get(self, key):
+        return self._load().get(key)
+
+    def set(self, key, method):
+        methods = self._load()
+        if methods.get(key) == method:
+            return
+        methods[key] = method
+        tmp_path = f'{self._path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self._path) or '.', exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(methods, f)
+            os.replace(tmp_path, self._path)
+        except OSError:
+            logger.debug(
+                "Unable to write credential resolution cache: %s",
+                self._path,
+                exc_info=True,
+            )
+
+
 class CredentialResolver:
-    def __init__(self, providers):
+    def __init__(self, providers, resolution_cache=None, resolution_key=None):
         """
 
         :param providers: A list of ``CredentialProvider`` instances.
 
+        :param resolution_cache: An optional ``CredentialResolutionCache``.
+            When provided, the provider that last resolved credentials for
+            ``resolution_key`` is tried first, skipping the rest of the
+            chain if it still returns credentials.  Note this means a
+            provider earlier in the chain that starts returning
+            credentials will not take precedence until the cached provider
+            stops returning credentials.
+
         """
         self.providers = providers
+        self._resolution_cache = resolution_cache
+        self._resolution_key = resolution_key or 'default'
 
     def insert_before(self, name, credential_provider):
         """
@@ -2033,11 +2314,19 @@ class CredentialResolver:
         Goes through the credentials chain, returning the first ``Credentials``
         that could be loaded.
         """
+        if self._resolution_cache is not None:
+            creds = self._load_from_cached_provider()
+            if creds is not None:
+                return creds
         # First provider to return a non-None response wins.
         for provider in self.providers:
             logger.debug("Looking for credentials via: %s", provider.METHOD)
             creds = provider.load()
             if creds is not None:
+                if self._resolution_cache is not None:
+                    self._resolution_cache.set(
+                        self._resolution_key, provider.METHOD
+                    )
                 return creds
 
         # If we got here, no credentials could be found.
@@ -2048,6 +2337,18 @@ class CredentialResolver:
         # -js
         return None
 
+    def _load_from_cached_provider(self):
+        method = self._resolution_cache.get(self._resolution_key)
+        for provider in self.providers:
+            if provider.METHOD == method:
+                logger.debug(
+                    "Looking for credentials via previously resolved "
+                    "provider: %s",
+                    method,
+                )
+                return provider.load()
+        return None
+
 
 class SSOCredentialFetcher(CachedCredentialFetcher):
     _UTC_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
@@ -179,6 +179,17 @@ def document_paginate_method(
         ),
     )
 
+    pagination_config_members['PrefetchPages'] = DocumentedShape(
+        name='PrefetchPages',
+        type_name='integer',
+        documentation=(
+            '<p>The number of pages to request ahead of the page being '
+            'processed. Pages are fetched in a background thread while '
+            'the current page is consumed. Defaults to fetching each page '
+            'only when it is requested.</p>'
+        ),
+    )
+
     botocore_pagination_params = [
         DocumentedShape(
             name='PaginationConfig',
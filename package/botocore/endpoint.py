@@ -85,6 +85,8 @@ class Endpoint:
     :ivar session: The session object.
     """
 
+    _owns_http_session = True
+
     def __init__(
         self,
         host,
@@ -108,7 +110,24 @@ class Endpoint:
         return f'{self._endpoint_prefix}({self.host})'
 
     def close(self):
-        self.http_session.close()
+        if self._owns_http_session:
+            self.http_session.close()
+
+    def with_event_emitter(self, event_emitter):
+        """Return an endpoint sharing this endpoint's HTTP session.
+
+        The returned endpoint emits its events to ``event_emitter``.
+        Closing it leaves the shared HTTP session open.
+        """
+        endpoint = self.__class__(
+            self.host,
+            self._endpoint_prefix,
+            event_emitter,
+            response_parser_factory=self._response_parser_factory,
+            http_session=self.http_session,
+        )
+        endpoint._owns_http_session = False
+        return endpoint
 
     def make_request(self, operation_model, request_dict):
         logger.debug(
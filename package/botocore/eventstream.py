@@ -13,7 +13,7 @@
 """Binary Event Stream Decoding """
 
 from binascii import crc32
-from struct import unpack
+from struct import Struct, unpack
 
 from botocore.exceptions import EventStreamError
 
@@ -21,6 +21,13 @@ from botocore.exceptions import EventStreamError
 _PRELUDE_LENGTH = 12
 _MAX_HEADERS_LENGTH = 128 * 1024  # 128 Kb
 _MAX_PAYLOAD_LENGTH = 16 * 1024**2  # 16 Mb
+# Consumed bytes are discarded from the front of the buffer once there are
+# at least this many of them and they make up half of the buffer.
+_COMPACT_THRESHOLD = 64 * 1024
+
+_PRELUDE_STRUCT = Struct('!III')
+_UINT16_STRUCT = Struct('!H')
+_UINT32_STRUCT = Struct('!I')
 
 
 class ParserError(Exception):
@@ -395,6 +402,20 @@ class EventStreamHeaderParser:
         9: DecodeUtils.unpack_uuid,
     }
 
+    # Maps fixed size header types to the struct used to unpack their value
+    _FIXED_SIZE_HEADER_STRUCTS = {
+        # byte
+        2: Struct('!b'),
+        # short
+        3: Struct('!h'),
+        # integer
+        4: Struct('!i'),
+        # long
+        5: Struct('!q'),
+        # timestamp
+        8: Struct('!q'),
+    }
+
     def __init__(self):
         self._data = None
 
@@ -403,47 +424,59 @@ class EventStreamHeaderParser:
 
         :type data: bytes
         :param data: The bytes that correspond to the headers section of an
-        event stream message.
+        event stream message. Any bytes-like object, such as a memoryview
+        into a larger buffer, is accepted.
 
         :rtype: dict
         :returns: A dictionary of header key, value pairs.
         """
         self._data = data
-        return self._parse_headers()
+        try:
+            return self._parse_headers()
+        finally:
+            self._data = None
 
     def _parse_headers(self):
+        # Headers are unpacked in place by offset rather than by slicing off
+        # each consumed header, which copied the remaining header bytes.
+        data = self._data
+        end = len(data)
+        offset = 0
         headers = {}
-        while self._data:
-            name, value = self._parse_header()
+        while offset < end:
+            name_end = offset + 1 + data[offset]
+            name = str(data[offset + 1 : name_end], 'utf-8')
+            value, offset = self._parse_value(data, name_end)
             if name in headers:
                 raise DuplicateHeader(name)
             headers[name] = value
         return headers
 
-    def _parse_header(self):
-        name = self._parse_name()
-        value = self._parse_value()
-        return name, value
-
-    def _parse_name(self):
-        name, consumed = DecodeUtils.unpack_utf8_string(self._data, 1)
-        self._advance_data(consumed)
-        return name
-
-    def _parse_type(self):
-        type, consumed = DecodeUtils.unpack_uint8(self._data)
-        self._advance_data(consumed)
-        return type
-
-    def _parse_value(self):
-        header_type = self._parse_type()
-        value_unpacker = self._HEADER_TYPE_MAP[header_type]
-        value, consumed = value_unpacker(self._data)
-        self._advance_data(consumed)
-        return value
-
-    def _advance_data(self, consumed):
-        self._data = self._data[consumed:]
+    def _parse_value(self, data, offset):
+        header_type = data[offset]
+        offset += 1
+        value_struct = self._FIXED_SIZE_HEADER_STRUCTS.get(header_type)
+        if value_struct is not None:
+            value = value_struct.unpack_from(data, offset)[0]
+            return value, offset + value_struct.size
+        if header_type == 0:
+            # boolean_true
+            return True, offset
+        if header_type == 1:
+            # boolean_false
+            return False, offset
+        if header_type == 6 or header_type == 7:
+            # byte_array or string
+            length = _UINT16_STRUCT.unpack_from(data, offset)[0]
+            offset += 2
+            value = bytes(data[offset : offset + length])
+            if header_type == 7:
+                value = value.decode('utf-8')
+            return value, offset + length
+        if header_type == 9:
+            # uuid
+            return bytes(data[offset : offset + 16]), offset + 16
+        return self._HEADER_TYPE_MAP[header_type](data[offset:])
 
 
 class EventStreamBuffer:
@@ -454,7 +487,11 @@ class EventStreamBuffer:
     """
 
     def __init__(self):
-        self._data = b''
+        # Bytes before ``_offset`` have already been parsed. They are only
+        # discarded in bulk (see ``_compact``) so neither adding data nor
+        # parsing a message copies the rest of the buffer.
+        self._data = bytearray()
+        self._offset = 0
         self._prelude = None
         self._header_parser = EventStreamHeaderParser()
 
@@ -464,8 +501,22 @@ class EventStreamBuffer:
         :type data: bytes
         :param data: The bytes to add to the buffer to be used when parsing
         """
+        self._compact()
         self._data += data
 
+    def _compact(self):
+        offset = self._offset
+        if not offset:
+            return
+        remaining = len(self._data) - offset
+        if remaining == 0:
+            self._data.clear()
+        elif offset >= _COMPACT_THRESHOLD and offset >= remaining:
+            del self._data[:offset]
+        else:
+            return
+        self._offset = 0
+
     def _validate_prelude(self, prelude):
         if prelude.headers_length > _MAX_HEADERS_LENGTH:
             raise InvalidHeadersLength(prelude.headers_length)
@@ -474,53 +525,40 @@ class EventStreamBuffer:
             raise InvalidPayloadLength(prelude.payload_length)
 
     def _parse_prelude(self):
-        prelude_bytes = self._data[:_PRELUDE_LENGTH]
-        raw_prelude, _ = DecodeUtils.unpack_prelude(prelude_bytes)
+        offset = self._offset
+        raw_prelude = _PRELUDE_STRUCT.unpack_from(self._data, offset)
         prelude = MessagePrelude(*raw_prelude)
         self._validate_prelude(prelude)
         # The minus 4 removes the prelude crc from the bytes to be checked
-        _validate_checksum(prelude_bytes[: _PRELUDE_LENGTH - 4], prelude.crc)
+        prelude_bytes = self._data[offset : offset + _PRELUDE_LENGTH - 4]
+        _validate_checksum(prelude_bytes, prelude.crc)
         return prelude
 
-    def _parse_headers(self):
-        header_bytes = self._data[_PRELUDE_LENGTH : self._prelude.headers_end]
-        return self._header_parser.parse(header_bytes)
-
-    def _parse_payload(self):
-        prelude = self._prelude
-        payload_bytes = self._data[prelude.headers_end : prelude.payload_end]
-        return payload_bytes
-
-    def _parse_message_crc(self):
-        prelude = self._prelude
-        crc_bytes = self._data[prelude.payload_end : prelude.total_length]
-        message_crc, _ = DecodeUtils.unpack_uint32(crc_bytes)
-        return message_crc
-
-    def _parse_message_bytes(self):
-        # The minus 4 includes the prelude crc to the bytes to be checked
-        message_bytes = self._data[
-            _PRELUDE_LENGTH - 4 : self._prelude.payload_end
-        ]
-        return message_bytes
-
-    def _validate_message_crc(self):
-        message_crc = self._parse_message_crc()
-        message_bytes = self._parse_message_bytes()
-        _validate_checksum(message_bytes, message_crc, crc=self._prelude.crc)
-        return message_crc
-
     def _parse_message(self):
-        crc = self._validate_message_crc()
-        headers = self._parse_headers()
-        payload = self._parse_payload()
-        message = EventStreamMessage(self._prelude, headers, payload, crc)
+        prelude = self._prelude
+        start = self._offset
+        headers_end = start + prelude.headers_end
+        payload_end = start + prelude.payload_end
+        crc = _UINT32_STRUCT.unpack_from(self._data, payload_end)[0]
+        # The view must be released before the buffer can be resized.
+        with memoryview(self._data) as view:
+            # The minus 4 includes the prelude crc to the bytes to be checked
+            _validate_checksum(
+                view[start + _PRELUDE_LENGTH - 4 : payload_end],
+                crc,
+                crc=prelude.crc,
+            )
+            headers = self._header_parser.parse(
+                view[start + _PRELUDE_LENGTH : headers_end]
+            )
+            payload = bytes(view[headers_end:payload_end])
+        message = EventStreamMessage(prelude, headers, payload, crc)
         self._prepare_for_next_message()
         return message
 
     def _prepare_for_next_message(self):
-        # Advance the data and reset the current prelude
-        self._data = self._data[self._prelude.total_length :]
+        # Advance past the message and reset the current prelude
+        self._offset += self._prelude.total_length
         self._prelude = None
 
     def next(self):
@@ -529,13 +567,14 @@ class EventStreamBuffer:
         :rtype: EventStreamMessage
         :returns: The next event stream message
         """
-        if len(self._data) < _PRELUDE_LENGTH:
+        available = len(self._data) - self._offset
+        if available < _PRELUDE_LENGTH:
             raise StopIteration()
 
         if self._prelude is None:
             self._prelude = self._parse_prelude()
 
-        if len(self._data) < self._prelude.total_length:
+        if available < self._prelude.total_length:
             raise StopIteration()
 
         return self._parse_message()
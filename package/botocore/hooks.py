@@ -12,6 +12,8 @@
 # language governing permissions and limitations under the License.
 import copy
 import logging
+import types
+import weakref
 from collections import deque, namedtuple
 
 from botocore.compat import accepts_kwargs
@@ -19,6 +21,11 @@ from botocore.utils import EVENT_ALIASES
 
 logger = logging.getLogger(__name__)
 
+# Signature inspection is by far the most expensive part of registering a
+# handler, and every new session registers the same builtin handlers.
+# Whether a function accepts **kwargs never changes, so remember it.
+_ACCEPTS_KWARGS_CACHE = weakref.WeakKeyDictionary()
+
 
 _NodeList = namedtuple('NodeList', ['first', 'middle', 'last'])
 _FIRST = 0
@@ -182,7 +189,7 @@ class BaseEventHooks:
 
         """
         try:
-            if not accepts_kwargs(func):
+            if not self._accepts_kwargs(func):
                 raise ValueError(
                     f"Event handler {func} must accept keyword "
                     f"arguments (**kwargs)"
@@ -190,6 +197,23 @@ class BaseEventHooks:
         except TypeError:
             return False
 
+    def _accepts_kwargs(self, func):
+        # Bound methods are created on every attribute access, so key them
+        # on the underlying function, and objects defining __call__ on their
+        # class's __call__.  Other callables (e.g. partials) are inspected
+        # every time.
+        key = getattr(func, '__func__', func)
+        if not isinstance(key, types.FunctionType):
+            key = getattr(type(func), '__call__', None)
+            if not isinstance(key, types.FunctionType):
+                return accepts_kwargs(func)
+        try:
+            return _ACCEPTS_KWARGS_CACHE[key]
+        except KeyError:
+            result = bool(accepts_kwargs(func))
+            _ACCEPTS_KWARGS_CACHE[key] = result
+            return result
+
 
 class HierarchicalEmitter(BaseEventHooks):
     def __init__(self):
@@ -400,11 +424,18 @@ class HierarchicalEmitter(BaseEventHooks):
 
 
 class EventAliaser(BaseEventHooks):
+    # Aliasing is a pure function of the event name, so aliasers using the
+    # default aliases share one cache instead of recomputing it per session.
+    _DEFAULT_ALIAS_NAME_CACHE = {}
+
     def __init__(self, event_emitter, event_aliases=None):
         self._event_aliases = event_aliases
         if event_aliases is None:
             self._event_aliases = EVENT_ALIASES
-        self._alias_name_cache = {}
+        if self._event_aliases == EVENT_ALIASES:
+            self._alias_name_cache = self._DEFAULT_ALIAS_NAME_CACHE
+        else:
+            self._alias_name_cache = {}
         self._emitter = event_emitter
 
     def emit(self, event_name, **kwargs):
@@ -532,7 +563,31 @@ class _PrefixTrie:
         # to more nodes.  So 'foo.bar' would have a 'foo' node with
         # a 'bar' node as a child of foo.
         # {'foo': {'children': {'bar': {...}}}}.
-        self._root = {'chunk': None, 'children': {}, 'values': None}
+        #
+        # Copies of the trie share nodes until they are modified, so each
+        # node records the trie that owns it (``_owner``). Nodes owned by
+        # another trie are copied before being modified.
+        self._owner = object()
+        self._root = self._new_node(None)
+
+    def _new_node(self, chunk):
+        return {
+            'chunk': chunk,
+            'values': None,
+            'children': {},
+            'owner': self._owner,
+        }
+
+    def _own(self, node):
+        if node['owner'] is self._owner:
+            return node
+        values = node['values']
+        return {
+            'chunk': node['chunk'],
+            'values': None if values is None else copy.copy(values),
+            'children': dict(node['children']),
+            'owner': self._owner,
+        }
 
     def append_item(self, key, value, section=_MIDDLE):
         """Add an item to a key.
@@ -541,14 +596,15 @@ class _PrefixTrie:
         value is appended to the list for the key.
         """
         key_parts = key.split('.')
-        current = self._root
+        current = self._root = self._own(self._root)
         for part in key_parts:
-            if part not in current['children']:
-                new_child = {'chunk': part, 'values': None, 'children': {}}
-                current['children'][part] = new_child
-                current = new_child
+            child = current['children'].get(part)
+            if child is None:
+                child = self._new_node(part)
             else:
-                current = current['children'][part]
+                child = self._own(child)
+            current['children'][part] = child
+            current = child
         if current['values'] is None:
             current['values'] = NodeList([], [], [])
         current['values'][section].append(value)
@@ -608,7 +664,7 @@ class _PrefixTrie:
 
         """
         key_parts = key.split('.')
-        current = self._root
+        current = self._root = self._own(self._root)
         self._remove_item(current, key_parts, value, index=0)
 
     def _remove_item(self, current_node, key_parts, value, index):
@@ -617,6 +673,8 @@ class _PrefixTrie:
         elif index < len(key_parts):
             next_node = current_node['children'].get(key_parts[index])
             if next_node is not None:
+                next_node = self._own(next_node)
+                current_node['children'][key_parts[index]] = next_node
                 self._remove_item(next_node, key_parts, value, index + 1)
                 if index == len(key_parts) - 1:
                     node_list = next_node['values']
@@ -639,22 +697,10 @@ class _PrefixTrie:
         # The fact that we're using a nested dict under the covers
         # is an implementation detail, and the user shouldn't have
         # to know that they'd normally need a deepcopy so we expose
-        # __copy__ instead of __deepcopy__.
+        # __copy__ instead of __deepcopy__.  Rather than copying every node
+        # up front, the copy shares the nodes and both tries copy a node
+        # the first time they modify it.
         new_copy = self.__class__()
-        copied_attrs = self._recursive_copy(self.__dict__)
-        new_copy.__dict__ = copied_attrs
+        new_copy._root = self._root
+        self._owner = object()
         return new_copy
-
-    def _recursive_copy(self, node):
-        # We can't use copy.deepcopy because we actually only want to copy
-        # the structure of the trie, not the handlers themselves.
-        # Each node has a chunk, children, and values.
-        copied_node = {}
-        for key, value in node.items():
-            if isinstance(value, NodeList):
-                copied_node[key] = copy.copy(value)
-            elif isinstance(value, dict):
-                copied_node[key] = self._recursive_copy(value)
-            else:
-                copied_node[key] = value
-        return copied_node
@@ -225,6 +225,15 @@ class StreamingChecksumBody(StreamingBody):
             self._validate_checksum()
         return chunk
 
+    def readinto(self, b):
+        amount = super().readinto(b)
+        view = memoryview(b)
+        if amount:
+            self._checksum.update(view[:amount])
+        elif len(view) > 0:
+            self._validate_checksum()
+        return amount
+
     def _validate_checksum(self):
         if self._checksum.digest() != base64.b64decode(self._expected):
             error_msg = (
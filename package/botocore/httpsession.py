@@ -3,6 +3,7 @@ import os
 import os.path
 import socket
 import sys
+import threading
 import warnings
 from base64 import b64encode
 
@@ -507,3 +508,233 @@ class URLLib3Session:
             message = 'Exception received when sending urllib3 HTTP request'
             logger.debug(message, exc_info=True)
             raise HTTPClientError(error=e)
+
+
+class _PoolStats:
+    """Thread safe counters for connection checkouts from a pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.handshakes = 0
+
+    def record(self, reused, secure):
+        with self._lock:
+            if reused:
+                self.hits += 1
+            else:
+                self.misses += 1
+                if secure:
+                    self.handshakes += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'handshakes': self.handshakes,
+            }
+
+
+class _CountingPoolMixin:
+    # Set on the per-session subclasses created by SharedURLLib3Session.
+    _pool_stats = None
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        # A connection without a socket is either brand new or was reset
+        # because the server dropped it; either way a new TCP (and for
+        # https, TLS) handshake happens before the request is sent.
+        self._pool_stats.record(
+            getattr(conn, 'sock', None) is not None, self.scheme == 'https'
+        )
+        return conn
+
+
+class _SharedSessionEntry:
+    def __init__(self, session):
+        self.session = session
+        self.refcount = 0
+
+
+class SharedURLLib3Session:
+    """A client's handle onto a session from a :class:`SharedSessionRegistry`.
+
+    The handle exposes the same ``send``/``close`` interface as
+    :class:`URLLib3Session` so it can be used as an endpoint's
+    ``http_session``. Closing the handle releases the client's reference;
+    the underlying connection pools are only cleared once every client
+    sharing them has been closed.
+    """
+
+    def __init__(self, registry, key, entry):
+        self._registry = registry
+        self._key = key
+        self._entry = entry
+        self._closed = False
+
+    @property
+    def session(self):
+        return self._entry.session
+
+    def send(self, request):
+        return self._entry.session.send(request)
+
+    def prewarm(self, url, connections=1):
+        """Open connections to ``url`` ahead of the first request.
+
+        This is intended to be called during process initialization (for
+        example in a Lambda function's init phase) so the TCP and TLS
+        handshakes are not paid by the first invocation.
+
+        :type url: str
+        :param url: The endpoint url to connect to, typically
+            ``client.meta.endpoint_url``.
+
+        :type connections: int
+        :param connections: The number of connections to open. This is
+            capped at the session's ``max_pool_connections``.
+
+        :rtype: int
+        :returns: The number of new connections that were opened.
+        """
+        return self._entry.session.prewarm(url, connections)
+
+    def stats(self):
+        """Return the hit/miss/handshake counters of the shared pools."""
+        return self._entry.session.stats()
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._registry.release(self._key, self._entry)
+
+
+class _StatsURLLib3Session(URLLib3Session):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool_stats = _PoolStats()
+        self._pool_classes_by_scheme = {
+            scheme: type(
+                pool_cls.__name__,
+                (_CountingPoolMixin, pool_cls),
+                {'_pool_stats': self._pool_stats},
+            )
+            for scheme, pool_cls in self._pool_classes_by_scheme.items()
+        }
+        self._manager.pool_classes_by_scheme = self._pool_classes_by_scheme
+
+    def stats(self):
+        return self._pool_stats.snapshot()
+
+    def prewarm(self, url, connections=1):
+        proxy_url = self._proxy_config.proxy_url_for(url)
+        manager = self._get_connection_manager(url, proxy_url)
+        pool = manager.connection_from_url(url)
+        self._setup_ssl_cert(pool, url, self._verify)
+        tunnel = pool.proxy is not None and url.lower().startswith('https')
+        checked_out = []
+        opened = 0
+        try:
+            for _ in range(min(connections, self._max_pool_connections)):
+                conn = pool._get_conn()
+                checked_out.append(conn)
+                if conn.is_closed:
+                    if tunnel:
+                        pool._prepare_proxy(conn)
+                    else:
+                        conn.connect()
+                    opened += 1
+        except Exception as e:
+            logger.debug(
+                'Failed to prewarm connection to %s: %s', url, e, exc_info=True
+            )
+        finally:
+            for conn in checked_out:
+                pool._put_conn(conn)
+        return opened
+
+
+def _make_hashable(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _make_hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(v) for v in value)
+    return value
+
+
+class SharedSessionRegistry:
+    """A process wide registry of HTTP sessions shared between clients.
+
+    Clients created with ``Config(shared_connection_pools=True)`` acquire
+    their http session from this registry instead of creating their own.
+    Sessions are keyed by every setting that affects the connections they
+    create (TLS verification, client certificates, proxies, timeouts,
+    socket options and pool size); within a session the pool manager keeps
+    one pool per endpoint, so clients for the same endpoint with the same
+    settings reuse each other's keep-alive connections.
+    """
+
+    def __init__(self, session_cls=_StatsURLLib3Session):
+        self._session_cls = session_cls
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def acquire(self, **session_kwargs):
+        """Return a :class:`SharedURLLib3Session` for ``session_kwargs``.
+
+        The keyword arguments are the same as those accepted by
+        :class:`URLLib3Session`. This signature allows the registry's
+        ``acquire`` method to be used as an ``http_session_cls``.
+        """
+        key = _make_hashable(session_kwargs)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _SharedSessionEntry(
+                    self._session_cls(**session_kwargs)
+                )
+                self._entries[key] = entry
+            entry.refcount += 1
+        return SharedURLLib3Session(self, key, entry)
+
+    def release(self, key, entry):
+        with self._lock:
+            entry.refcount -= 1
+            if entry.refcount > 0 or self._entries.get(key) is not entry:
+                return
+            del self._entries[key]
+        entry.session.close()
+
+    def stats(self):
+        """Return pool statistics for every live shared session.
+
+        :rtype: list
+        :returns: A list of dicts with ``clients``, ``hits``, ``misses``
+            and ``handshakes`` keys, one per shared session.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+        results = []
+        for entry in entries:
+            stats = entry.session.stats()
+            stats['clients'] = entry.refcount
+            results.append(stats)
+        return results
+
+    def clear(self):
+        """Close every shared session, regardless of outstanding clients."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.session.close()
+
+
+_SHARED_SESSION_REGISTRY = SharedSessionRegistry()
+
+
+def get_shared_session_registry():
+    """Return the process wide :class:`SharedSessionRegistry`."""
+    return _SHARED_SESSION_REGISTRY
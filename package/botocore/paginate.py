@@ -14,6 +14,9 @@
 import base64
 import json
 import logging
+import queue
+import re
+import threading
 from itertools import tee
 
 import jmespath
@@ -170,6 +173,51 @@ class TokenDecoder:
         container[path[-1]] = value
 
 
+class DottedKeyExpression:
+    """A JMESPath expression that is a plain ``a.b.c`` key lookup.
+
+    Most pagination configs only use simple (possibly nested) keys for
+    their result keys and tokens.  These are searched with direct dict
+    lookups instead of going through the JMESPath interpreter for every
+    page.  Objects of this class expose the same ``expression`` attribute
+    and ``search`` method as the compiled JMESPath expressions they
+    replace.
+    """
+
+    _DOTTED_KEY_RE = re.compile(
+        r'^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$'
+    )
+
+    def __init__(self, expression):
+        self.expression = expression
+        self._keys = expression.split('.')
+
+    @classmethod
+    def is_dotted_key(cls, expression):
+        return cls._DOTTED_KEY_RE.match(expression) is not None
+
+    def search(self, value):
+        for key in self._keys:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    def __repr__(self):
+        return f"DottedKeyExpression({self.expression!r})"
+
+
+def compile_expression(expression):
+    """Compile a pagination config expression.
+
+    Plain dotted keys are compiled to a ``DottedKeyExpression``, anything
+    else is compiled with JMESPath.
+    """
+    if DottedKeyExpression.is_dotted_key(expression):
+        return DottedKeyExpression(expression)
+    return jmespath.compile(expression)
+
+
 class PaginatorModel:
     def __init__(self, paginator_config):
         self._paginator_config = paginator_config['pagination']
@@ -203,6 +251,7 @@ class PageIterator:
         starting_token,
         page_size,
         op_kwargs,
+        prefetch_pages=None,
     ):
         self._method = method
         self._input_token = input_token
@@ -219,6 +268,8 @@ class PageIterator:
         self._non_aggregate_part = {}
         self._token_encoder = TokenEncoder()
         self._token_decoder = TokenDecoder()
+        self._prefetch_pages = prefetch_pages
+        self._prefetcher = None
 
     @property
     def result_keys(self):
@@ -250,6 +301,14 @@ class PageIterator:
         return self._non_aggregate_part
 
     def __iter__(self):
+        try:
+            yield from self._iter_pages()
+        finally:
+            if self._prefetcher is not None:
+                self._prefetcher.stop()
+                self._prefetcher = None
+
+    def _iter_pages(self):
         current_kwargs = self._op_kwargs
         previous_next_token = None
         next_token = {key: None for key in self._input_token}
@@ -344,7 +403,7 @@ class PageIterator:
             elements of applying a JMESPath expression to each page of
             results.
         """
-        compiled = jmespath.compile(expression)
+        compiled = compile_expression(expression)
         for page in self:
             results = compiled.search(page)
             if isinstance(results, list):
@@ -354,8 +413,28 @@ class PageIterator:
                 yield results
 
     def _make_request(self, current_kwargs):
+        if self._prefetch_pages:
+            if self._prefetcher is None:
+                # The token of the next page is known as soon as a page is
+                # received, so the requests themselves can run ahead of the
+                # caller.  The prefetcher follows the same token chain as
+                # _iter_pages, which only consumes the pages in order.
+                self._prefetcher = PagePrefetcher(
+                    self._fetch_page,
+                    self._get_prefetch_token,
+                    dict(current_kwargs),
+                    self._prefetch_pages,
+                )
+                self._prefetcher.start()
+            return self._prefetcher.next_page()
+        return self._fetch_page(current_kwargs)
+
+    def _fetch_page(self, current_kwargs):
         return self._method(**current_kwargs)
 
+    def _get_prefetch_token(self, response):
+        return self._get_next_token(self._extract_parsed_response(response))
+
     def _extract_parsed_response(self, response):
         return response
 
@@ -523,6 +602,28 @@ class PageIterator:
             complete_result['NextToken'] = self.resume_token
         return complete_result
 
+    def iter_full_result(self):
+        """Stream the parts of the result ``build_full_result`` aggregates.
+
+        Rather than merging every page into a single dict, this yields a
+        ``(result_key, value)`` tuple for each result key found in each
+        page, in page order, where ``result_key`` is the result key
+        expression (e.g. ``'Contents'``) and ``value`` is that page's value
+        for it.  Only one page is held at a time.
+
+        Once the iterator is exhausted, the values that are not aggregated
+        across pages are available from ``non_aggregate_part`` and the
+        token to resume pagination, if any, from ``resume_token``.
+        """
+        for response in self:
+            page = response
+            if isinstance(response, tuple) and len(response) == 2:
+                page = response[1]
+            for result_expression in self.result_keys:
+                result_value = result_expression.search(page)
+                if result_value is not None:
+                    yield result_expression.expression, result_value
+
     def _parse_starting_token(self):
         if self._starting_token is None:
             return None
@@ -588,6 +689,79 @@ class PageIterator:
         return dict(zip(self._input_token, deprecated_token))
 
 
+class PagePrefetcher:
+    """Fetches pages ahead of a ``PageIterator`` in a background thread.
+
+    :param fetch_page: Callable that takes the operation kwargs and returns
+        a page.
+    :param get_next_token: Callable that takes a page and returns a dict of
+        input token name to value for the following page.
+    :param op_kwargs: The kwargs of the first request.
+    :param max_pages: The maximum number of pages fetched but not yet
+        consumed by ``next_page``.
+    """
+
+    _STOP_POLL_INTERVAL = 0.1
+
+    def __init__(self, fetch_page, get_next_token, op_kwargs, max_pages):
+        self._fetch_page = fetch_page
+        self._get_next_token = get_next_token
+        self._op_kwargs = op_kwargs
+        self._pages = queue.Queue(maxsize=max_pages)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """Stop fetching pages.
+
+        A request that is already in flight is allowed to complete, but its
+        page is discarded.
+        """
+        self._stopped.set()
+
+    def next_page(self):
+        """Return the next page, blocking until it has been fetched."""
+        is_error, result = self._pages.get()
+        if is_error:
+            raise result
+        return result
+
+    def _run(self):
+        op_kwargs = self._op_kwargs
+        previous_next_token = None
+        while not self._stopped.is_set():
+            try:
+                page = self._fetch_page(op_kwargs)
+                next_token = self._get_next_token(page)
+            except Exception as e:
+                self._put((True, e))
+                return
+            self._put((False, page))
+            if all(t is None for t in next_token.values()):
+                return
+            if next_token == previous_next_token:
+                # The consumer raises a PaginationError for this page.
+                return
+            op_kwargs = dict(op_kwargs)
+            for name, token in next_token.items():
+                if (token is not None) and (token != 'None'):
+                    op_kwargs[name] = token
+                elif name in op_kwargs:
+                    del op_kwargs[name]
+            previous_next_token = next_token
+
+    def _put(self, item):
+        while not self._stopped.is_set():
+            try:
+                self._pages.put(item, timeout=self._STOP_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+
 class Paginator:
     PAGE_ITERATOR_CLS = PageIterator
 
@@ -611,7 +785,7 @@ class Paginator:
     def _get_non_aggregate_keys(self, config):
         keys = []
         for key in config.get('non_aggregate_keys', []):
-            keys.append(jmespath.compile(key))
+            keys.append(compile_expression(key))
         return keys
 
     def _get_output_tokens(self, config):
@@ -620,7 +794,7 @@ class Paginator:
         if not isinstance(output_token, list):
             output_token = [output_token]
         for config in output_token:
-            output.append(jmespath.compile(config))
+            output.append(compile_expression(config))
         return output
 
     def _get_input_tokens(self, config):
@@ -632,14 +806,14 @@ class Paginator:
     def _get_more_results_token(self, config):
         more_results = config.get('more_results')
         if more_results is not None:
-            return jmespath.compile(more_results)
+            return compile_expression(more_results)
 
     def _get_result_keys(self, config):
         result_key = config.get('result_key')
         if result_key is not None:
             if not isinstance(result_key, list):
                 result_key = [result_key]
-            result_key = [jmespath.compile(rk) for rk in result_key]
+            result_key = [compile_expression(rk) for rk in result_key]
             return result_key
 
     def _get_limit_key(self, config):
@@ -666,6 +840,7 @@ class Paginator:
             page_params['StartingToken'],
             page_params['PageSize'],
             kwargs,
+            prefetch_pages=page_params['PrefetchPages'],
         )
 
     def _extract_paging_params(self, kwargs):
@@ -687,10 +862,18 @@ class Paginator:
                     page_size = str(page_size)
             else:
                 page_size = int(page_size)
+        prefetch_pages = pagination_config.get('PrefetchPages', None)
+        if prefetch_pages is not None:
+            prefetch_pages = int(prefetch_pages)
+            if prefetch_pages < 0:
+                raise PaginationError(
+                    message="PrefetchPages must be a non-negative integer."
+                )
         return {
             'MaxItems': max_items,
             'StartingToken': pagination_config.get('StartingToken', None),
             'PageSize': page_size,
+            'PrefetchPages': prefetch_pages,
         }
 
 
@@ -119,8 +119,10 @@ import http.client
 import json
 import logging
 import re
+import weakref
+from collections import namedtuple
 
-from botocore.compat import ETree, XMLParseError
+from botocore.compat import ETree, XMLParseError, json_loads_bytes
 from botocore.eventstream import EventStream, NoInitialResponseError
 from botocore.utils import (
     is_json_value_header,
@@ -137,6 +139,7 @@ DEFAULT_TIMESTAMP_PARSER = parse_timestamp
 class ResponseParserFactory:
     def __init__(self):
         self._defaults = {}
+        self._protocol_parsers = {}
 
     def set_parser_defaults(self, **kwargs):
         """Set default arguments when a parser instance is created.
@@ -150,8 +153,20 @@ class ResponseParserFactory:
         """
         self._defaults.update(kwargs)
 
+    def set_protocol_parser(self, protocol_name, parser_cls):
+        """Use ``parser_cls`` for responses of the given protocol.
+
+        This allows an alternate implementation, such as the
+        ``StreamingRestXMLParser``, to be swapped in for a protocol without
+        affecting the parsers used for the other protocols.
+
+        """
+        self._protocol_parsers[protocol_name] = parser_cls
+
     def create_parser(self, protocol_name):
-        parser_cls = PROTOCOL_PARSERS[protocol_name]
+        parser_cls = self._protocol_parsers.get(protocol_name)
+        if parser_cls is None:
+            parser_cls = PROTOCOL_PARSERS[protocol_name]
         return parser_cls(**self._defaults)
 
 
@@ -741,14 +756,12 @@ class BaseJSONParser(ResponseParser):
     def _parse_body_as_json(self, body_contents):
         if not body_contents:
             return {}
-        body = body_contents.decode(self.DEFAULT_ENCODING)
         try:
-            original_parsed = json.loads(body)
-            return original_parsed
+            return json_loads_bytes(body_contents, self.DEFAULT_ENCODING)
         except ValueError:
             # if the body cannot be parsed, include
             # the literal string as the message
-            return {'message': body}
+            return {'message': body_contents.decode(self.DEFAULT_ENCODING)}
 
 
 class BaseEventStreamParser(ResponseParser):
@@ -846,11 +859,22 @@ class EventStreamXMLParser(BaseEventStreamParser, BaseXMLResponseParser):
         return self._parse_xml_string_to_dom(xml_string)
 
 
+_TaggedUnionShape = namedtuple(
+    '_TaggedUnionShape', ['name', 'is_tagged_union', 'members']
+)
+
+
 class JSONParser(BaseJSONParser):
     EVENT_STREAM_PARSER_CLS = EventStreamJSONParser
 
     """Response parser for the "json" protocol."""
 
+    # Parsers are created per response, so compiled shapes are shared
+    # across instances.  Output shape -> compiled parser.  The compiled
+    # parsers must not reference the shapes, or the shapes (and their
+    # service models) would never be collected.
+    _COMPILED_PARSERS = weakref.WeakKeyDictionary()
+
     def _do_parse(self, response, shape):
         parsed = {}
         if shape is not None:
@@ -882,7 +906,134 @@ class JSONParser(BaseJSONParser):
         # but we need to traverse the parsed JSON data to convert
         # to richer types (blobs, timestamps, etc.
         parsed_json = self._parse_body_as_json(raw_body)
-        return self._parse_shape(shape, parsed_json)
+        parser = self._get_compiled_parser(shape)
+        if parser is None:
+            return parsed_json
+        return parser(parsed_json, self)
+
+    def _get_compiled_parser(self, shape):
+        # Compiles the shape into a function equivalent to
+        # self._parse_shape(shape, value), but that only visits the parts
+        # of the parsed JSON that need converting or filtering.  ``None``
+        # means the value can be returned as is.  The compiled functions
+        # take the parser as their second argument so they can be shared
+        # by parsers with different timestamp and blob parsers.
+        try:
+            return self._COMPILED_PARSERS[shape]
+        except KeyError:
+            pass
+        compiled = self._compile_shape(shape, {}, {})
+        self._COMPILED_PARSERS[shape] = compiled
+        return compiled
+
+    def _compile_shape(self, shape, compiled, needs_conversion):
+        if not self._shape_needs_conversion(shape, needs_conversion):
+            return None
+        if shape.name in compiled:
+            if compiled[shape.name] is not None:
+                return compiled[shape.name]
+            # Recursive shape, defer the lookup until the shape has been
+            # compiled.
+            shape_name = shape.name
+            return lambda value, parser: compiled[shape_name](value, parser)
+        compiled[shape.name] = None
+        type_name = shape.type_name
+        if type_name == 'structure':
+            converter = self._compile_structure(
+                shape, compiled, needs_conversion
+            )
+        elif type_name == 'list':
+            member = self._compile_shape(
+                shape.member, compiled, needs_conversion
+            )
+
+            def converter(value, parser):
+                return [member(item, parser) for item in value]
+
+        elif type_name == 'map':
+            map_value = self._compile_shape(
+                shape.value, compiled, needs_conversion
+            )
+
+            def converter(value, parser):
+                return {
+                    key: map_value(item, parser) for key, item in value.items()
+                }
+
+        elif type_name == 'timestamp':
+
+            def converter(value, parser):
+                return parser._timestamp_parser(value)
+
+        else:
+
+            def converter(value, parser):
+                return parser._blob_parser(value)
+
+        compiled[shape.name] = converter
+        return converter
+
+    def _compile_structure(self, shape, compiled, needs_conversion):
+        members = []
+        for member_name, member_shape in shape.members.items():
+            json_name = member_shape.serialization.get('name', member_name)
+            member_converter = self._compile_shape(
+                member_shape, compiled, needs_conversion
+            )
+            members.append((member_name, json_name, member_converter))
+        # Only what _has_unknown_tagged_union_member() needs of the shape.
+        tagged_union = None
+        if shape.is_tagged_union:
+            tagged_union = _TaggedUnionShape(
+                shape.name, True, frozenset(shape.members)
+            )
+
+        def converter(value, parser):
+            if value is None:
+                return None
+            if (
+                tagged_union is not None
+                and parser._has_unknown_tagged_union_member(
+                    tagged_union, value
+                )
+            ):
+                tag = parser._get_first_key(value)
+                return parser._handle_unknown_tagged_union_member(tag)
+            final_parsed = {}
+            for member_name, json_name, member_converter in members:
+                raw_value = value.get(json_name)
+                if raw_value is not None:
+                    if member_converter is not None:
+                        raw_value = member_converter(raw_value, parser)
+                    final_parsed[member_name] = raw_value
+            return final_parsed
+
+        return converter
+
+    def _shape_needs_conversion(self, shape, needs_conversion):
+        # Structures filter out unknown and null members, and blobs and
+        # timestamps are converted.  Everything else is returned as is.
+        if shape.name in needs_conversion:
+            return needs_conversion[shape.name]
+        result = False
+        seen = set()
+        remaining = [shape]
+        while remaining and not result:
+            current = remaining.pop()
+            if current.name in seen:
+                continue
+            seen.add(current.name)
+            type_name = current.type_name
+            if type_name in ('blob', 'timestamp'):
+                result = True
+            elif type_name == 'structure':
+                result = not current.is_document_type
+            elif type_name == 'list':
+                remaining.append(current.member)
+            elif type_name == 'map':
+                remaining.append(current.value)
+        needs_conversion[shape.name] = result
+        return result
 
 
 class BaseRestParser(ResponseParser):
@@ -1113,6 +1264,317 @@ class RestXMLParser(BaseRestParser, BaseXMLResponseParser):
         return text
 
 
+class _StreamingXMLShapeTarget:
+    # Parser target for StreamingRestXMLParser.  The XML parser calls
+    # start/data/end as it tokenizes the document, and values are built
+    # directly from those callbacks, so no Element objects are created
+    # except for the subtrees that have to be handed to the DOM based
+    # shape handlers.
+    _STRUCTURE = 0
+    _LIST = 1
+    _SCALAR = 2
+    _SUBTREE = 3
+    _SKIP = 4
+
+    def __init__(self, response_parser, shape, emit_member=None):
+        self._response_parser = response_parser
+        self._shape = shape
+        self._emit_member = emit_member
+        # Each frame is [kind, shape, member_name, flattened, value,
+        # member_lookup/tree_builder, depth].
+        self._stack = []
+        self.emitted = []
+        self.result = None
+        self.started = False
+
+    def start(self, tag, attrib):
+        stack = self._stack
+        if not self.started:
+            self.started = True
+            stack.append(self._new_frame(self._shape, None, False))
+            frame = stack[-1]
+            if frame[0] == self._SUBTREE:
+                frame[5].start(tag, attrib)
+            return
+        parent = stack[-1]
+        kind = parent[0]
+        if kind == self._STRUCTURE:
+            match = parent[5].get(tag.rpartition('}')[2])
+            if match is None:
+                stack.append([self._SKIP, None, None, False, None, None, 0])
+                return
+            member_name, member_shape, flattened = match
+            if flattened:
+                member_shape = member_shape.member
+            frame = self._new_frame(member_shape, member_name, flattened)
+            stack.append(frame)
+        elif kind == self._LIST:
+            frame = self._new_frame(parent[1].member, None, False)
+            stack.append(frame)
+        elif kind == self._SCALAR:
+            # Child elements inside a scalar are ignored, the same way
+            # the text of a DOM node ignores its children.
+            stack.append([self._SKIP, None, None, False, None, None, 0])
+            return
+        else:
+            parent[6] += 1
+            if kind == self._SUBTREE:
+                parent[5].start(tag, attrib)
+            return
+        if frame[0] == self._SUBTREE:
+            frame[5].start(tag, attrib)
+
+    def data(self, data):
+        frame = self._stack[-1] if self._stack else None
+        if frame is None:
+            return
+        kind = frame[0]
+        if kind == self._SCALAR:
+            frame[4].append(data)
+        elif kind == self._SUBTREE:
+            frame[5].data(data)
+
+    def end(self, tag):
+        stack = self._stack
+        frame = stack[-1]
+        kind = frame[0]
+        if frame[6]:
+            # Closing a descendant of a collected or skipped element.
+            frame[6] -= 1
+            if kind == self._SUBTREE:
+                frame[5].end(tag)
+            return
+        stack.pop()
+        if kind == self._SKIP:
+            return
+        value = self._frame_value(frame, tag)
+        if not stack:
+            self.result = value
+            return
+        parent = stack[-1]
+        if self._is_emitted(parent, frame):
+            self.emitted.append(value)
+        elif parent[0] == self._LIST:
+            parent[4].append(value)
+        elif frame[3]:
+            parent[4].setdefault(frame[2], []).append(value)
+        elif frame[0] == self._SUBTREE and frame[2] in parent[4]:
+            # Repeated entries of a flattened map.
+            parent[4][frame[2]].update(value)
+        else:
+            parent[4][frame[2]] = value
+
+    def close(self):
+        return self.result
+
+    def _frame_value(self, frame, tag):
+        kind = frame[0]
+        shape = frame[1]
+        if kind == self._STRUCTURE:
+            parsed = frame[4]
+            value = {}
+            for member_name in shape.members:
+                if member_name in parsed:
+                    value[member_name] = parsed[member_name]
+            return value
+        elif kind == self._LIST:
+            return frame[4]
+        elif kind == self._SCALAR:
+            return self._response_parser._parse_shape(shape, ''.join(frame[4]))
+        frame[5].end(tag)
+        return self._response_parser._parse_shape(shape, frame[5].close())
+
+    def _is_emitted(self, parent, frame):
+        emit_member = self._emit_member
+        if emit_member is None:
+            return False
+        depth = len(self._stack)
+        if depth == 1:
+            # A flattened list entry directly under the root element.
+            return frame[3] and frame[2] == emit_member
+        return (
+            depth == 2 and parent[0] == self._LIST and parent[2] == emit_member
+        )
+
+    def _new_frame(self, shape, member_name, flattened):
+        type_name = shape.type_name
+        response_parser = self._response_parser
+        if type_name == 'structure' and not response_parser._needs_subtree(
+            shape
+        ):
+            lookup = response_parser._member_lookup(shape)
+            return [
+                self._STRUCTURE,
+                shape,
+                member_name,
+                flattened,
+                {},
+                lookup,
+                0,
+            ]
+        elif type_name == 'list' and not shape.serialization.get('flattened'):
+            return [self._LIST, shape, member_name, flattened, [], None, 0]
+        elif type_name in ('structure', 'list', 'map'):
+            builder = ETree.TreeBuilder()
+            return [
+                self._SUBTREE,
+                shape,
+                member_name,
+                flattened,
+                None,
+                builder,
+                0,
+            ]
+        return [self._SCALAR, shape, member_name, flattened, [], None, 0]
+
+
+class StreamingRestXMLParser(RestXMLParser):
+    """Response parser for "rest-xml" that never builds the whole DOM.
+
+    The XML body is fed to the XML parser in fixed size chunks and the
+    parsed dict is built in a single pass from the parser callbacks, driven
+    by the output shape.  No element tree is kept for the document, so peak
+    memory is bounded by the parsed result rather than by the DOM plus the
+    result.  Shapes that need the full subtree (maps, tagged unions,
+    structures with XML attributes) are collected and handed to the regular
+    ``BaseXMLResponseParser`` handlers.
+
+    To use this parser for every rest-xml response of a session::
+
+        factory = session.get_component('response_parser_factory')
+        factory.set_protocol_parser('rest-xml', StreamingRestXMLParser)
+
+    The ``iter_list_member`` method can be used to consume large listings
+    (e.g. the ``Contents`` of ``ListObjectsV2``) one entry at a time.
+    """
+
+    FEED_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, timestamp_parser=None, blob_parser=None):
+        super().__init__(timestamp_parser, blob_parser)
+        self._member_lookups = {}
+
+    def _parse_payload(self, response, shape, member_shapes, final_parsed):
+        if 'payload' in shape.serialization:
+            payload_member_name = shape.serialization['payload']
+            body_shape = member_shapes[payload_member_name]
+            if body_shape.serialization.get(
+                'eventstream'
+            ) or body_shape.type_name in ['string', 'blob']:
+                super()._parse_payload(
+                    response, shape, member_shapes, final_parsed
+                )
+                return
+            final_parsed[payload_member_name] = self._stream_parse(
+                response['body'], body_shape
+            )
+        else:
+            final_parsed.update(self._stream_parse(response['body'], shape))
+
+    def iter_list_member(self, body, shape, member_name):
+        """Yield the parsed entries of a top level list member.
+
+        :param body: The XML body, either as bytes or as a file-like
+            object with a ``read`` method.
+        :param shape: The shape describing the body, e.g. the output shape
+            of ``ListObjectsV2``.
+        :param member_name: The name of the list member to iterate over,
+            e.g. ``Contents``.
+
+        Entries are yielded as soon as their closing tag has been parsed
+        and are not retained by the parser.  The remaining members of the
+        body (continuation tokens, prefixes, etc.) are the return value of
+        the generator, available as ``StopIteration.value``.
+        """
+        if shape.members[member_name].type_name != 'list':
+            raise ResponseParserError(
+                f"Member {member_name} of {shape.name} is not a list."
+            )
+        target = _StreamingXMLShapeTarget(self, shape, member_name)
+        xml_parser = self._create_streaming_parser(target)
+        for chunk in self._iter_body_chunks(body):
+            self._feed(xml_parser, chunk)
+            yield from target.emitted
+            del target.emitted[:]
+        parsed = self._close(xml_parser, target, shape)
+        yield from target.emitted
+        return parsed
+
+    def _stream_parse(self, body, shape):
+        target = _StreamingXMLShapeTarget(self, shape)
+        xml_parser = self._create_streaming_parser(target)
+        for chunk in self._iter_body_chunks(body):
+            self._feed(xml_parser, chunk)
+        return self._close(xml_parser, target, shape)
+
+    def _create_streaming_parser(self, target):
+        return ETree.XMLParser(target=target, encoding=self.DEFAULT_ENCODING)
+
+    def _iter_body_chunks(self, body):
+        if not body:
+            return
+        if hasattr(body, 'read'):
+            while True:
+                chunk = body.read(self.FEED_CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+        else:
+            view = memoryview(body)
+            for start in range(0, len(view), self.FEED_CHUNK_SIZE):
+                yield view[start : start + self.FEED_CHUNK_SIZE]
+
+    def _feed(self, xml_parser, chunk):
+        try:
+            xml_parser.feed(chunk)
+        except XMLParseError as e:
+            raise ResponseParserError(
+                "Unable to parse response (%s), "
+                "invalid XML received. Further retries may succeed." % e
+            )
+
+    def _close(self, xml_parser, target, shape):
+        if not target.started:
+            # Nothing was fed.  Mirrors RestXMLParser, which treats an
+            # empty body as an empty element.
+            return self._parse_shape(shape, ETree.Element(''))
+        try:
+            return xml_parser.close()
+        except XMLParseError as e:
+            raise ResponseParserError(
+                "Unable to parse response (%s), "
+                "invalid XML received. Further retries may succeed." % e
+            )
+
+    def _needs_subtree(self, shape):
+        if shape.is_tagged_union or shape.metadata.get('exception', False):
+            return True
+        for member_shape in shape.members.values():
+            if member_shape.serialization.get('xmlAttribute'):
+                return True
+        return False
+
+    def _member_lookup(self, shape):
+        # Keyed by id(); the shape is kept alive alongside the lookup so
+        # the id cannot be reused while the entry exists.
+        cached = self._member_lookups.get(id(shape))
+        if cached is not None:
+            return cached[1]
+        lookup = {}
+        for member_name, member_shape in shape.members.items():
+            serialization = member_shape.serialization
+            if 'location' in serialization or serialization.get('eventheader'):
+                continue
+            xml_name = self._member_key_name(member_shape, member_name)
+            flattened = bool(
+                member_shape.type_name == 'list'
+                and serialization.get('flattened')
+            )
+            lookup[xml_name] = (member_name, member_shape, flattened)
+        self._member_lookups[id(shape)] = (shape, lookup)
+        return lookup
+
+
 PROTOCOL_PARSERS = {
     'ec2': EC2QueryParser,
     'query': QueryParser,
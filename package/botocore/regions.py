@@ -465,11 +465,14 @@ class EndpointRulesetResolver:
         event_emitter,
         use_ssl=True,
         requested_auth_scheme=None,
+        endpoint_provider=None,
     ):
-        self._provider = EndpointProvider(
-            ruleset_data=endpoint_ruleset_data,
-            partition_data=partition_data,
-        )
+        if endpoint_provider is None:
+            endpoint_provider = EndpointProvider(
+                ruleset_data=endpoint_ruleset_data,
+                partition_data=partition_data,
+            )
+        self._provider = endpoint_provider
         self._param_definitions = self._provider.ruleset.parameters
         self._service_model = service_model
         self._builtins = builtins
@@ -479,6 +482,13 @@ class EndpointRulesetResolver:
         self._requested_auth_scheme = requested_auth_scheme
         self._instance_cache = {}
 
+    def with_event_emitter(self, event_emitter):
+        """Return a copy of this resolver that emits to ``event_emitter``."""
+        resolver = copy.copy(self)
+        resolver._event_emitter = event_emitter
+        resolver._instance_cache = {}
+        return resolver
+
     def construct_endpoint(
         self,
         operation_model,
@@ -13,6 +13,7 @@
 # language governing permissions and limitations under the License.
 
 import logging
+import mmap
 from io import IOBase
 
 from urllib3.exceptions import ProtocolError as URLLib3ProtocolError
@@ -35,6 +36,35 @@ from botocore.hooks import first_non_none_response  # noqa
 logger = logging.getLogger(__name__)
 
 
+def _readinto_raw(raw_stream, buffer):
+    # urllib3's HTTPResponse.readinto() reads into a temporary bytes object
+    # and copies it into ``buffer``.  When there is no content decoding and
+    # nothing buffered by urllib3 we can instead let http.client read
+    # straight from the socket into the caller's buffer, keeping urllib3's
+    # bookkeeping in sync.  Like set_socket_timeout this reaches into the
+    # urllib3 response, so fall back to the public interface if the
+    # internals are not what we expect.
+    fp = getattr(raw_stream, '_fp', None)
+    decoded_buffer = getattr(raw_stream, '_decoded_buffer', None)
+    if (
+        fp is None
+        or not hasattr(fp, 'readinto')
+        or getattr(fp, 'closed', False)
+        or decoded_buffer is None
+        or len(decoded_buffer) != 0
+        or getattr(raw_stream, '_decoder', None) is not None
+        or not hasattr(raw_stream, '_error_catcher')
+    ):
+        return raw_stream.readinto(buffer)
+    with raw_stream._error_catcher():
+        amount = fp.readinto(buffer)
+    if amount:
+        raw_stream._fp_bytes_read += amount
+        if raw_stream.length_remaining is not None:
+            raw_stream.length_remaining -= amount
+    return amount
+
+
 class StreamingBody(IOBase):
     """Wrapper class for an http response body.
 
@@ -110,6 +140,85 @@ class StreamingBody(IOBase):
             self._verify_content_length()
         return chunk
 
+    def readinto(self, b):
+        """Read bytes into a pre-allocated, writable bytes-like object.
+
+        When possible the data is read directly from the socket into ``b``
+        without intermediate copies.
+
+        :returns: The number of bytes read, 0 at the end of the stream.
+        """
+        try:
+            amount = _readinto_raw(self._raw_stream, b)
+        except URLLib3ReadTimeoutError as e:
+            raise ReadTimeoutError(endpoint_url=e.url, error=e)
+        except URLLib3ProtocolError as e:
+            raise ResponseStreamingError(error=e)
+        self._amount_read += amount
+        if not amount and len(memoryview(b)) > 0:
+            self._verify_content_length()
+        return amount
+
+    def iter_chunk_views(self, chunk_size=_DEFAULT_CHUNK_SIZE, buffer=None):
+        """Return an iterator of memoryviews over a single reused buffer.
+
+        Each view is only valid until the next item is requested, so callers
+        must consume (or copy) it before advancing the iterator.  A
+        writable ``buffer`` may be supplied, otherwise one of ``chunk_size``
+        bytes is allocated.
+        """
+        if buffer is None:
+            buffer = bytearray(chunk_size)
+        view = memoryview(buffer).cast('B')
+        while True:
+            amount = self.readinto(view)
+            if not amount:
+                break
+            yield view[:amount]
+
+    def read_into_mmap(self, path, chunk_size=1024 * 1024):
+        """Write the remainder of the stream to ``path``.
+
+        When the content length is known the file is pre-sized and memory
+        mapped, and the stream is read directly into the mapping so memory
+        use stays constant regardless of the object size.  Otherwise the
+        stream is copied through a single reused buffer.
+
+        :type path: str
+        :param path: The file to create (or truncate).
+
+        :type chunk_size: int
+        :param chunk_size: The maximum number of bytes to read per call.
+
+        :rtype: int
+        :returns: The number of bytes written.
+        """
+        remaining = None
+        if self._content_length is not None:
+            remaining = int(self._content_length) - self._amount_read
+        with open(path, 'wb+') as f:
+            if not remaining:
+                return sum(
+                    f.write(view) for view in self.iter_chunk_views(chunk_size)
+                )
+            f.truncate(remaining)
+            with mmap.mmap(f.fileno(), remaining) as mapped:
+                view = memoryview(mapped)
+                try:
+                    offset = 0
+                    while offset < remaining:
+                        end = min(offset + chunk_size, remaining)
+                        amount = self.readinto(view[offset:end])
+                        if not amount:
+                            break
+                        offset += amount
+                finally:
+                    view.release()
+        # Hit the end of the stream so the content length (and checksum,
+        # for subclasses) are verified just as with read().
+        self.readinto(bytearray(1))
+        return offset
+
     def readlines(self):
         return self._raw_stream.readlines()
 
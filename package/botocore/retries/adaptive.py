@@ -1,13 +1,57 @@
 import logging
 import math
+import os
+import struct
 import threading
 
 from botocore.retries import bucket, standard, throttling
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+_SHARED_RATE_LIMITERS = {}
+_SHARED_RATE_LIMITERS_LOCK = threading.Lock()
+
 
 def register_retry_handler(client):
+    retries = client.meta.config.retries or {}
+    limiter = retries.get('rate_limiter_state')
+    if limiter is None:
+        limiter = create_rate_limiter()
+    elif isinstance(limiter, str):
+        limiter = get_shared_rate_limiter(limiter)
+    client.meta.events.register(
+        'before-send',
+        limiter.on_sending_request,
+    )
+    client.meta.events.register(
+        'needs-retry',
+        limiter.on_receiving_response,
+    )
+    return limiter
+
+
+def get_shared_rate_limiter(name):
+    """Return the in-process rate limiter shared under ``name``.
+
+    Every client configured with ``retries={'mode': 'adaptive',
+    'rate_limiter_state': name}`` sends through, and adjusts the rate of,
+    the same limiter, so they converge on a single CUBIC rate instead of
+    each learning the throttling rate independently.
+    """
+    with _SHARED_RATE_LIMITERS_LOCK:
+        limiter = _SHARED_RATE_LIMITERS.get(name)
+        if limiter is None:
+            limiter = create_rate_limiter()
+            _SHARED_RATE_LIMITERS[name] = limiter
+        return limiter
+
+
+def create_rate_limiter():
     clock = bucket.Clock()
     rate_adjustor = throttling.CubicCalculator(
         starting_max_rate=0, start_time=clock.current_time()
@@ -24,14 +68,6 @@ def register_retry_handler(client):
         throttling_detector=throttling_detector,
         clock=clock,
     )
-    client.meta.events.register(
-        'before-send',
-        limiter.on_sending_request,
-    )
-    client.meta.events.register(
-        'needs-retry',
-        limiter.on_receiving_response,
-    )
     return limiter
 
 
@@ -53,10 +89,22 @@ class ClientRateLimiter:
         self._clock = clock
         self._enabled = False
         self._lock = threading.Lock()
+        self._throttled_seconds = 0.0
+        self._throttle_events = 0
+
+    def __deepcopy__(self, memo):
+        # A limiter may be passed in client config to share state; copies
+        # of that config must keep sharing the same limiter.
+        return self
 
     def on_sending_request(self, request, **kwargs):
         if self._enabled:
+            start = self._clock.current_time()
             self._token_bucket.acquire()
+            waited = self._clock.current_time() - start
+            if waited > 0:
+                with self._lock:
+                    self._throttled_seconds += waited
 
     # Hooked up to needs-retry.
     def on_receiving_response(self, **kwargs):
@@ -84,10 +132,215 @@ class ClientRateLimiter:
                     self._token_bucket.available_capacity,
                 )
                 self._enabled = True
+                self._throttle_events += 1
             self._token_bucket.max_rate = min(
                 new_rate, self._MAX_RATE_ADJUST_SCALE * measured_rate
             )
 
+    def stats(self):
+        """Return a snapshot of the limiter's state.
+
+        ``throttled_seconds`` is the total time requests spent waiting for
+        send capacity and ``throttle_events`` the number of throttling
+        errors received.
+        """
+        with self._lock:
+            return {
+                'enabled': self._enabled,
+                'fill_rate': self._token_bucket.max_rate,
+                'measured_rate': self._rate_clocker.measured_rate,
+                'available_capacity': self._token_bucket.available_capacity,
+                'throttled_seconds': self._throttled_seconds,
+                'throttle_events': self._throttle_events,
+            }
+
+
+class FileRateLimiter:
+    """A rate limiter whose state is shared between processes via a file.
+
+    The token bucket, CUBIC and measured rate state are stored in a small
+    binary file and updated under an exclusive ``fcntl`` lock, so every
+    process (and every client within them) using the same ``path`` sends
+    against one shared rate. This implements the same interface as
+    :class:`ClientRateLimiter` and can be passed as the
+    ``rate_limiter_state`` retries option. It is only available on
+    platforms that provide ``fcntl``.
+    """
+
+    _MAX_RATE_ADJUST_SCALE = ClientRateLimiter._MAX_RATE_ADJUST_SCALE
+    # fill_rate, max_capacity, current_capacity, last_timestamp, w_max,
+    # last_fail, measured_rate, last_bucket, count, throttled_seconds,
+    # throttle_events, enabled.
+    _STATE = struct.Struct('<10dQ?')
+
+    def __init__(self, path, clock=None, throttling_detector=None):
+        if fcntl is None:
+            raise RuntimeError(
+                'FileRateLimiter requires fcntl, which is not available '
+                'on this platform.'
+            )
+        if clock is None:
+            clock = bucket.Clock()
+        if throttling_detector is None:
+            throttling_detector = standard.ThrottlingErrorDetector(
+                retry_event_adapter=standard.RetryEventAdapter(),
+            )
+        self._path = path
+        self._clock = clock
+        self._throttling_detector = throttling_detector
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _initial_state(self):
+        now = self._clock.current_time()
+        return {
+            'fill_rate': 1.0,
+            'max_capacity': 1.0,
+            'current_capacity': 0.0,
+            'last_timestamp': math.nan,
+            'w_max': 0.0,
+            'last_fail': now,
+            'measured_rate': 0.0,
+            'last_bucket': float(math.floor(now)),
+            'count': 0.0,
+            'throttled_seconds': 0.0,
+            'throttle_events': 0,
+            'enabled': False,
+        }
+
+    def _read_state(self):
+        data = os.pread(self._fd, self._STATE.size, 0)
+        if len(data) < self._STATE.size:
+            return self._initial_state()
+        return dict(zip(self._initial_state(), self._STATE.unpack(data)))
+
+    def _write_state(self, state):
+        os.pwrite(self._fd, self._STATE.pack(*state.values()), 0)
+
+    def _locked(self, update):
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                state = self._read_state()
+                result = update(state)
+                self._write_state(state)
+                return result
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _refill(self, state, timestamp):
+        if math.isnan(state['last_timestamp']):
+            state['last_timestamp'] = timestamp
+            return
+        fill_amount = (timestamp - state['last_timestamp']) * state[
+            'fill_rate'
+        ]
+        state['current_capacity'] = min(
+            state['max_capacity'], state['current_capacity'] + fill_amount
+        )
+        state['last_timestamp'] = timestamp
+
+    def _try_acquire(self, state):
+        if not state['enabled']:
+            return 0
+        self._refill(state, self._clock.current_time())
+        if state['current_capacity'] >= 1:
+            state['current_capacity'] -= 1
+            return 0
+        return (1 - state['current_capacity']) / state['fill_rate']
+
+    def on_sending_request(self, request, **kwargs):
+        waited = 0
+        while True:
+            sleep_amount = self._locked(self._try_acquire)
+            if sleep_amount <= 0:
+                break
+            self._clock.sleep(sleep_amount)
+            waited += sleep_amount
+        if waited:
+
+            def add_throttled_time(state):
+                state['throttled_seconds'] += waited
+
+            self._locked(add_throttled_time)
+
+    def on_receiving_response(self, **kwargs):
+        is_throttle = self._throttling_detector.is_throttling_error(**kwargs)
+        timestamp = self._clock.current_time()
+
+        def update(state):
+            rate_clocker = RateClocker(self._clock)
+            rate_clocker._measured_rate = state['measured_rate']
+            rate_clocker._last_bucket = state['last_bucket']
+            rate_clocker._count = state['count']
+            measured_rate = rate_clocker.record()
+            state['measured_rate'] = rate_clocker._measured_rate
+            state['last_bucket'] = rate_clocker._last_bucket
+            state['count'] = rate_clocker._count
+
+            rate_adjustor = throttling.CubicCalculator(
+                starting_max_rate=state['w_max'],
+                start_time=state['last_fail'],
+            )
+            if not is_throttle:
+                new_rate = rate_adjustor.success_received(timestamp)
+            else:
+                if not state['enabled']:
+                    rate_to_use = measured_rate
+                else:
+                    rate_to_use = min(measured_rate, state['fill_rate'])
+                new_rate = rate_adjustor.error_received(rate_to_use, timestamp)
+                params = rate_adjustor.get_params_snapshot()
+                state['w_max'] = params.w_max
+                state['last_fail'] = params.last_fail
+                state['enabled'] = True
+                state['throttle_events'] += 1
+            self._set_max_rate(
+                state,
+                min(new_rate, self._MAX_RATE_ADJUST_SCALE * measured_rate),
+                timestamp,
+            )
+
+        self._locked(update)
+
+    def _set_max_rate(self, state, value, timestamp):
+        # Mirrors the TokenBucket.max_rate setter.
+        self._refill(state, timestamp)
+        state['fill_rate'] = max(value, bucket.TokenBucket._MIN_RATE)
+        state['max_capacity'] = value if value >= 1 else 1
+        state['current_capacity'] = min(
+            state['current_capacity'], state['max_capacity']
+        )
+
+    def stats(self):
+        """Return a snapshot of the shared limiter state.
+
+        See :meth:`ClientRateLimiter.stats`; the values are aggregated
+        across every process using the same file.
+        """
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_SH)
+            try:
+                state = self._read_state()
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return {
+            'enabled': state['enabled'],
+            'fill_rate': state['fill_rate'],
+            'measured_rate': state['measured_rate'],
+            'available_capacity': state['current_capacity'],
+            'throttled_seconds': state['throttled_seconds'],
+            'throttle_events': state['throttle_events'],
+        }
+
 
 class RateClocker:
     """Tracks the rate at which a client is sending a request."""
@@ -0,0 +1,328 @@
+"""Hedged requests for latency sensitive, idempotent operations.
+
+Retries only help once a request has failed.  A request that is merely
+slow is waited on for as long as the read timeout allows, which means a
+small fraction of slow responses dominates tail latency.  Hedging sends a
+duplicate of an idempotent request once the original has been outstanding
+for longer than a (high) percentile of the operation's observed latency,
+and uses whichever response arrives first.
+
+The key classes in this module are:
+
+    * ``LatencyHistogram`` - A log scaled histogram of request latencies
+    used to estimate the hedging delay of an operation.
+    * ``HedgingPolicy`` - Which requests may be hedged and how long to wait
+    before doing so.
+    * ``HedgingHandler`` - The ``before-send`` handler that sends requests
+    and their hedges.  Hedges are paid for from a ``RetryQuota`` budget, so
+    hedging can never more than marginally increase the request volume.
+
+Hedging is enabled per client::
+
+    from botocore.retries import hedging
+
+    handler = hedging.register_hedging_handler(
+        client, hedging.HedgingPolicy(percentile=95)
+    )
+
+"""
+import logging
+import math
+import threading
+import time
+import weakref
+from concurrent import futures
+
+from botocore.retries import quota
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEDGE_PERCENTILE = 95
+
+
+def register_hedging_handler(client, policy=None, retry_quota=None):
+    """Hedge eligible requests made by ``client``.
+
+    :type policy: HedgingPolicy
+    :param policy: The hedging policy. Defaults to hedging ``GET`` and
+        ``HEAD`` requests at the 95th latency percentile.
+
+    :type retry_quota: botocore.retries.quota.RetryQuota
+    :param retry_quota: The budget hedges are paid from. This may be shared
+        between clients. Defaults to a new quota for this client.
+
+    The threads of the handler are shut down when the client is closed or
+    garbage collected.
+
+    :rtype: HedgingHandler
+    """
+    if policy is None:
+        policy = HedgingPolicy()
+    if retry_quota is None:
+        retry_quota = quota.RetryQuota()
+    handler = HedgingHandler(
+        http_session=client._endpoint.http_session,
+        policy=policy,
+        retry_quota=retry_quota,
+        max_workers=client.meta.config.max_pool_connections,
+    )
+    service_event_name = client.meta.service_model.service_id.hyphenize()
+    client.meta.events.register(
+        f'before-send.{service_event_name}', handler.on_before_send
+    )
+    client.meta.events.register(
+        f'before-close.{service_event_name}', handler.on_before_close
+    )
+    weakref.finalize(client, handler.close)
+    return handler
+
+
+class LatencyHistogram:
+    """A thread safe, log scaled histogram of latencies in seconds.
+
+    Buckets grow geometrically by ``growth`` starting at ``min_value``, so
+    percentiles are accurate to within the bucket growth factor over the
+    whole range of latencies while using constant memory.
+    """
+
+    _DEFAULT_MIN_VALUE = 0.0001
+    _DEFAULT_GROWTH = 1.1
+
+    def __init__(self, min_value=_DEFAULT_MIN_VALUE, growth=_DEFAULT_GROWTH):
+        self._min_value = min_value
+        self._growth = growth
+        self._log_growth = math.log(growth)
+        self._counts = {}
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def _bucket(self, value):
+        if value <= self._min_value:
+            return 0
+        return int(math.log(value / self._min_value) / self._log_growth) + 1
+
+    def _bucket_upper_bound(self, bucket):
+        return self._min_value * self._growth**bucket
+
+    def record(self, value):
+        bucket = self._bucket(value)
+        with self._lock:
+            self._counts[bucket] = self._counts.get(bucket, 0) + 1
+            self._total += 1
+
+    @property
+    def count(self):
+        return self._total
+
+    def percentile(self, percentile):
+        """Return the upper bound of the bucket holding ``percentile``.
+
+        :returns: The latency in seconds, or None if nothing was recorded.
+        """
+        with self._lock:
+            if not self._total:
+                return None
+            target = self._total * percentile / 100.0
+            seen = 0
+            for bucket in sorted(self._counts):
+                seen += self._counts[bucket]
+                if seen >= target:
+                    return self._bucket_upper_bound(bucket)
+            return self._bucket_upper_bound(max(self._counts))
+
+
+class HedgingPolicy:
+    """Decides which requests are hedged and after what delay.
+
+    :param percentile: The latency percentile of an operation after which
+        an outstanding request is hedged.
+    :param operations: The operation names that may be hedged. These must
+        be idempotent. By default ``GET`` and ``HEAD`` requests are hedged,
+        which covers the read operations of the REST protocols; operations
+        of JSON and query protocol services (such as DynamoDB ``GetItem``)
+        must be listed explicitly.
+    :param min_samples: The number of latencies that must be recorded for
+        an operation before it is hedged.
+    :param min_delay: The lower bound of the hedging delay in seconds.
+    :param initial_delay: If given, the delay used until ``min_samples``
+        latencies have been recorded. Otherwise operations are not hedged
+        until then.
+    """
+
+    _HEDGEABLE_METHODS = ('GET', 'HEAD')
+
+    def __init__(
+        self,
+        percentile=DEFAULT_HEDGE_PERCENTILE,
+        operations=None,
+        min_samples=20,
+        min_delay=0.005,
+        initial_delay=None,
+    ):
+        self.percentile = percentile
+        self.operations = None if operations is None else set(operations)
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+
+    def is_hedgeable(self, operation_name, request):
+        body = request.body
+        if body is not None and not isinstance(body, (bytes, bytearray)):
+            # A stream can only be sent once.
+            return False
+        if self.operations is not None:
+            return operation_name in self.operations
+        return request.method in self._HEDGEABLE_METHODS
+
+    def hedge_delay(self, histogram):
+        """Return the delay before hedging, or None to not hedge."""
+        if histogram.count < self.min_samples:
+            return self.initial_delay
+        return max(histogram.percentile(self.percentile), self.min_delay)
+
+
+class HedgingHandler:
+    """Sends hedgeable requests, hedging them when they are slow.
+
+    Registered on ``before-send``, returning the winning response lets the
+    endpoint skip its own send, so parsing, retries and error handling are
+    unchanged. Each hedge costs ``_HEDGE_COST`` from the retry quota and
+    every request that completes without a hedge refunds
+    ``_NO_HEDGE_INCREMENT``, bounding hedges to roughly one in
+    ``_HEDGE_COST`` requests under sustained slowness.
+    """
+
+    _HEDGE_COST = 10
+    _NO_HEDGE_INCREMENT = 1
+
+    def __init__(self, http_session, policy, retry_quota, max_workers=10):
+        self._http_session = http_session
+        self._policy = policy
+        self._quota = retry_quota
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers * 2,
+            thread_name_prefix='botocore-hedge',
+        )
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._hedges_sent = 0
+        self._hedges_won = 0
+        self._hedges_denied = 0
+        self._closed = False
+
+    def get_histogram(self, operation_name):
+        histogram = self._histograms.get(operation_name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    operation_name, LatencyHistogram()
+                )
+        return histogram
+
+    def stats(self):
+        """Return hedge counters and per operation latency percentiles."""
+        with self._lock:
+            stats = {
+                'hedges_sent': self._hedges_sent,
+                'hedges_won': self._hedges_won,
+                'hedges_denied': self._hedges_denied,
+            }
+        stats['operations'] = {
+            name: {
+                'count': histogram.count,
+                'p50': histogram.percentile(50),
+                'p99': histogram.percentile(99),
+                'hedge_delay': self._policy.hedge_delay(histogram),
+            }
+            for name, histogram in list(self._histograms.items())
+        }
+        return stats
+
+    def close(self):
+        """Shut down the threads that send requests and hedges.
+
+        Requests in flight are completed. Hedgeable requests made after the
+        handler is closed are sent without hedging.
+        """
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False)
+
+    def on_before_close(self, **kwargs):
+        self.close()
+
+    def on_before_send(self, request, event_name, **kwargs):
+        operation_name = event_name.rsplit('.', 1)[-1]
+        if self._closed:
+            return None
+        if not self._policy.is_hedgeable(operation_name, request):
+            return None
+        histogram = self.get_histogram(operation_name)
+        delay = self._policy.hedge_delay(histogram)
+        if delay is None:
+            response = self._timed_send(request, histogram)
+            self._quota.release(self._NO_HEDGE_INCREMENT)
+            return response
+        return self._send_hedged(request, histogram, delay)
+
+    def _timed_send(self, request, histogram):
+        start = time.monotonic()
+        response = self._http_session.send(request)
+        histogram.record(time.monotonic() - start)
+        return response
+
+    def _send_hedged(self, request, histogram, delay):
+        try:
+            primary = self._executor.submit(
+                self._timed_send, request, histogram
+            )
+        except RuntimeError:
+            # The handler was closed after the request was checked.
+            return self._timed_send(request, histogram)
+        try:
+            response = primary.result(timeout=delay)
+        except futures.TimeoutError:
+            pass
+        else:
+            self._quota.release(self._NO_HEDGE_INCREMENT)
+            return response
+        if not self._quota.acquire(self._HEDGE_COST):
+            with self._lock:
+                self._hedges_denied += 1
+            return primary.result()
+        logger.debug(
+            "Request outstanding for more than %s seconds, sending hedge.",
+            delay,
+        )
+        try:
+            hedge = self._executor.submit(self._timed_send, request, histogram)
+        except RuntimeError:
+            return primary.result()
+        with self._lock:
+            self._hedges_sent += 1
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = futures.wait(
+                pending, return_when=futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                if future is hedge:
+                    with self._lock:
+                        self._hedges_won += 1
+                for loser in pending:
+                    loser.add_done_callback(_discard_response)
+                return future.result()
+        raise error
+
+
+def _discard_response(future):
+    if future.exception() is not None:
+        return
+    raw = getattr(future.result(), 'raw', None)
+    if raw is not None:
+        # Streaming responses still hold their connection.
+        raw.close()
@@ -42,10 +42,11 @@ import calendar
 import datetime
 import json
 import re
+import weakref
 from xml.etree import ElementTree
 
 from botocore import validate
-from botocore.compat import formatdate
+from botocore.compat import formatdate, json_dumps_bytes
 from botocore.exceptions import ParamValidationError
 from botocore.utils import (
     has_header,
@@ -344,6 +345,10 @@ class EC2Serializer(QuerySerializer):
 class JSONSerializer(Serializer):
     TIMESTAMP_FORMAT = 'unixtimestamp'
 
+    def __init__(self):
+        # Input shape -> compiled serializer, see _get_compiled_serializer.
+        self._compiled_serializers = weakref.WeakKeyDictionary()
+
     def serialize_to_request(self, parameters, operation_model):
         target = '{}.{}'.format(
             operation_model.metadata['targetPrefix'],
@@ -361,8 +366,12 @@ class JSONSerializer(Serializer):
         body = self.MAP_TYPE()
         input_shape = operation_model.input_shape
         if input_shape is not None:
-            self._serialize(body, parameters, input_shape)
-        serialized['body'] = json.dumps(body).encode(self.DEFAULT_ENCODING)
+            serializer = self._get_compiled_serializer(input_shape)
+            if serializer is None:
+                body = parameters
+            else:
+                body = serializer(parameters)
+        serialized['body'] = json_dumps_bytes(body, self.DEFAULT_ENCODING)
 
         host_prefix = self._expand_host_prefix(parameters, operation_model)
         if host_prefix is not None:
@@ -429,6 +438,120 @@ class JSONSerializer(Serializer):
     def _serialize_type_blob(self, serialized, value, shape, key):
         serialized[key] = self._get_base64(value)
 
+    def _get_compiled_serializer(self, shape):
+        # The "json" wire format is the user input with blobs and
+        # timestamps converted and some members renamed.  Rather than
+        # walking the shape for every value of every request, each input
+        # shape is compiled once into a function that only visits the
+        # parts of the input that actually change.  ``None`` means the
+        # input can be sent as is.
+        try:
+            return self._compiled_serializers[shape]
+        except KeyError:
+            pass
+        compiled = self._compile_shape(shape, {}, {})
+        self._compiled_serializers[shape] = compiled
+        return compiled
+
+    def _compile_shape(self, shape, compiled, needs_conversion):
+        if not self._shape_needs_conversion(shape, needs_conversion):
+            return None
+        if shape.name in compiled:
+            if compiled[shape.name] is not None:
+                return compiled[shape.name]
+            # Recursive shape, defer the lookup until the shape has been
+            # compiled.
+            return lambda value: compiled[shape.name](value)
+        compiled[shape.name] = None
+        type_name = shape.type_name
+        if type_name == 'structure':
+            converter = self._compile_structure(
+                shape, compiled, needs_conversion
+            )
+        elif type_name == 'list':
+            member = self._compile_shape(
+                shape.member, compiled, needs_conversion
+            )
+
+            def converter(value):
+                return [member(item) for item in value]
+
+        elif type_name == 'map':
+            map_value = self._compile_shape(
+                shape.value, compiled, needs_conversion
+            )
+            map_type = self.MAP_TYPE
+
+            def converter(value):
+                return map_type(
+                    (key, map_value(item)) for key, item in value.items()
+                )
+
+        elif type_name == 'timestamp':
+            timestamp_format = shape.serialization.get('timestampFormat')
+
+            def converter(value):
+                return self._convert_timestamp_to_str(value, timestamp_format)
+
+        else:
+            converter = self._get_base64
+        compiled[shape.name] = converter
+        return converter
+
+    def _compile_structure(self, shape, compiled, needs_conversion):
+        renames = {}
+        converters = {}
+        for member_name, member_shape in shape.members.items():
+            serialized_name = member_shape.serialization.get('name')
+            if serialized_name is not None:
+                renames[member_name] = serialized_name
+            converter = self._compile_shape(
+                member_shape, compiled, needs_conversion
+            )
+            if converter is not None:
+                converters[member_name] = converter
+        map_type = self.MAP_TYPE
+
+        def converter(value):
+            serialized = map_type()
+            for key, member_value in value.items():
+                if key in converters:
+                    member_value = converters[key](member_value)
+                serialized[renames.get(key, key)] = member_value
+            return serialized
+
+        return converter
+
+    def _shape_needs_conversion(self, shape, needs_conversion):
+        # A shape needs converting if anything reachable from it is a blob
+        # or a timestamp, or is a structure member with a serialized name.
+        if shape.name in needs_conversion:
+            return needs_conversion[shape.name]
+        result = False
+        seen = set()
+        remaining = [shape]
+        while remaining and not result:
+            current = remaining.pop()
+            if current.name in seen:
+                continue
+            seen.add(current.name)
+            type_name = current.type_name
+            if type_name in ('blob', 'timestamp'):
+                result = True
+            elif type_name == 'structure':
+                if current.is_document_type:
+                    continue
+                for member_shape in current.members.values():
+                    if 'name' in member_shape.serialization:
+                        result = True
+                    remaining.append(member_shape)
+            elif type_name == 'list':
+                remaining.append(current.member)
+            elif type_name == 'map':
+                remaining.append(current.value)
+        needs_conversion[shape.name] = result
+        return result
+
 
 class BaseRestSerializer(Serializer):
     """Base class for rest protocols.
@@ -130,6 +130,9 @@ class Session:
         else:
             self._original_handler = event_hooks
         self._events = EventAliaser(self._original_handler)
+        # Cleared when handlers that affect client classes change, so it
+        # must exist before any handlers are registered.
+        self._client_cache = botocore.client.ClientCache()
         if include_builtin_handlers:
             self._register_builtin_handlers(self._events)
         self.user_agent_name = 'Botocore'
@@ -513,6 +516,10 @@ class Session:
             self._credentials = self._components.get_component(
                 'credential_provider'
             ).load_credentials()
+            if isinstance(
+                self._credentials, botocore.credentials.RefreshableCredentials
+            ) and self.get_config_variable('credential_background_refresh'):
+                self._credentials.enable_background_refresh()
         return self._credentials
 
     def get_auth_token(self):
@@ -747,6 +754,8 @@ class Session:
             unique_id,
             unique_id_uses_count=unique_id_uses_count,
         )
+        if event_name.startswith('creating-client-class'):
+            self._client_cache.clear()
 
     def unregister(
         self,
@@ -789,6 +798,8 @@ class Session:
             unique_id=unique_id,
             unique_id_uses_count=unique_id_uses_count,
         )
+        if event_name.startswith('creating-client-class'):
+            self._client_cache.clear()
 
     def emit(self, event_name, **kwargs):
         return self._events.emit(event_name, **kwargs)
@@ -825,9 +836,13 @@ class Session:
 
     def register_component(self, name, component):
         self._components.register_component(name, component)
+        if name == 'data_loader':
+            self._client_cache.clear()
 
     def lazy_register_component(self, name, component):
         self._components.lazy_register_component(name, component)
+        if name == 'data_loader':
+            self._client_cache.clear()
 
     def create_client(
         self,
@@ -993,6 +1008,8 @@ class Session:
             exceptions_factory,
             config_store,
             user_agent_creator=user_agent_creator,
+            client_cache=self._client_cache,
+            monitor=self._get_internal_component('monitor'),
         )
         client = client_creator.create_client(
             service_name=service_name,
@@ -1006,9 +1023,6 @@ class Session:
             api_version=api_version,
             auth_token=auth_token,
         )
-        monitor = self._get_internal_component('monitor')
-        if monitor is not None:
-            monitor.register(client.meta.events)
         return client
 
     def _resolve_region_name(self, region_name, config):
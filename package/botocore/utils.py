@@ -396,10 +396,23 @@ class IMDSFetcher:
         self._disabled = env.get('AWS_EC2_METADATA_DISABLED', 'false').lower()
         self._disabled = self._disabled == 'true'
         self._user_agent = user_agent
-        self._session = botocore.httpsession.URLLib3Session(
-            timeout=self._timeout,
-            proxies=get_environ_proxies(self._base_url),
-        )
+        self._http_session = None
+
+    @property
+    def _session(self):
+        # Created on first use: most credential chains are resolved before
+        # the metadata service is ever contacted, and creating the session
+        # (and its SSL context) is a large part of credential resolution.
+        if self._http_session is None:
+            self._http_session = botocore.httpsession.URLLib3Session(
+                timeout=self._timeout,
+                proxies=get_environ_proxies(self._base_url),
+            )
+        return self._http_session
+
+    @_session.setter
+    def _session(self, value):
+        self._http_session = value
 
     def get_base_url(self):
         return self._base_url
@@ -2906,12 +2919,20 @@ class ContainerMetadataFetcher:
     _ALLOWED_HOSTS = [IP_ADDRESS, 'localhost', '127.0.0.1']
 
     def __init__(self, session=None, sleep=time.sleep):
-        if session is None:
-            session = botocore.httpsession.URLLib3Session(
+        self._http_session = session
+        self._sleep = sleep
+
+    @property
+    def _session(self):
+        if self._http_session is None:
+            self._http_session = botocore.httpsession.URLLib3Session(
                 timeout=self.TIMEOUT_SECONDS
             )
-        self._session = session
-        self._sleep = sleep
+        return self._http_session
+
+    @_session.setter
+    def _session(self, value):
+        self._http_session = value
 
     def retrieve_full_uri(self, full_url, headers=None):
         """Retrieve JSON metadata from container metadata.
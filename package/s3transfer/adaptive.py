@@ -0,0 +1,351 @@
+# Copyright 2016 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Adaptive tuning of transfer concurrency and part sizes.
+
+The static defaults of ``TransferConfig`` are a compromise: ten requests
+in flight underuse a high bandwidth-delay link, while 8 MB parts add a
+request per part for large objects that could be moved in fewer, larger
+parts.  ``TransferTuner`` measures the requests a ``TransferManager``
+makes and adjusts:
+
+    * The number of data requests in flight, using additive increase and
+      multiplicative decrease (AIMD). The limit grows by one request per
+      measurement window while it is the bottleneck (doubling, like TCP
+      slow start, until the first decrease), and shrinks when requests
+      fail or per-byte latency rises without a throughput gain (the link
+      or the server is saturated).
+    * The part size of multipart transfers that have not started yet,
+      so that a part takes about ``target_part_seconds`` to transfer at
+      the observed per-request throughput.
+
+Both stay within ``max_memory``: the limit times the part size is the
+bound on part data held in memory by in-flight requests.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+from s3transfer.constants import MB
+from s3transfer.utils import MIN_UPLOAD_CHUNKSIZE
+
+logger = logging.getLogger(__name__)
+
+
+def track_request(transfer_tuner, nbytes=0):
+    """Track a data request with ``transfer_tuner`` if there is one.
+
+    :returns: A context manager yielding the tracked request.
+    """
+    if transfer_tuner is None:
+        return nullcontext(_TrackedRequest(nbytes))
+    return transfer_tuner.track(nbytes)
+
+
+class AdjustableSemaphore:
+    """A counting semaphore whose count can be changed while in use.
+
+    Lowering the count does not interrupt holders; new acquires block until
+    enough holders have released.
+    """
+
+    def __init__(self, count):
+        self._count = count
+        self._in_use = 0
+        self._condition = threading.Condition(threading.Lock())
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def in_use(self):
+        return self._in_use
+
+    def set_count(self, count):
+        with self._condition:
+            self._count = count
+            self._condition.notify_all()
+
+    def acquire(self):
+        with self._condition:
+            while self._in_use >= self._count:
+                self._condition.wait()
+            self._in_use += 1
+            return self._in_use
+
+    def release(self):
+        with self._condition:
+            self._in_use -= 1
+            self._condition.notify()
+
+
+class TransferTuner:
+    """Tunes request concurrency and part sizes from observed requests.
+
+    :type initial_concurrency: int
+    :param initial_concurrency: The number of data requests allowed in
+        flight before any measurements are made.
+
+    :type max_concurrency: int
+    :param max_concurrency: The upper bound of requests in flight.
+
+    :type max_memory: int
+    :param max_memory: The bound, in bytes, of part data held by in-flight
+        requests.
+
+    :type min_concurrency: int
+    :param min_concurrency: The lower bound of requests in flight.
+
+    :type window_seconds: float
+    :param window_seconds: The minimum length of a measurement window.
+
+    :type target_part_seconds: float
+    :param target_part_seconds: The time a single part should take to
+        transfer, used to recommend part sizes.
+    """
+
+    _INCREASE_STEP = 1
+    _ERROR_DECREASE_FACTOR = 0.5
+    _LATENCY_DECREASE_FACTOR = 0.75
+    # Per-byte latency this many times the best seen indicates queueing.
+    _LATENCY_INFLATION_LIMIT = 1.5
+    # A throughput this many times the previous window's is a gain.
+    _THROUGHPUT_GAIN = 1.05
+    # The weight of the newest sample in the per-request throughput average.
+    _THROUGHPUT_SMOOTHING = 0.3
+
+    def __init__(
+        self,
+        initial_concurrency,
+        max_concurrency,
+        max_memory,
+        min_concurrency=1,
+        window_seconds=0.5,
+        target_part_seconds=1.0,
+    ):
+        self._max_memory = max_memory
+        # Even parts of the minimum size must fit in memory at the highest
+        # concurrency, which takes precedence over ``min_concurrency``.
+        self._max_concurrency = max(
+            min(max_concurrency, max_memory // MIN_UPLOAD_CHUNKSIZE), 1
+        )
+        self._min_concurrency = min(min_concurrency, self._max_concurrency)
+        self._window_seconds = window_seconds
+        self._target_part_seconds = target_part_seconds
+        self._semaphore = AdjustableSemaphore(
+            min(
+                max(initial_concurrency, self._min_concurrency),
+                self._max_concurrency,
+            )
+        )
+        self._lock = threading.Lock()
+        self._request_throughput = None
+        self._best_latency_per_byte = None
+        self._last_throughput = None
+        # Until the first decrease the limit doubles while throughput keeps
+        # growing, so a high bandwidth-delay link is filled quickly.
+        self._slow_start = True
+        self._adjustments = 0
+        self._requests = 0
+        self._bytes = 0
+        self._errors = 0
+        self._reset_window(time.monotonic())
+
+    @property
+    def concurrency(self):
+        """The current limit of data requests in flight."""
+        return self._semaphore.count
+
+    def _reset_window(self, now):
+        self._window_start = now
+        self._window_requests = 0
+        self._window_bytes = 0
+        self._window_busy_seconds = 0.0
+        self._window_errors = 0
+        self._window_max_in_flight = self._semaphore.in_use
+
+    @contextmanager
+    def track(self, nbytes=0):
+        """Hold a request slot while a data request is made.
+
+        The request is measured when the block exits. Pass the number of
+        bytes the request transfers, or increment ``bytes_transferred`` on
+        the yielded object when that is only known as data is streamed.
+        """
+        in_flight = self._semaphore.acquire()
+        request = _TrackedRequest(nbytes)
+        start = time.monotonic()
+        try:
+            with self._lock:
+                if in_flight > self._window_max_in_flight:
+                    self._window_max_in_flight = in_flight
+            yield request
+        except Exception:
+            self._record(request, time.monotonic() - start, failed=True)
+            raise
+        else:
+            self._record(request, time.monotonic() - start, failed=False)
+        finally:
+            self._semaphore.release()
+
+    def _record(self, request, elapsed, failed):
+        nbytes = 0 if failed else request.bytes_transferred
+        with self._lock:
+            self._requests += 1
+            self._bytes += nbytes
+            self._window_requests += 1
+            self._window_bytes += nbytes
+            self._window_busy_seconds += elapsed
+            if failed:
+                self._errors += 1
+                self._window_errors += 1
+            elif nbytes and elapsed > 0:
+                self._update_request_throughput(nbytes / elapsed)
+            now = time.monotonic()
+            if self._is_window_complete(now):
+                self._adjust(now)
+
+    def _update_request_throughput(self, throughput):
+        if self._request_throughput is None:
+            self._request_throughput = throughput
+        else:
+            self._request_throughput += self._THROUGHPUT_SMOOTHING * (
+                throughput - self._request_throughput
+            )
+
+    def _is_window_complete(self, now):
+        if self._window_errors:
+            return True
+        return (
+            now - self._window_start >= self._window_seconds
+            and self._window_requests >= self._semaphore.count
+        )
+
+    def _adjust(self, now):
+        limit = self._semaphore.count
+        throughput = self._window_bytes / (now - self._window_start)
+        latency_per_byte = None
+        if self._window_bytes:
+            latency_per_byte = self._window_busy_seconds / self._window_bytes
+        new_limit = limit
+        if self._window_errors:
+            new_limit = int(limit * self._ERROR_DECREASE_FACTOR)
+        elif latency_per_byte is not None:
+            if (
+                self._best_latency_per_byte is None
+                or latency_per_byte < self._best_latency_per_byte
+            ):
+                self._best_latency_per_byte = latency_per_byte
+            gained = (
+                self._last_throughput is None
+                or throughput >= self._last_throughput * self._THROUGHPUT_GAIN
+            )
+            if (
+                latency_per_byte
+                > self._best_latency_per_byte * self._LATENCY_INFLATION_LIMIT
+                and not gained
+            ):
+                new_limit = int(limit * self._LATENCY_DECREASE_FACTOR)
+            elif self._window_max_in_flight >= limit:
+                if self._slow_start and gained:
+                    new_limit = limit * 2
+                else:
+                    new_limit = limit + self._INCREASE_STEP
+            self._last_throughput = throughput
+        new_limit = min(
+            max(new_limit, self._min_concurrency), self._max_concurrency
+        )
+        if new_limit < limit:
+            self._slow_start = False
+        if new_limit != limit:
+            logger.debug(
+                'Adjusting request concurrency from %s to %s '
+                '(throughput %.0f B/s, errors %s)',
+                limit,
+                new_limit,
+                throughput,
+                self._window_errors,
+            )
+            self._adjustments += 1
+            self._semaphore.set_count(new_limit)
+        self._reset_window(now)
+
+    def recommend_chunksize(self, default_chunksize, size=None):
+        """Recommend the part size of a new multipart transfer.
+
+        :type default_chunksize: int
+        :param default_chunksize: The part size to use without measurements.
+
+        :type size: int
+        :param size: The size of the object being transferred, if known.
+
+        :rtype: int
+        :returns: The part size, a whole number of megabytes that fits
+            ``max_memory`` at the current concurrency (unless ``max_memory``
+            is below the minimum part size of S3). It is not adjusted for
+            the part count and size limits of S3, see
+            ``s3transfer.utils.ChunksizeAdjuster``.
+        """
+        with self._lock:
+            request_throughput = self._request_throughput
+        if request_throughput is None:
+            return default_chunksize
+        limit = self._semaphore.count
+        chunksize = int(request_throughput * self._target_part_seconds)
+        if size is not None:
+            # Keep enough parts to use all of the request slots.
+            chunksize = min(chunksize, -(-size // limit))
+        # Round up to whole megabytes, which also keeps part sizes stable
+        # as the measured throughput fluctuates, then down to the memory
+        # bound so the limit's parts fit in it.
+        chunksize = -(-chunksize // MB) * MB
+        chunksize = min(chunksize, self._max_memory // limit // MB * MB)
+        if chunksize < MIN_UPLOAD_CHUNKSIZE:
+            chunksize = MIN_UPLOAD_CHUNKSIZE
+            self._limit_concurrency(self._max_memory // chunksize)
+        return chunksize
+
+    def _limit_concurrency(self, max_limit):
+        # Lower the limit so that its parts fit in memory.
+        with self._lock:
+            limit = self._semaphore.count
+            new_limit = max(min(limit, max_limit), 1)
+            if new_limit < limit:
+                logger.debug(
+                    'Lowering request concurrency from %s to %s to fit '
+                    'parts in memory',
+                    limit,
+                    new_limit,
+                )
+                self._slow_start = False
+                self._adjustments += 1
+                self._semaphore.set_count(new_limit)
+
+    def stats(self):
+        """Return the current limits and request counters."""
+        with self._lock:
+            return {
+                'concurrency': self._semaphore.count,
+                'in_flight': self._semaphore.in_use,
+                'requests': self._requests,
+                'bytes': self._bytes,
+                'errors': self._errors,
+                'adjustments': self._adjustments,
+                'request_throughput': self._request_throughput,
+            }
+
+
+class _TrackedRequest:
+    def __init__(self, bytes_transferred=0):
+        self.bytes_transferred = bytes_transferred
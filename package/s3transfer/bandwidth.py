@@ -13,6 +13,8 @@
 import threading
 import time
 
+DEFAULT_BANDWIDTH_CLASS = 'default'
+
 
 class RequestExceededException(Exception):
     def __init__(self, requested_amt, retry_time):
@@ -180,6 +182,11 @@ class BandwidthLimitedStream:
         else:
             raise self._transfer_coordinator.exception
 
+    def release_file(self):
+        """Release the file underlying the stream until it is read again"""
+        if hasattr(self._fileobj, 'release_file'):
+            self._fileobj.release_file()
+
     def signal_transferring(self):
         """Signal that data being read is being transferred to S3"""
         self.enable_bandwidth_limiting()
@@ -304,6 +311,256 @@ class LeakyBucket:
         return amt
 
 
+class BandwidthClass:
+    def __init__(self, name, weight=1.0, priority=0, max_rate=None):
+        """A class of transfers that share bandwidth in a BandwidthScheduler
+
+        :type name: str
+        :param name: The name of the class
+
+        :type weight: float
+        :param weight: The share of bandwidth of the class relative to the
+            other classes of the same priority
+
+        :type priority: int
+        :param priority: Classes with a higher priority are allocated
+            bandwidth before classes with a lower priority, which only get
+            what is left over.
+
+        :type max_rate: int
+        :param max_rate: The maximum rate of the class in bytes per second,
+            if it is capped.
+        """
+        self.name = name
+        self.weight = float(weight)
+        self.priority = priority
+        self.max_rate = max_rate
+        self.allocated_rate = 0.0
+        self.bytes_consumed = 0
+        self.next_available_time = 0.0
+        self.last_request_time = 0.0
+
+
+class BandwidthScheduler:
+    def __init__(
+        self,
+        max_rate,
+        time_utils=None,
+        rate_tracker=None,
+        idle_timeout=1.0,
+    ):
+        """Shares a maximum bandwidth between classes of transfers
+
+        Bandwidth is allocated by weighted fair sharing: the maximum rate
+        is divided between the classes with transfers in progress in
+        proportion to their weights, highest priority first, with the
+        share of a class limited to its own maximum rate and the rest
+        redistributed to the other classes. The transfers of each class
+        are then paced to its allocated rate. A class whose transfers have
+        not requested bandwidth for ``idle_timeout`` seconds gives up its
+        share.
+
+        A scheduler can be shared by several transfer managers, each
+        transferring in one of its classes. Use ``get_leaky_bucket()`` to
+        get what to pass as the leaky bucket of a ``BandwidthLimiter``.
+
+        :type max_rate: int
+        :param max_rate: The maximum rate of all classes together, in bytes
+            per second.
+
+        :type time_utils: TimeUtils
+        :param time_utils: The time utility to use for interacting with time
+
+        :type rate_tracker: BandwidthRateTracker
+        :param rate_tracker: Tracks the bandwidth consumption of all classes
+            and of each class
+
+        :type idle_timeout: float
+        :param idle_timeout: The time in seconds after which a class without
+            requests is no longer allocated bandwidth
+        """
+        self._max_rate = float(max_rate)
+        self._time_utils = time_utils
+        if time_utils is None:
+            self._time_utils = TimeUtils()
+        self._rate_tracker = rate_tracker
+        if rate_tracker is None:
+            self._rate_tracker = BandwidthRateTracker()
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._classes = {}
+        self._scheduled_tokens = set()
+        self.add_class(DEFAULT_BANDWIDTH_CLASS)
+
+    @property
+    def rate_tracker(self):
+        return self._rate_tracker
+
+    def add_class(self, name, weight=1.0, priority=0, max_rate=None):
+        """Add a class of transfers, or change the settings of one
+
+        See ``BandwidthClass`` for the parameters.
+        """
+        if weight <= 0:
+            raise ValueError(f'Weight of bandwidth class {name} must be > 0')
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError(
+                f'Maximum rate of bandwidth class {name} must be > 0'
+            )
+        with self._lock:
+            bandwidth_class = self._classes.get(name)
+            if bandwidth_class is None:
+                self._classes[name] = BandwidthClass(
+                    name, weight, priority, max_rate
+                )
+            else:
+                bandwidth_class.weight = float(weight)
+                bandwidth_class.priority = priority
+                bandwidth_class.max_rate = max_rate
+
+    def get_leaky_bucket(self, name=DEFAULT_BANDWIDTH_CLASS):
+        """Get a leaky bucket that consumes bandwidth as a class
+
+        :type name: str
+        :param name: The name of a class added with ``add_class()``
+
+        :rtype: ScheduledLeakyBucket
+        """
+        if name not in self._classes:
+            raise ValueError(f'Unknown bandwidth class: {name}')
+        return ScheduledLeakyBucket(self, name)
+
+    def consume(self, amt, request_token, name=DEFAULT_BANDWIDTH_CLASS):
+        """Consume an amount as a class
+
+        :type amt: int
+        :param amt: The amount of bytes to request to consume
+
+        :type request_token: RequestToken
+        :param request_token: The token associated to the consumption
+            request, to be used again if a RequestExceededException is
+            raised.
+
+        :type name: str
+        :param name: The name of the class to consume as
+
+        :raises RequestExceededException: If the amount cannot be consumed
+            yet within the rate allocated to the class
+
+        :rtype: int
+        :returns: The amount consumed
+        """
+        with self._lock:
+            time_now = self._time_utils.time()
+            bandwidth_class = self._classes[name]
+            if request_token in self._scheduled_tokens:
+                # The request's bandwidth was reserved when it was scheduled.
+                self._scheduled_tokens.remove(request_token)
+                return self._release_requested_amt(
+                    bandwidth_class, amt, time_now
+                )
+            bandwidth_class.last_request_time = time_now
+            self._allocate_rates(time_now)
+            rate = bandwidth_class.allocated_rate
+            if not rate:
+                # Higher priority classes use all of the bandwidth. Ask
+                # again before the class would be considered idle.
+                raise RequestExceededException(
+                    requested_amt=amt, retry_time=self._idle_timeout / 2
+                )
+            start_time = max(time_now, bandwidth_class.next_available_time)
+            bandwidth_class.next_available_time = start_time + amt / rate
+            if start_time <= time_now:
+                return self._release_requested_amt(
+                    bandwidth_class, amt, time_now
+                )
+            self._scheduled_tokens.add(request_token)
+            raise RequestExceededException(
+                requested_amt=amt, retry_time=start_time - time_now
+            )
+
+    def _is_active(self, bandwidth_class, time_now):
+        last_active_time = max(
+            bandwidth_class.last_request_time,
+            bandwidth_class.next_available_time,
+        )
+        return time_now - last_active_time < self._idle_timeout
+
+    def _allocate_rates(self, time_now):
+        priorities = {}
+        for bandwidth_class in self._classes.values():
+            bandwidth_class.allocated_rate = 0.0
+            if self._is_active(bandwidth_class, time_now):
+                priorities.setdefault(bandwidth_class.priority, []).append(
+                    bandwidth_class
+                )
+        remaining_rate = self._max_rate
+        for priority in sorted(priorities, reverse=True):
+            unallocated = priorities[priority]
+            while unallocated and remaining_rate > 0:
+                total_weight = sum(c.weight for c in unallocated)
+                # Classes capped below their fair share get their cap, and
+                # the rest is shared again between the other classes.
+                capped = [
+                    c
+                    for c in unallocated
+                    if c.max_rate is not None
+                    and c.max_rate <= remaining_rate * c.weight / total_weight
+                ]
+                if not capped:
+                    for c in unallocated:
+                        c.allocated_rate = (
+                            remaining_rate * c.weight / total_weight
+                        )
+                    remaining_rate = 0
+                    break
+                for c in capped:
+                    c.allocated_rate = float(c.max_rate)
+                    remaining_rate -= c.max_rate
+                    unallocated.remove(c)
+
+    def _release_requested_amt(self, bandwidth_class, amt, time_now):
+        bandwidth_class.bytes_consumed += amt
+        self._rate_tracker.record_consumption_rate(
+            amt, time_now, bandwidth_class.name
+        )
+        return amt
+
+    def stats(self):
+        """Return the allocated and measured rates of each class"""
+        with self._lock:
+            self._allocate_rates(self._time_utils.time())
+            return {
+                name: {
+                    'allocated_rate': bandwidth_class.allocated_rate,
+                    'current_rate': self._rate_tracker.get_class_rate(name),
+                    'bytes_consumed': bandwidth_class.bytes_consumed,
+                }
+                for name, bandwidth_class in self._classes.items()
+            }
+
+
+class ScheduledLeakyBucket:
+    def __init__(self, scheduler, name):
+        """A leaky bucket that consumes as a class of a BandwidthScheduler
+
+        :type scheduler: BandwidthScheduler
+        :param scheduler: The scheduler to consume from
+
+        :type name: str
+        :param name: The name of the class to consume as
+        """
+        self._scheduler = scheduler
+        self._name = name
+
+    def consume(self, amt, request_token):
+        """Consume an a requested amount
+
+        See ``LeakyBucket.consume()``.
+        """
+        return self._scheduler.consume(amt, request_token, self._name)
+
+
 class ConsumptionScheduler:
     def __init__(self):
         """Schedules when to consume a desired amount"""
@@ -374,6 +631,7 @@ class BandwidthRateTracker:
         self._alpha = alpha
         self._last_time = None
         self._current_rate = None
+        self._class_trackers = {}
 
     @property
     def current_rate(self):
@@ -386,6 +644,33 @@ class BandwidthRateTracker:
             return 0.0
         return self._current_rate
 
+    @property
+    def class_rates(self):
+        """The current transfer rate of each class of transfers
+
+        :rtype: dict
+        :returns: The current tracked transfer rate of each class that has
+            recorded consumption, by class name
+        """
+        return {
+            name: tracker.current_rate
+            for name, tracker in list(self._class_trackers.items())
+        }
+
+    def get_class_rate(self, bandwidth_class):
+        """The current transfer rate of a class of transfers
+
+        :type bandwidth_class: str
+        :param bandwidth_class: The name of the class
+
+        :rtype: float
+        :returns: The current tracked transfer rate of the class
+        """
+        tracker = self._class_trackers.get(bandwidth_class)
+        if tracker is None:
+            return 0.0
+        return tracker.current_rate
+
     def get_projected_rate(self, amt, time_at_consumption):
         """Get the projected rate using a provided amount and time
 
@@ -404,7 +689,9 @@ class BandwidthRateTracker:
             amt, time_at_consumption
         )
 
-    def record_consumption_rate(self, amt, time_at_consumption):
+    def record_consumption_rate(
+        self, amt, time_at_consumption, bandwidth_class=None
+    ):
         """Record the consumption rate based off amount and time point
 
         :type amt: int
@@ -412,7 +699,18 @@ class BandwidthRateTracker:
 
         :type time_at_consumption: float
         :param time_at_consumption: The time at which the amount was consumed
+
+        :type bandwidth_class: str
+        :param bandwidth_class: The name of the class of transfers that
+            consumed the amount, if any. The rate of each class is tracked
+            in addition to the overall rate.
         """
+        if bandwidth_class is not None:
+            tracker = self._class_trackers.get(bandwidth_class)
+            if tracker is None:
+                tracker = BandwidthRateTracker(self._alpha)
+                self._class_trackers[bandwidth_class] = tracker
+            tracker.record_consumption_rate(amt, time_at_consumption)
         if self._last_time is None:
             self._last_time = time_at_consumption
             self._current_rate = 0.0
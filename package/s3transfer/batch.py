@@ -0,0 +1,934 @@
+# Copyright 2016 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Batched transfers of many small objects.
+
+A regular transfer creates a future, a coordinator, a submission task and
+several request and IO tasks for every object, which is most of the cost
+of moving an object of a few kilobytes.  A batch is a single transfer: one
+future and coordinator for all of its objects, and a fixed number of
+worker tasks that each take the next object from a shared source and make
+a single ``PutObject`` or ``GetObject`` request for it.
+
+Copy batches are planned as they stream: each listed object is copied with
+``CopyObject``, or, at or above the multipart threshold, split into
+``UploadPartCopy`` parts that are handed to the same workers before any
+further objects.  Sources can be deleted after they are copied with
+``DeleteObjects`` requests of up to 1000 keys.
+"""
+import collections
+import copy
+import logging
+import random
+import threading
+import time
+
+from botocore.exceptions import ClientError
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
+
+from s3transfer.adaptive import track_request
+from s3transfer.copies import CopySubmissionTask
+from s3transfer.exceptions import BatchTransferError, RetriesExceededError
+from s3transfer.tasks import SubmissionTask, Task
+from s3transfer.utils import (
+    MAX_SINGLE_UPLOAD_SIZE,
+    S3_RETRYABLE_DOWNLOAD_ERRORS,
+    ChunksizeAdjuster,
+    CountCallbackInvoker,
+    FunctionContainer,
+    calculate_num_parts,
+    calculate_range_parameter,
+    get_callbacks,
+    get_filtered_dict,
+    invoke_progress_callbacks,
+)
+
+logger = logging.getLogger(__name__)
+
+# The most keys a single DeleteObjects request can delete.
+MAX_DELETE_OBJECTS_KEYS = 1000
+
+# Error codes of copy requests that are worth retrying once botocore's own
+# retries are exhausted.
+RETRYABLE_COPY_ERROR_CODES = (
+    'InternalError',
+    'RequestTimeout',
+    'ServiceUnavailable',
+    'SlowDown',
+)
+
+
+class BatchItemSource:
+    """Hands out the items of a batch to its worker tasks.
+
+    The items are consumed lazily, so a batch may be given a generator of
+    any length.
+    """
+
+    def __init__(self, items):
+        self._items = iter(items)
+        self._pushed_items = collections.deque()
+        self._lock = threading.Lock()
+
+    def next_item(self):
+        """Return the next item, or None once all have been taken."""
+        with self._lock:
+            if self._pushed_items:
+                return self._pushed_items.popleft()
+            return next(self._items, None)
+
+    def push_items(self, items):
+        """Add items to hand out before the remaining items."""
+        with self._lock:
+            self._pushed_items.extend(items)
+
+
+class BatchTransferStats:
+    """Aggregate counters of a batch transfer.
+
+    :ivar succeeded: The number of objects transferred.
+    :ivar bytes_transferred: The number of bytes of those objects.
+    :ivar failures: A dictionary of ``(bucket, key)`` to the exception
+        raised when transferring that object.
+    """
+
+    def __init__(self):
+        self.succeeded = 0
+        self.bytes_transferred = 0
+        self.failures = {}
+        self._start_time = time.monotonic()
+        self._end_time = None
+        self._lock = threading.Lock()
+
+    def record_success(self, nbytes):
+        with self._lock:
+            self.succeeded += 1
+            self.bytes_transferred += nbytes
+
+    def record_failure(self, bucket, key, exception):
+        with self._lock:
+            self.failures[(bucket, key)] = exception
+
+    def finish(self):
+        self._end_time = time.monotonic()
+
+    @property
+    def elapsed(self):
+        end_time = self._end_time
+        if end_time is None:
+            end_time = time.monotonic()
+        return end_time - self._start_time
+
+    @property
+    def objects_per_second(self):
+        elapsed = self.elapsed
+        if not elapsed:
+            return 0.0
+        return self.succeeded / elapsed
+
+    def __repr__(self):
+        return (
+            '{}(succeeded={}, failed={}, bytes_transferred={}, '
+            'objects_per_second={:.1f})'.format(
+                self.__class__.__name__,
+                self.succeeded,
+                len(self.failures),
+                self.bytes_transferred,
+                self.objects_per_second,
+            )
+        )
+
+
+class BatchSubmissionTask(SubmissionTask):
+    """Task for submitting the workers of a batch transfer"""
+
+    def _submit(
+        self,
+        client,
+        config,
+        osutil,
+        request_executor,
+        transfer_future,
+        worker_task_cls,
+        bucket_validator=None,
+        bandwidth_limiter=None,
+        transfer_tuner=None,
+    ):
+        """
+        :param client: The client associated with the transfer manager
+
+        :type config: s3transfer.manager.TransferConfig
+        :param config: The transfer config associated with the transfer
+            manager
+
+        :type osutil: s3transfer.utils.OSUtil
+        :param osutil: The os utility associated to the transfer manager
+
+        :type request_executor: s3transfer.futures.BoundedExecutor
+        :param request_executor: The request executor associated with the
+            transfer manager
+
+        :type transfer_future: s3transfer.futures.TransferFuture
+        :param transfer_future: The transfer future associated with the
+            transfer request that tasks are being submitted for
+
+        :type worker_task_cls: s3transfer.tasks.Task
+        :param worker_task_cls: The task that transfers the batch's objects
+
+        :type bucket_validator: function
+        :param bucket_validator: Called with the buckets of each object,
+            raising ValueError for buckets transfers do not support
+
+        :type bandwidth_limiter: s3transfer.bandwidth.BandwidthLimiter
+        :param bandwidth_limiter: The bandwidth limiter to use when
+            uploading and downloading objects
+
+        :type transfer_tuner: s3transfer.adaptive.TransferTuner
+        :param transfer_tuner: The tuner to measure requests with
+        """
+        call_args = transfer_future.meta.call_args
+        source = BatchItemSource(call_args.items)
+        stats = BatchTransferStats()
+        num_workers = self._get_num_workers(config, transfer_tuner)
+
+        batch_kwargs = worker_task_cls.get_batch_kwargs(
+            client, call_args, stats
+        )
+        complete_invoker = CountCallbackInvoker(
+            FunctionContainer(
+                self._transfer_coordinator.submit,
+                request_executor,
+                CompleteBatchTask(
+                    transfer_coordinator=self._transfer_coordinator,
+                    main_kwargs={
+                        'stats': stats,
+                        'source_deleter': batch_kwargs.get('source_deleter'),
+                    },
+                    is_final=True,
+                ),
+            )
+        )
+        for _ in range(num_workers):
+            complete_invoker.increment()
+            self._transfer_coordinator.submit(
+                request_executor,
+                worker_task_cls(
+                    transfer_coordinator=self._transfer_coordinator,
+                    main_kwargs={
+                        'client': client,
+                        'config': config,
+                        'osutil': osutil,
+                        'source': source,
+                        'stats': stats,
+                        'extra_args': call_args.extra_args,
+                        'callbacks': get_callbacks(
+                            transfer_future, 'progress'
+                        ),
+                        'transfer_tuner': transfer_tuner,
+                        'bucket_validator': bucket_validator,
+                        'bandwidth_limiter': bandwidth_limiter,
+                        **batch_kwargs,
+                    },
+                    done_callbacks=[complete_invoker.decrement],
+                ),
+            )
+        complete_invoker.finalize()
+
+    def _get_num_workers(self, config, transfer_tuner):
+        # Workers hold their request threads for the whole batch, so leave
+        # some of the threads to other transfers of the manager.
+        num_request_threads = config.max_request_concurrency
+        if transfer_tuner is not None:
+            num_request_threads = max(
+                num_request_threads, config.max_adaptive_request_concurrency
+            )
+        num_workers = config.max_batch_concurrency
+        if num_workers is None:
+            num_workers = num_request_threads // 2
+        return max(min(num_workers, num_request_threads - 1), 1)
+
+
+class BatchWorkerTask(Task):
+    """Base task for transferring objects from a batch's item source"""
+
+    @classmethod
+    def get_batch_kwargs(cls, client, call_args, stats):
+        """Main kwargs shared by all workers of a batch, besides the common
+        ones. ``source_deleter`` is also given to the CompleteBatchTask.
+        """
+        return {}
+
+    def _main(
+        self,
+        client,
+        config,
+        osutil,
+        source,
+        stats,
+        extra_args,
+        callbacks,
+        transfer_tuner=None,
+        bucket_validator=None,
+        bandwidth_limiter=None,
+        **batch_kwargs,
+    ):
+        """
+        :param client: The client to make requests with
+        :param config: The transfer config of the batch
+        :param osutil: The os utility to access files with
+        :param source: The BatchItemSource to take items from
+        :param stats: The BatchTransferStats to record results in
+        :param extra_args: Extra arguments for every request of the batch
+        :param callbacks: Progress callbacks of the batch
+        :param transfer_tuner: The tuner to measure requests with, if any
+        :param bucket_validator: Validates the buckets of each item, if
+            given
+        :param bandwidth_limiter: The bandwidth limiter of the transfers,
+            if any
+        :param batch_kwargs: The kwargs from ``get_batch_kwargs()``
+        """
+        while not self._transfer_coordinator.done():
+            item = source.next_item()
+            if item is None:
+                return
+            bucket, key = self._get_bucket_and_key(item)
+            try:
+                if bucket_validator is not None:
+                    for item_bucket in self._get_buckets_to_validate(item):
+                        bucket_validator(item_bucket)
+                nbytes = self._transfer_item(
+                    client,
+                    config,
+                    osutil,
+                    item,
+                    extra_args,
+                    callbacks,
+                    transfer_tuner,
+                    source=source,
+                    bandwidth_limiter=bandwidth_limiter,
+                    **batch_kwargs,
+                )
+            except Exception as e:
+                logger.debug(
+                    'Failed to transfer s3://%s/%s in batch',
+                    bucket,
+                    key,
+                    exc_info=True,
+                )
+                stats.record_failure(bucket, key, e)
+            else:
+                # Items that only transfer part of an object return None.
+                if nbytes is not None:
+                    stats.record_success(nbytes)
+
+    def _get_bucket_and_key(self, item):
+        raise NotImplementedError('_get_bucket_and_key()')
+
+    def _get_buckets_to_validate(self, item):
+        """The buckets an item is transferred from and to"""
+        return [self._get_bucket_and_key(item)[0]]
+
+    def _transfer_item(
+        self,
+        client,
+        config,
+        osutil,
+        item,
+        extra_args,
+        callbacks,
+        transfer_tuner,
+        bandwidth_limiter=None,
+        **kwargs,
+    ):
+        """Transfer a single item, returning the number of bytes moved"""
+        raise NotImplementedError('_transfer_item()')
+
+
+class BatchUploadTask(BatchWorkerTask):
+    """Uploads ``(filename, bucket, key)`` items with PutObject"""
+
+    def _get_bucket_and_key(self, item):
+        return item[1], item[2]
+
+    def _transfer_item(
+        self,
+        client,
+        config,
+        osutil,
+        item,
+        extra_args,
+        callbacks,
+        transfer_tuner,
+        bandwidth_limiter=None,
+        **kwargs,
+    ):
+        filename, bucket, key = item
+        size = osutil.get_file_size(filename)
+        if size > MAX_SINGLE_UPLOAD_SIZE:
+            raise ValueError(
+                f'{filename} is larger than the maximum size of a single '
+                f'upload ({MAX_SINGLE_UPLOAD_SIZE} bytes)'
+            )
+        # Objects in a batch are uploaded in a single request regardless of
+        # the multipart threshold. The body is streamed from the file, so
+        # larger objects do not need to be held in memory.
+        body = osutil.open(filename, 'rb')
+        if bandwidth_limiter:
+            # Limiting is enabled once the request starts sending the body,
+            # as for regular uploads. Closing the stream accounts for bodies
+            # too small to reach its threshold.
+            body = bandwidth_limiter.get_bandwith_limited_stream(
+                body, self._transfer_coordinator, enabled=False
+            )
+        with body, track_request(transfer_tuner, size):
+            client.put_object(Bucket=bucket, Key=key, Body=body, **extra_args)
+        invoke_progress_callbacks(callbacks, size)
+        return size
+
+
+class BatchDownloadTask(BatchWorkerTask):
+    """Downloads ``(bucket, key, filename)`` items with GetObject
+
+    Unlike a regular download, no HeadObject request is made: the object is
+    streamed to a temporary file that is renamed once it is complete.
+    """
+
+    def _get_bucket_and_key(self, item):
+        return item[0], item[1]
+
+    def _transfer_item(
+        self,
+        client,
+        config,
+        osutil,
+        item,
+        extra_args,
+        callbacks,
+        transfer_tuner,
+        bandwidth_limiter=None,
+        **kwargs,
+    ):
+        bucket, key, filename = item
+        temp_filename = osutil.get_temp_filename(filename)
+        try:
+            nbytes = self._download_to_file(
+                client,
+                bucket,
+                key,
+                temp_filename,
+                extra_args,
+                callbacks,
+                config,
+                osutil,
+                transfer_tuner,
+                bandwidth_limiter,
+            )
+            osutil.rename_file(temp_filename, filename)
+        except BaseException:
+            osutil.remove_file(temp_filename)
+            raise
+        return nbytes
+
+    def _download_to_file(
+        self,
+        client,
+        bucket,
+        key,
+        filename,
+        extra_args,
+        callbacks,
+        config,
+        osutil,
+        transfer_tuner,
+        bandwidth_limiter=None,
+    ):
+        last_exception = None
+        for i in range(config.num_download_attempts):
+            nbytes = 0
+            try:
+                with track_request(transfer_tuner) as request:
+                    response = client.get_object(
+                        Bucket=bucket, Key=key, **extra_args
+                    )
+                    body = response['Body']
+                    if bandwidth_limiter:
+                        body = bandwidth_limiter.get_bandwith_limited_stream(
+                            body, self._transfer_coordinator
+                        )
+                    with osutil.open(filename, 'wb') as f:
+                        for chunk in iter(
+                            lambda: body.read(config.io_chunksize), b''
+                        ):
+                            f.write(chunk)
+                            nbytes += len(chunk)
+                            invoke_progress_callbacks(callbacks, len(chunk))
+                    request.bytes_transferred = nbytes
+                return nbytes
+            except S3_RETRYABLE_DOWNLOAD_ERRORS as e:
+                logger.debug(
+                    "Retrying exception caught (%s), "
+                    "retrying request, (attempt %s / %s)",
+                    e,
+                    i,
+                    config.num_download_attempts,
+                    exc_info=True,
+                )
+                last_exception = e
+                invoke_progress_callbacks(callbacks, -nbytes)
+        raise RetriesExceededError(last_exception)
+
+
+class BatchMultipartCopy:
+    """The state of one object of a copy batch copied in parts
+
+    :param copy_source: The CopySource of the object
+    :param bucket: The name of the bucket to copy to
+    :param key: The name of the key to copy to
+    :param size: The size of the object
+    :param upload_id: The id of the multipart upload
+    :param num_parts: The number of parts to copy
+    """
+
+    def __init__(self, copy_source, bucket, key, size, upload_id, num_parts):
+        self.copy_source = copy_source
+        self.bucket = bucket
+        self.key = key
+        self.size = size
+        self.upload_id = upload_id
+        self._parts_remaining = num_parts
+        self._parts = []
+        self._failed = False
+        self._finished = False
+        self._lock = threading.Lock()
+
+    @property
+    def failed(self):
+        return self._failed
+
+    @property
+    def parts(self):
+        with self._lock:
+            return sorted(self._parts, key=lambda part: part['PartNumber'])
+
+    def record_part(self, part):
+        """Record a copied part
+
+        :returns: True if it was the last part to finish
+        """
+        with self._lock:
+            self._parts.append(part)
+            return self._finish_part()
+
+    def record_failure(self):
+        """Record a part that failed or was skipped after a failure
+
+        :returns: True if it was the last part to finish
+        """
+        with self._lock:
+            self._failed = True
+            return self._finish_part()
+
+    def _finish_part(self):
+        self._parts_remaining -= 1
+        return self._parts_remaining == 0
+
+    def mark_finished(self):
+        """Mark that the upload was completed or aborted"""
+        self._finished = True
+
+    def abort_if_unfinished(self, client):
+        """Abort the upload if it was neither completed nor aborted"""
+        if not self._finished:
+            self._finished = True
+            client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self.upload_id
+            )
+
+
+BatchCopyPart = collections.namedtuple(
+    'BatchCopyPart',
+    ['multipart_copy', 'part_number', 'size', 'extra_args'],
+)
+
+
+class BatchSourceDeleter:
+    """Deletes the sources of a copy batch once they are copied
+
+    Sources are grouped by bucket and deleted with a DeleteObjects request
+    once a group has ``MAX_DELETE_OBJECTS_KEYS`` keys, or when the batch is
+    complete. Keys that could not be deleted are recorded as failures of
+    the batch.
+
+    :param client: The client to delete the sources with
+    :param stats: The BatchTransferStats to record failures in
+    :param extra_args: Extra arguments for every DeleteObjects request
+    """
+
+    DELETE_OBJECTS_ARGS = ['RequestPayer', 'ExpectedBucketOwner']
+
+    def __init__(self, client, stats, extra_args=None):
+        self._client = client
+        self._stats = stats
+        self._extra_args = extra_args or {}
+        self._pending = collections.defaultdict(list)
+        self._lock = threading.Lock()
+
+    def add(self, copy_source):
+        """Schedule the deletion of a copied source"""
+        obj = {'Key': copy_source['Key']}
+        if copy_source.get('VersionId'):
+            obj['VersionId'] = copy_source['VersionId']
+        bucket = copy_source['Bucket']
+        with self._lock:
+            pending = self._pending[bucket]
+            pending.append(obj)
+            if len(pending) < MAX_DELETE_OBJECTS_KEYS:
+                return
+            del self._pending[bucket]
+        self._delete_objects(bucket, pending)
+
+    def flush(self):
+        """Delete all sources whose deletion is still pending"""
+        with self._lock:
+            pending = self._pending
+            self._pending = collections.defaultdict(list)
+        for bucket, objects in pending.items():
+            self._delete_objects(bucket, objects)
+
+    def _delete_objects(self, bucket, objects):
+        try:
+            response = self._client.delete_objects(
+                Bucket=bucket,
+                Delete={'Objects': objects, 'Quiet': True},
+                **self._extra_args,
+            )
+        except Exception as e:
+            logger.debug(
+                'Failed to delete %s copied sources from %s',
+                len(objects),
+                bucket,
+                exc_info=True,
+            )
+            for obj in objects:
+                self._stats.record_failure(bucket, obj['Key'], e)
+            return
+        for error in response.get('Errors', []):
+            self._stats.record_failure(
+                bucket,
+                error['Key'],
+                ClientError({'Error': error}, 'DeleteObjects'),
+            )
+
+
+class BatchCopyTask(BatchWorkerTask):
+    """Copies ``(copy_source, bucket, key[, size])`` items
+
+    Items with a size, such as those built from a listing, are copied
+    without a HeadObject request. Objects at or above the
+    ``multipart_threshold`` are copied in parts: the worker that takes the
+    object creates the multipart upload and pushes its parts back to the
+    item source, so all workers copy them before taking further objects.
+    The worker that copies the last part completes the upload.
+    """
+
+    @classmethod
+    def get_batch_kwargs(cls, client, call_args, stats):
+        source_deleter = None
+        if call_args.delete_source:
+            source_deleter = BatchSourceDeleter(
+                call_args.source_client,
+                stats,
+                get_filtered_dict(
+                    call_args.extra_args,
+                    BatchSourceDeleter.DELETE_OBJECTS_ARGS,
+                ),
+            )
+        return {
+            'source_client': call_args.source_client,
+            'source_deleter': source_deleter,
+        }
+
+    def _get_bucket_and_key(self, item):
+        if isinstance(item, BatchCopyPart):
+            return item.multipart_copy.bucket, item.multipart_copy.key
+        return item[1], item[2]
+
+    def _get_buckets_to_validate(self, item):
+        if isinstance(item, BatchCopyPart):
+            # The object of the part was validated.
+            return []
+        buckets = [item[1]]
+        if isinstance(item[0], dict):
+            buckets.append(item[0].get('Bucket'))
+        return buckets
+
+    def _transfer_item(
+        self,
+        client,
+        config,
+        osutil,
+        item,
+        extra_args,
+        callbacks,
+        transfer_tuner,
+        source=None,
+        source_client=None,
+        source_deleter=None,
+        **kwargs,
+    ):
+        if isinstance(item, BatchCopyPart):
+            nbytes = self._copy_part(client, config, item, callbacks)
+            copy_source = item.multipart_copy.copy_source
+            bucket = item.multipart_copy.bucket
+            key = item.multipart_copy.key
+        else:
+            copy_source, bucket, key = item[:3]
+            self._validate_copy_source(copy_source)
+            size = item[3] if len(item) > 3 else None
+            if size is None:
+                size = self._head_object(
+                    source_client, copy_source, extra_args
+                )
+            if size < config.multipart_threshold:
+                self._make_request(
+                    config,
+                    client.copy_object,
+                    CopySource=copy_source,
+                    Bucket=bucket,
+                    Key=key,
+                    **extra_args,
+                )
+                invoke_progress_callbacks(callbacks, size)
+                nbytes = size
+            else:
+                nbytes = self._start_multipart_copy(
+                    client,
+                    config,
+                    source,
+                    copy_source,
+                    bucket,
+                    key,
+                    size,
+                    extra_args,
+                )
+        if nbytes is not None and source_deleter is not None:
+            if self._is_copied_onto_itself(copy_source, bucket, key):
+                # Deleting the source would delete the copy.
+                logger.debug(
+                    'Not deleting s3://%s/%s, which was copied onto itself',
+                    bucket,
+                    key,
+                )
+            else:
+                source_deleter.add(copy_source)
+        return nbytes
+
+    def _validate_copy_source(self, copy_source):
+        if not isinstance(copy_source, dict):
+            raise TypeError(
+                'Expecting dictionary formatted: '
+                '{"Bucket": bucket_name, "Key": key} '
+                'but got %s or type %s.' % (copy_source, type(copy_source))
+            )
+
+    def _is_copied_onto_itself(self, copy_source, bucket, key):
+        # A copy of a specific version is a new version of the key, so the
+        # source version can be deleted even if the key is the same.
+        return (
+            copy_source['Bucket'] == bucket
+            and copy_source['Key'] == key
+            and not copy_source.get('VersionId')
+        )
+
+    def _head_object(self, source_client, copy_source, extra_args):
+        head_object_request = copy.copy(copy_source)
+        mapping = CopySubmissionTask.EXTRA_ARGS_TO_HEAD_ARGS_MAPPING
+        for param, value in extra_args.items():
+            if param in mapping:
+                head_object_request[mapping[param]] = value
+        response = source_client.head_object(**head_object_request)
+        return response['ContentLength']
+
+    def _start_multipart_copy(
+        self,
+        client,
+        config,
+        source,
+        copy_source,
+        bucket,
+        key,
+        size,
+        extra_args,
+    ):
+        create_multipart_extra_args = {
+            param: value
+            for param, value in extra_args.items()
+            if param not in CopySubmissionTask.CREATE_MULTIPART_ARGS_BLACKLIST
+        }
+        upload_id = self._make_request(
+            config,
+            client.create_multipart_upload,
+            Bucket=bucket,
+            Key=key,
+            **create_multipart_extra_args,
+        )['UploadId']
+        part_size = ChunksizeAdjuster().adjust_chunksize(
+            config.multipart_chunksize, size
+        )
+        num_parts = calculate_num_parts(size, part_size)
+        multipart_copy = BatchMultipartCopy(
+            copy_source, bucket, key, size, upload_id, num_parts
+        )
+        # Abort the upload if the batch is cancelled before it completes.
+        self._transfer_coordinator.add_failure_cleanup(
+            multipart_copy.abort_if_unfinished, client
+        )
+        upload_part_args = get_filtered_dict(
+            extra_args, CopySubmissionTask.UPLOAD_PART_COPY_ARGS
+        )
+        checksum_algorithm = extra_args.get('ChecksumAlgorithm')
+        parts = []
+        for part_index in range(num_parts):
+            part_extra_args = dict(upload_part_args)
+            part_extra_args['CopySourceRange'] = calculate_range_parameter(
+                part_size, part_index, num_parts, size
+            )
+            if checksum_algorithm:
+                part_extra_args['ChecksumAlgorithm'] = checksum_algorithm
+            parts.append(
+                BatchCopyPart(
+                    multipart_copy=multipart_copy,
+                    part_number=part_index + 1,
+                    size=min(part_size, size - part_index * part_size),
+                    extra_args=part_extra_args,
+                )
+            )
+        source.push_items(parts)
+        return None
+
+    def _copy_part(self, client, config, part, callbacks):
+        multipart_copy = part.multipart_copy
+        if multipart_copy.failed:
+            # Another part failed, so the upload is aborted; there is no
+            # need to copy the rest.
+            if multipart_copy.record_failure():
+                self._abort_multipart_copy(client, multipart_copy)
+            return None
+        extra_args = dict(part.extra_args)
+        checksum_algorithm = extra_args.pop('ChecksumAlgorithm', None)
+        try:
+            response = self._make_request(
+                config,
+                client.upload_part_copy,
+                CopySource=multipart_copy.copy_source,
+                Bucket=multipart_copy.bucket,
+                Key=multipart_copy.key,
+                UploadId=multipart_copy.upload_id,
+                PartNumber=part.part_number,
+                **extra_args,
+            )
+        except Exception:
+            if multipart_copy.record_failure():
+                self._abort_multipart_copy(client, multipart_copy)
+            raise
+        invoke_progress_callbacks(callbacks, part.size)
+        copy_part_result = response['CopyPartResult']
+        part_metadata = {
+            'ETag': copy_part_result['ETag'],
+            'PartNumber': part.part_number,
+        }
+        if checksum_algorithm:
+            checksum_member = f'Checksum{checksum_algorithm.upper()}'
+            if checksum_member in copy_part_result:
+                part_metadata[checksum_member] = copy_part_result[
+                    checksum_member
+                ]
+        if not multipart_copy.record_part(part_metadata):
+            return None
+        if multipart_copy.failed:
+            self._abort_multipart_copy(client, multipart_copy)
+            return None
+        try:
+            self._make_request(
+                config,
+                client.complete_multipart_upload,
+                Bucket=multipart_copy.bucket,
+                Key=multipart_copy.key,
+                UploadId=multipart_copy.upload_id,
+                MultipartUpload={'Parts': multipart_copy.parts},
+                **get_filtered_dict(
+                    part.extra_args, CopySubmissionTask.COMPLETE_MULTIPART_ARGS
+                ),
+            )
+        except Exception:
+            self._abort_multipart_copy(client, multipart_copy)
+            raise
+        multipart_copy.mark_finished()
+        return multipart_copy.size
+
+    def _abort_multipart_copy(self, client, multipart_copy):
+        try:
+            multipart_copy.abort_if_unfinished(client)
+        except Exception:
+            logger.debug(
+                'Failed to abort multipart copy to s3://%s/%s',
+                multipart_copy.bucket,
+                multipart_copy.key,
+                exc_info=True,
+            )
+
+    def _make_request(self, config, method, **kwargs):
+        # Retry requests that failed with transient errors once botocore's
+        # own retries are exhausted, so a throttled prefix does not fail
+        # objects of a long batch.
+        last_exception = None
+        for i in range(config.num_download_attempts):
+            try:
+                return method(**kwargs)
+            except (ClientError, BotocoreConnectionError) as e:
+                if (
+                    isinstance(e, ClientError)
+                    and e.response.get('Error', {}).get('Code')
+                    not in RETRYABLE_COPY_ERROR_CODES
+                ):
+                    raise
+                logger.debug(
+                    "Retrying exception caught (%s), "
+                    "retrying request, (attempt %s / %s)",
+                    e,
+                    i,
+                    config.num_download_attempts,
+                    exc_info=True,
+                )
+                last_exception = e
+                time.sleep(random.uniform(0, min(0.1 * 2**i, 5)))
+        raise RetriesExceededError(last_exception)
+
+
+class CompleteBatchTask(Task):
+    """Task to complete a batch transfer once all workers are done"""
+
+    def _main(self, stats, source_deleter=None):
+        """
+        :param stats: The BatchTransferStats of the batch
+        :param source_deleter: The BatchSourceDeleter of a copy batch that
+            deletes its sources, if any
+
+        :rtype: BatchTransferStats
+        :returns: The stats of the batch if all objects were transferred
+        """
+        if source_deleter is not None:
+            source_deleter.flush()
+        stats.finish()
+        if stats.failures:
+            raise BatchTransferError(stats)
+        return stats
@@ -0,0 +1,316 @@
+# Copyright 2016 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Benchmarks of transfer configurations against a local S3 stand-in.
+
+``S3StandIn`` serves the S3 operations a ``TransferManager`` uses for
+uploads and downloads (PutObject, the multipart upload operations,
+HeadObject and ranged GetObject) from memory, over a simulated network
+described by a ``NetworkProfile``: a latency added to every request, a
+bandwidth shared by all connections and a bandwidth per connection.
+``run_benchmark`` times transfers through a ``TransferManager`` with a
+given ``TransferConfig``, so that static and adaptive configurations can
+be compared. Run ``python -m s3transfer.benchmarks --help`` for the
+command line interface.
+"""
+import collections
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import botocore.session
+from botocore.config import Config
+
+from s3transfer.constants import KB, MB
+from s3transfer.manager import TransferManager
+
+NetworkProfile = collections.namedtuple(
+    'NetworkProfile', ['latency', 'bandwidth', 'connection_bandwidth']
+)
+NetworkProfile.__doc__ = """A simulated network.
+
+:param latency: The seconds added before the response of every request.
+:param bandwidth: The bytes per second shared by all connections.
+:param connection_bandwidth: The bytes per second of a single connection.
+"""
+
+PROFILES = {
+    'lan': NetworkProfile(0.001, 500 * MB, 100 * MB),
+    'broadband': NetworkProfile(0.02, 50 * MB, 8 * MB),
+    'wan': NetworkProfile(0.08, 20 * MB, 2 * MB),
+    'satellite': NetworkProfile(0.3, 10 * MB, 2 * MB),
+}
+
+# The bytes read or written between waits for bandwidth.
+_BLOCK_SIZE = 64 * KB
+
+
+class _TokenBucket:
+    """Paces the bytes sent through it to a rate, in bytes per second."""
+
+    def __init__(self, rate):
+        self._rate = rate
+        self._lock = threading.Lock()
+        self._next_free = time.monotonic()
+
+    def consume(self, amount):
+        with self._lock:
+            now = time.monotonic()
+            self._next_free = max(self._next_free, now) + amount / self._rate
+            wait = self._next_free - now
+        if wait > 0:
+            time.sleep(wait)
+
+
+class _S3StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _throttled(self, connection):
+        # Bytes must pass both the link shared by all connections and
+        # the connection of this request.
+        def consume(amount):
+            self.server.link.consume(amount)
+            connection.consume(amount)
+
+        return consume
+
+    def _read_body(self):
+        remaining = int(self.headers.get('Content-Length', 0))
+        consume = self._throttled(
+            _TokenBucket(self.server.profile.connection_bandwidth)
+        )
+        blocks = []
+        while remaining:
+            block = self.rfile.read(min(remaining, _BLOCK_SIZE))
+            if not block:
+                break
+            consume(len(block))
+            blocks.append(block)
+            remaining -= len(block)
+        return b''.join(blocks)
+
+    def _send(self, status, body=b'', headers=None):
+        time.sleep(self.server.profile.latency)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command == 'HEAD':
+            return
+        consume = self._throttled(
+            _TokenBucket(self.server.profile.connection_bandwidth)
+        )
+        view = memoryview(body)
+        for start in range(0, len(body), _BLOCK_SIZE):
+            block = view[start : start + _BLOCK_SIZE]
+            consume(len(block))
+            self.wfile.write(block)
+
+    def _send_error(self, status, code):
+        self._send(status, b'<Error><Code>%s</Code></Error>' % code.encode())
+
+    def _parse_path(self):
+        url = urlparse(self.path)
+        return url.path, parse_qs(url.query, keep_blank_values=True)
+
+    def do_PUT(self):
+        path, query = self._parse_path()
+        body = self._read_body()
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if 'uploadId' in query:
+            parts = self.server.uploads.get(query['uploadId'][0])
+            if parts is None:
+                return self._send_error(404, 'NoSuchUpload')
+            parts[int(query['partNumber'][0])] = body
+        else:
+            self.server.objects[path] = (body, etag)
+        self._send(200, headers={'ETag': etag})
+
+    def do_POST(self):
+        path, query = self._parse_path()
+        self._read_body()
+        if 'uploads' in query:
+            upload_id = uuid.uuid4().hex
+            self.server.uploads[upload_id] = {}
+            return self._send(
+                200,
+                b'<InitiateMultipartUploadResult><UploadId>%s</UploadId>'
+                b'</InitiateMultipartUploadResult>' % upload_id.encode(),
+            )
+        parts = self.server.uploads.pop(query['uploadId'][0], None)
+        if parts is None:
+            return self._send_error(404, 'NoSuchUpload')
+        etag = '"%s-%d"' % (uuid.uuid4().hex, len(parts))
+        self.server.objects[path] = (
+            b''.join(parts[number] for number in sorted(parts)),
+            etag,
+        )
+        self._send(
+            200,
+            b'<CompleteMultipartUploadResult><ETag>%s</ETag>'
+            b'</CompleteMultipartUploadResult>'
+            % etag.replace('"', '&quot;').encode(),
+        )
+
+    def do_DELETE(self):
+        path, query = self._parse_path()
+        self._read_body()
+        if 'uploadId' in query:
+            self.server.uploads.pop(query['uploadId'][0], None)
+        else:
+            self.server.objects.pop(path, None)
+        self._send(204)
+
+    def do_HEAD(self):
+        path, _ = self._parse_path()
+        if path not in self.server.objects:
+            return self._send(404)
+        body, etag = self.server.objects[path]
+        time.sleep(self.server.profile.latency)
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+
+    def do_GET(self):
+        path, _ = self._parse_path()
+        if path not in self.server.objects:
+            return self._send_error(404, 'NoSuchKey')
+        body, etag = self.server.objects[path]
+        match = re.match(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+        if match is None:
+            return self._send(200, body, {'ETag': etag})
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else len(body) - 1
+        end = min(end, len(body) - 1)
+        self._send(
+            206,
+            body[start : end + 1],
+            {
+                'ETag': etag,
+                'Content-Range': 'bytes %d-%d/%d' % (start, end, len(body)),
+            },
+        )
+
+
+class S3StandIn:
+    """A local, in-memory S3 stand-in over a simulated network.
+
+    It is a context manager that serves requests from a background
+    thread while it is entered.
+
+    :type profile: NetworkProfile
+    :param profile: The simulated network.
+    """
+
+    def __init__(self, profile):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _S3StandInHandler)
+        self._server.daemon_threads = True
+        self._server.profile = profile
+        self._server.link = _TokenBucket(profile.bandwidth)
+        self._server.objects = {}
+        self._server.uploads = {}
+        self._thread = None
+
+    @property
+    def endpoint_url(self):
+        return 'http://127.0.0.1:%d' % self._server.server_port
+
+    def create_client(self, max_pool_connections=10):
+        """Create an S3 client whose requests go to the stand-in."""
+        session = botocore.session.get_session()
+        return session.create_client(
+            's3',
+            endpoint_url=self.endpoint_url,
+            region_name='us-east-1',
+            aws_access_key_id='benchmark',
+            aws_secret_access_key='benchmark',
+            config=Config(
+                s3={'addressing_style': 'path'},
+                max_pool_connections=max_pool_connections,
+            ),
+        )
+
+    def __enter__(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+BenchmarkResult = collections.namedtuple(
+    'BenchmarkResult',
+    ['upload_seconds', 'download_seconds', 'size', 'tuner_stats'],
+)
+
+
+def run_benchmark(profile, config, size):
+    """Time an upload and a download of a file through a TransferManager.
+
+    :type profile: NetworkProfile
+    :param profile: The simulated network of the S3 stand-in.
+
+    :type config: s3transfer.manager.TransferConfig
+    :param config: The configuration of the transfer manager.
+
+    :type size: int
+    :param size: The size of the file, in bytes.
+
+    :rtype: BenchmarkResult
+    """
+    tempdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tempdir, 'upload')
+        with open(filename, 'wb') as f:
+            f.write(os.urandom(size))
+        max_connections = max(
+            config.max_request_concurrency,
+            config.max_adaptive_request_concurrency
+            if config.adaptive_tuning
+            else 0,
+        )
+        with S3StandIn(profile) as stand_in:
+            client = stand_in.create_client(max_connections)
+            with TransferManager(client, config) as manager:
+                start = time.monotonic()
+                manager.upload(filename, 'benchmark', 'object').result()
+                upload_seconds = time.monotonic() - start
+                start = time.monotonic()
+                manager.download(
+                    'benchmark', 'object', os.path.join(tempdir, 'download')
+                ).result()
+                download_seconds = time.monotonic() - start
+                tuner_stats = None
+                if manager.transfer_tuner is not None:
+                    tuner_stats = manager.transfer_tuner.stats()
+        return BenchmarkResult(
+            upload_seconds, download_seconds, size, tuner_stats
+        )
+    finally:
+        shutil.rmtree(tempdir, ignore_errors=True)
@@ -0,0 +1,87 @@
+# Copyright 2016 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Compare static and adaptive transfer configurations.
+
+Usage::
+
+    python -m s3transfer.benchmarks --profile wan --size 64
+"""
+import argparse
+
+from s3transfer.benchmarks import PROFILES, run_benchmark
+from s3transfer.constants import MB
+from s3transfer.manager import TransferConfig
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m s3transfer.benchmarks', description=__doc__
+    )
+    parser.add_argument(
+        '--profile',
+        action='append',
+        choices=sorted(PROFILES),
+        help='The simulated network, may be repeated (default: all).',
+    )
+    parser.add_argument(
+        '--size',
+        type=int,
+        action='append',
+        help='The size of the transferred file in MB, may be repeated '
+        '(default: 1 and 64).',
+    )
+    parser.add_argument(
+        '--max-memory',
+        type=int,
+        default=256,
+        help='The max_adaptive_memory of the adaptive configuration in MB.',
+    )
+    parsed = parser.parse_args(args)
+    configs = {
+        'static': TransferConfig(),
+        'adaptive': TransferConfig(
+            adaptive_tuning=True,
+            max_adaptive_memory=parsed.max_memory * MB,
+        ),
+    }
+    print(
+        '%-10s %8s %-9s %12s %12s  %s'
+        % ('profile', 'size', 'config', 'upload', 'download', 'tuner')
+    )
+    for profile_name in parsed.profile or sorted(PROFILES):
+        for size in parsed.size or [1, 64]:
+            for config_name, config in configs.items():
+                result = run_benchmark(
+                    PROFILES[profile_name], config, size * MB
+                )
+                tuner = ''
+                if result.tuner_stats is not None:
+                    tuner = (
+                        'concurrency=%(concurrency)s '
+                        'adjustments=%(adjustments)s' % result.tuner_stats
+                    )
+                print(
+                    '%-10s %6dMB %-9s %8.1fMB/s %8.1fMB/s  %s'
+                    % (
+                        profile_name,
+                        size,
+                        config_name,
+                        result.size / MB / result.upload_seconds,
+                        result.size / MB / result.download_seconds,
+                        tuner,
+                    )
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+# Copyright 2016 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Checksums of upload parts, calculated ahead of the upload requests.
+
+Without them, botocore calculates the checksum of a part in the thread
+that sends it, while it is being sent or in an extra pass over the body
+before it is sent.  With ``offload_checksums`` enabled, a transfer manager
+calculates part checksums in a pool of checksum threads as soon as the
+parts are submitted, and the part requests carry the finished values.
+``zlib`` and ``hashlib`` release the GIL while hashing large buffers, so
+the checksum threads run in parallel with the transfer threads.
+
+The checksum of a multipart object is a composite: the checksum of the
+concatenated binary checksums of its parts, suffixed with the number of
+parts. It is the value S3 reports for the object, and depends on the part
+size as well as on the data, so objects can only be compared by it if they
+were uploaded with the same part size.
+"""
+import base64
+import hashlib
+import zlib
+
+from s3transfer.utils import crt_checksums
+
+
+class CrcChecksum:
+    """A 32 bit CRC with the interface of ``hashlib`` objects"""
+
+    def __init__(self, crc_function):
+        self._crc_function = crc_function
+        self._crc = 0
+
+    def update(self, chunk):
+        self._crc = self._crc_function(chunk, self._crc) & 0xFFFFFFFF
+
+    def digest(self):
+        return self._crc.to_bytes(4, byteorder='big')
+
+
+def get_checksum(algorithm):
+    """Create a checksum object for an algorithm
+
+    :type algorithm: str
+    :param algorithm: The ``ChecksumAlgorithm`` of a request, such as
+        ``CRC32``, ``CRC32C`` (only if the CRT is installed), ``SHA1`` or
+        ``SHA256``.
+
+    :returns: An object with ``update()`` and ``digest()`` methods, or None
+        if the algorithm is not supported.
+    """
+    algorithm = algorithm.lower()
+    if algorithm == 'crc32':
+        return CrcChecksum(zlib.crc32)
+    if algorithm == 'crc32c' and crt_checksums is not None:
+        return CrcChecksum(crt_checksums.crc32c)
+    if algorithm in ('sha1', 'sha256'):
+        return hashlib.new(algorithm)
+    return None
+
+
+def calculate_checksum(fileobj, algorithm, chunk_size):
+    """Calculate the checksum of a part body
+
+    Bodies that can calculate their checksum without being read, such as
+    memory-mapped parts, do so. Otherwise the body is read from its start
+    and rewound. Either way, the file underlying the body is then released
+    until the body is sent, so bodies waiting for their requests do not
+    hold open files.
+
+    :param fileobj: The seekable body of the part
+    :param algorithm: The ``ChecksumAlgorithm`` of the upload
+    :param chunk_size: The amount to read from the body at a time
+
+    :returns: The base64 encoded checksum, or None if the algorithm is not
+        supported.
+    """
+    try:
+        return _calculate_checksum(fileobj, algorithm, chunk_size)
+    finally:
+        if hasattr(fileobj, 'release_file'):
+            fileobj.release_file()
+
+
+def _calculate_checksum(fileobj, algorithm, chunk_size):
+    if hasattr(fileobj, 'calculate_checksum'):
+        checksum = fileobj.calculate_checksum(algorithm)
+        if checksum is not None:
+            return checksum
+    checksum = get_checksum(algorithm)
+    if checksum is None:
+        return None
+    fileobj.seek(0)
+    try:
+        for chunk in iter(lambda: fileobj.read(chunk_size), b''):
+            checksum.update(chunk)
+    finally:
+        fileobj.seek(0)
+    return base64.b64encode(checksum.digest()).decode('ascii')
+
+
+def combine_part_checksums(part_checksums, algorithm):
+    """Calculate the composite checksum of a multipart object
+
+    :type part_checksums: list
+    :param part_checksums: The base64 encoded checksums of the parts, in
+        part number order.
+
+    :param algorithm: The ``ChecksumAlgorithm`` of the upload
+
+    :returns: The composite checksum, in the ``<base64>-<parts>`` format
+        S3 reports it in, or None if the algorithm is not supported.
+    """
+    checksum = get_checksum(algorithm)
+    if checksum is None:
+        return None
+    for part_checksum in part_checksums:
+        checksum.update(base64.b64decode(part_checksum))
+    digest = base64.b64encode(checksum.digest()).decode('ascii')
+    return f'{digest}-{len(part_checksums)}'
@@ -14,15 +14,18 @@ import heapq
 import logging
 import threading
 
+from s3transfer.adaptive import track_request
 from s3transfer.compat import seekable
 from s3transfer.exceptions import RetriesExceededError
 from s3transfer.futures import IN_MEMORY_DOWNLOAD_TAG
+from s3transfer.journal import DOWNLOAD
 from s3transfer.tasks import SubmissionTask, Task
 from s3transfer.utils import (
     S3_RETRYABLE_DOWNLOAD_ERRORS,
     CountCallbackInvoker,
     DeferredOpenFile,
     FunctionContainer,
+    PositionalFileWriter,
     StreamReaderProgress,
     calculate_num_parts,
     calculate_range_parameter,
@@ -186,6 +189,104 @@ class DownloadFilenameOutputManager(DownloadOutputManager):
         return f
 
 
+class DownloadPositionalFilenameOutputManager(DownloadFilenameOutputManager):
+    """Output manager for filenames that writes with ``os.pwrite``
+
+    The threads downloading the object write their data straight into a
+    preallocated temporary file at its offset, instead of queueing each
+    chunk for the single IO thread to seek to and write. Disk writes then
+    scale with the number of concurrent requests.
+    """
+
+    @classmethod
+    def is_compatible(cls, download_target, osutil):
+        # Only used in place of DownloadFilenameOutputManager, when
+        # configured.
+        return False
+
+    def get_fileobj_for_io_writes(self, transfer_future):
+        fileobj = transfer_future.meta.call_args.fileobj
+        self._final_filename = fileobj
+        self._temp_filename = self._osutil.get_temp_filename(fileobj)
+        self._temp_fileobj = PositionalFileWriter(
+            self._temp_filename, transfer_future.meta.size, self._osutil
+        )
+        self._transfer_coordinator.add_failure_cleanup(
+            self._temp_fileobj.close
+        )
+        self._transfer_coordinator.add_failure_cleanup(
+            self._osutil.remove_file, self._temp_filename
+        )
+        return self._temp_fileobj
+
+    def queue_file_io_task(self, fileobj, data, offset):
+        fileobj.write_at(data, offset)
+
+    def get_io_write_task(self, fileobj, data, offset):
+        return IOPositionalWriteTask(
+            self._transfer_coordinator,
+            main_kwargs={
+                'fileobj': fileobj,
+                'data': data,
+                'offset': offset,
+            },
+        )
+
+
+class DownloadJournaledFilenameOutputManager(
+    DownloadPositionalFilenameOutputManager
+):
+    """Output manager for filenames whose download is journaled
+
+    The temporary file is named after the journal and is kept if the
+    download fails, so a resumed download can write the ranges it is
+    missing into it.
+    """
+
+    def __init__(
+        self,
+        osutil,
+        transfer_coordinator,
+        io_executor,
+        journal,
+        temp_filename,
+        preallocated=False,
+    ):
+        super().__init__(osutil, transfer_coordinator, io_executor)
+        self._journal = journal
+        self._temp_filename = temp_filename
+        self._preallocated = preallocated
+
+    @property
+    def journal(self):
+        return self._journal
+
+    def get_fileobj_for_io_writes(self, transfer_future):
+        self._final_filename = transfer_future.meta.call_args.fileobj
+        self._temp_fileobj = PositionalFileWriter(
+            self._temp_filename,
+            transfer_future.meta.size,
+            self._osutil,
+            preallocated=self._preallocated,
+        )
+        self._transfer_coordinator.add_failure_cleanup(
+            self._temp_fileobj.close
+        )
+        return self._temp_fileobj
+
+    def get_final_io_task(self):
+        return IORenameFileTask(
+            transfer_coordinator=self._transfer_coordinator,
+            main_kwargs={
+                'fileobj': self._temp_fileobj,
+                'final_filename': self._final_filename,
+                'osutil': self._osutil,
+                'journal': self._journal,
+            },
+            is_final=True,
+        )
+
+
 class DownloadSeekableOutputManager(DownloadOutputManager):
     @classmethod
     def is_compatible(cls, download_target, osutil):
@@ -282,7 +383,9 @@ class DownloadSpecialFilenameOutputManager(DownloadNonSeekableOutputManager):
 class DownloadSubmissionTask(SubmissionTask):
     """Task for submitting tasks to execute a download"""
 
-    def _get_download_output_manager_cls(self, transfer_future, osutil):
+    def _get_download_output_manager_cls(
+        self, transfer_future, osutil, config=None
+    ):
         """Retrieves a class for managing output for a download
 
         :type transfer_future: s3transfer.futures.TransferFuture
@@ -291,6 +394,10 @@ class DownloadSubmissionTask(SubmissionTask):
         :type osutil: s3transfer.utils.OSUtils
         :param osutil: The os utility associated to the transfer
 
+        :type config: s3transfer.manager.TransferConfig
+        :param config: The transfer config associated with the transfer
+            manager
+
         :rtype: class of DownloadOutputManager
         :returns: The appropriate class to use for managing a specific type of
             input for downloads.
@@ -305,6 +412,13 @@ class DownloadSubmissionTask(SubmissionTask):
         fileobj = transfer_future.meta.call_args.fileobj
         for download_manager_cls in download_manager_resolver_chain:
             if download_manager_cls.is_compatible(fileobj, osutil):
+                if (
+                    download_manager_cls is DownloadFilenameOutputManager
+                    and config is not None
+                    and config.use_pwrite_downloads
+                    and PositionalFileWriter.is_supported()
+                ):
+                    return DownloadPositionalFilenameOutputManager
                 return download_manager_cls
         raise RuntimeError(
             'Output {} of type: {} is not supported.'.format(
@@ -321,6 +435,8 @@ class DownloadSubmissionTask(SubmissionTask):
         io_executor,
         transfer_future,
         bandwidth_limiter=None,
+        transfer_tuner=None,
+        journal_store=None,
     ):
         """
         :param client: The client associated with the transfer manager
@@ -347,7 +463,16 @@ class DownloadSubmissionTask(SubmissionTask):
         :type bandwidth_limiter: s3transfer.bandwidth.BandwidthLimiter
         :param bandwidth_limiter: The bandwidth limiter to use when
             downloading streams
+
+        :type transfer_tuner: s3transfer.adaptive.TransferTuner
+        :param transfer_tuner: The tuner to measure requests with and take
+            part sizes from
+
+        :type journal_store: s3transfer.journal.TransferJournalStore
+        :param journal_store: The store to journal ranged downloads to
+            filenames in, so that they can be resumed
         """
+        etag = None
         if transfer_future.meta.size is None:
             # If a size was not provided figure out the size for the
             # user.
@@ -359,9 +484,10 @@ class DownloadSubmissionTask(SubmissionTask):
             transfer_future.meta.provide_transfer_size(
                 response['ContentLength']
             )
+            etag = response.get('ETag')
 
         download_output_manager = self._get_download_output_manager_cls(
-            transfer_future, osutil
+            transfer_future, osutil, config
         )(osutil, self._transfer_coordinator, io_executor)
 
         # If it is greater than threshold do a ranged download, otherwise
@@ -376,8 +502,19 @@ class DownloadSubmissionTask(SubmissionTask):
                 download_output_manager,
                 transfer_future,
                 bandwidth_limiter,
+                transfer_tuner,
             )
         else:
+            # Resumed downloads need the completed ranges to be on disk once
+            # their requests are done, so only downloads written by the
+            # requesting threads to a file are journaled.
+            if not (
+                isinstance(
+                    download_output_manager, DownloadFilenameOutputManager
+                )
+                and PositionalFileWriter.is_supported()
+            ):
+                journal_store = None
             self._submit_ranged_download_request(
                 client,
                 config,
@@ -387,6 +524,9 @@ class DownloadSubmissionTask(SubmissionTask):
                 download_output_manager,
                 transfer_future,
                 bandwidth_limiter,
+                transfer_tuner,
+                journal_store,
+                etag,
             )
 
     def _submit_download_request(
@@ -399,6 +539,7 @@ class DownloadSubmissionTask(SubmissionTask):
         download_output_manager,
         transfer_future,
         bandwidth_limiter,
+        transfer_tuner=None,
     ):
         call_args = transfer_future.meta.call_args
 
@@ -433,6 +574,7 @@ class DownloadSubmissionTask(SubmissionTask):
                     'download_output_manager': download_output_manager,
                     'io_chunksize': config.io_chunksize,
                     'bandwidth_limiter': bandwidth_limiter,
+                    'transfer_tuner': transfer_tuner,
                 },
                 done_callbacks=[final_task],
             ),
@@ -449,20 +591,58 @@ class DownloadSubmissionTask(SubmissionTask):
         download_output_manager,
         transfer_future,
         bandwidth_limiter,
+        transfer_tuner=None,
+        journal_store=None,
+        etag=None,
     ):
         call_args = transfer_future.meta.call_args
 
         # Get the needed progress callbacks for the task
         progress_callbacks = get_callbacks(transfer_future, 'progress')
 
+        # Determine the number of parts
+        part_size = config.multipart_chunksize
+        if transfer_tuner is not None:
+            part_size = transfer_tuner.recommend_chunksize(
+                part_size, transfer_future.meta.size
+            )
+
+        journal = None
+        completed_offsets = set()
+        journal_args = {}
+        if journal_store is not None:
+            if etag is None:
+                etag = client.head_object(
+                    Bucket=call_args.bucket,
+                    Key=call_args.key,
+                    **call_args.extra_args,
+                ).get('ETag')
+            journaled_download = self._open_download_journal(
+                osutil,
+                io_executor,
+                config,
+                transfer_future,
+                journal_store,
+                part_size,
+                etag,
+            )
+            (
+                download_output_manager,
+                part_size,
+                completed_offsets,
+            ) = journaled_download
+            journal = download_output_manager.journal
+            # Fail rather than mix the ranges of different versions of the
+            # object in the file.
+            if etag is not None:
+                journal_args['IfMatch'] = etag
+
         # Get a handle to the file that will be used for writing downloaded
         # contents
         fileobj = download_output_manager.get_fileobj_for_io_writes(
             transfer_future
         )
 
-        # Determine the number of parts
-        part_size = config.multipart_chunksize
         num_parts = calculate_num_parts(transfer_future.meta.size, part_size)
 
         # Get any associated tags for the get object task.
@@ -476,6 +656,14 @@ class DownloadSubmissionTask(SubmissionTask):
             )
         )
         for i in range(num_parts):
+            if i * part_size in completed_offsets:
+                # The range was downloaded before the download was resumed.
+                invoke_progress_callbacks(
+                    progress_callbacks,
+                    min(part_size, transfer_future.meta.size - i * part_size),
+                )
+                continue
+
             # Calculate the range parameter
             range_parameter = calculate_range_parameter(
                 part_size, i, num_parts
@@ -484,6 +672,7 @@ class DownloadSubmissionTask(SubmissionTask):
             # Inject the Range parameter to the parameters to be passed in
             # as extra args
             extra_args = {'Range': range_parameter}
+            extra_args.update(journal_args)
             extra_args.update(call_args.extra_args)
             finalize_download_invoker.increment()
             # Submit the ranged downloads
@@ -503,6 +692,8 @@ class DownloadSubmissionTask(SubmissionTask):
                         'download_output_manager': download_output_manager,
                         'io_chunksize': config.io_chunksize,
                         'bandwidth_limiter': bandwidth_limiter,
+                        'transfer_tuner': transfer_tuner,
+                        'journal': journal,
                     },
                     done_callbacks=[finalize_download_invoker.decrement],
                 ),
@@ -510,6 +701,75 @@ class DownloadSubmissionTask(SubmissionTask):
             )
         finalize_download_invoker.finalize()
 
+    def _open_download_journal(
+        self,
+        osutil,
+        io_executor,
+        config,
+        transfer_future,
+        journal_store,
+        part_size,
+        etag,
+    ):
+        call_args = transfer_future.meta.call_args
+        size = transfer_future.meta.size
+        identity = {'etag': etag, 'size': size}
+        settings = {'part_size': part_size}
+        journal, settings, entries = journal_store.open(
+            DOWNLOAD,
+            call_args.bucket,
+            call_args.key,
+            call_args.fileobj,
+            identity,
+            settings,
+            resume=config.resume,
+        )
+        # The temporary file is named after the journal, so a resumed
+        # download finds the file the ranges were written to.
+        temp_filename = osutil.get_temp_filename(
+            call_args.fileobj, extension=journal.transfer_id[:8]
+        )
+        completed_offsets = {
+            entry['start_index'] for entry in entries if 'start_index' in entry
+        }
+        if completed_offsets and not self._is_file_of_size(
+            osutil, temp_filename, size
+        ):
+            logger.debug(
+                'Temporary file %s of journal %s is missing, restarting '
+                'download',
+                temp_filename,
+                journal.path,
+            )
+            completed_offsets = set()
+            journal, settings, _ = journal_store.open(
+                DOWNLOAD,
+                call_args.bucket,
+                call_args.key,
+                call_args.fileobj,
+                identity,
+                {'part_size': part_size},
+            )
+        download_output_manager = DownloadJournaledFilenameOutputManager(
+            osutil,
+            self._transfer_coordinator,
+            io_executor,
+            journal,
+            temp_filename,
+            preallocated=bool(completed_offsets),
+        )
+        return (
+            download_output_manager,
+            settings['part_size'],
+            completed_offsets,
+        )
+
+    def _is_file_of_size(self, osutil, filename, size):
+        try:
+            return osutil.get_file_size(filename) == size
+        except OSError:
+            return False
+
     def _get_final_io_task_submission_callback(
         self, download_manager, io_executor
     ):
@@ -543,6 +803,8 @@ class GetObjectTask(Task):
         io_chunksize,
         start_index=0,
         bandwidth_limiter=None,
+        transfer_tuner=None,
+        journal=None,
     ):
         """Downloads an object and places content into io queue
 
@@ -561,39 +823,49 @@ class GetObjectTask(Task):
             content of the key to.
         :param bandwidth_limiter: The bandwidth limiter to use when throttling
             the downloading of data in streams.
+        :param transfer_tuner: The tuner to measure the request with, if
+            any.
+        :param journal: The journal to record the downloaded range in, if
+            the download is resumable.
         """
         last_exception = None
         for i in range(max_attempts):
+            current_index = start_index
             try:
-                current_index = start_index
-                response = client.get_object(
-                    Bucket=bucket, Key=key, **extra_args
-                )
-                streaming_body = StreamReaderProgress(
-                    response['Body'], callbacks
-                )
-                if bandwidth_limiter:
-                    streaming_body = (
-                        bandwidth_limiter.get_bandwith_limited_stream(
-                            streaming_body, self._transfer_coordinator
-                        )
+                with track_request(transfer_tuner) as request:
+                    response = client.get_object(
+                        Bucket=bucket, Key=key, **extra_args
                     )
-
-                chunks = DownloadChunkIterator(streaming_body, io_chunksize)
-                for chunk in chunks:
-                    # If the transfer is done because of a cancellation
-                    # or error somewhere else, stop trying to submit more
-                    # data to be written and break out of the download.
-                    if not self._transfer_coordinator.done():
-                        self._handle_io(
-                            download_output_manager,
-                            fileobj,
-                            chunk,
-                            current_index,
+                    streaming_body = StreamReaderProgress(
+                        response['Body'], callbacks
+                    )
+                    if bandwidth_limiter:
+                        streaming_body = (
+                            bandwidth_limiter.get_bandwith_limited_stream(
+                                streaming_body, self._transfer_coordinator
+                            )
                         )
-                        current_index += len(chunk)
-                    else:
-                        return
+
+                    chunks = DownloadChunkIterator(
+                        streaming_body, io_chunksize
+                    )
+                    for chunk in chunks:
+                        # If the transfer is done because of a cancellation
+                        # or error somewhere else, stop trying to submit more
+                        # data to be written and break out of the download.
+                        if not self._transfer_coordinator.done():
+                            self._handle_io(
+                                download_output_manager,
+                                fileobj,
+                                chunk,
+                                current_index,
+                            )
+                            current_index += len(chunk)
+                            request.bytes_transferred += len(chunk)
+                        else:
+                            return
+                if journal is not None:
+                    journal.record({'start_index': start_index})
                 return
             except S3_RETRYABLE_DOWNLOAD_ERRORS as e:
                 logger.debug(
@@ -643,6 +915,17 @@ class IOWriteTask(Task):
         fileobj.write(data)
 
 
+class IOPositionalWriteTask(Task):
+    def _main(self, fileobj, data, offset):
+        """Write contents to a PositionalFileWriter at an offset
+
+        :param fileobj: The PositionalFileWriter to write content to
+        :param data: The data to write
+        :param offset: The offset to write the data to.
+        """
+        fileobj.write_at(data, offset)
+
+
 class IOStreamingWriteTask(Task):
     """Task for writing data to a non-seekable stream."""
 
@@ -666,11 +949,15 @@ class IORenameFileTask(Task):
     :param final_filename: The final name of the file to rename to
         upon completion of writing the contents.
     :param osutil: OS utility
+    :param journal: The journal of the download, removed once the file is
+        in place.
     """
 
-    def _main(self, fileobj, final_filename, osutil):
+    def _main(self, fileobj, final_filename, osutil, journal=None):
         fileobj.close()
         osutil.rename_file(fileobj.name, final_filename)
+        if journal is not None:
+            journal.remove()
 
 
 class IOCloseTask(Task):
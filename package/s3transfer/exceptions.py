@@ -31,6 +31,21 @@ class TransferNotDoneError(Exception):
     pass
 
 
+class BatchTransferError(Exception):
+    """Raised when objects of a batch transfer failed to transfer
+
+    :ivar stats: The BatchTransferStats of the batch. Its ``failures``
+        are the exceptions of the objects that failed.
+    """
+
+    def __init__(self, stats):
+        super().__init__(
+            '%s of %s objects failed to transfer'
+            % (len(stats.failures), len(stats.failures) + stats.succeeded)
+        )
+        self.stats = stats
+
+
 class FatalError(CancelledError):
     """A CancelledError raised from an error in the TransferManager"""
 
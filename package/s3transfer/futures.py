@@ -126,6 +126,7 @@ class TransferMeta(BaseTransferMeta):
         self._transfer_id = transfer_id
         self._size = None
         self._user_context = {}
+        self._checksum = None
 
     @property
     def call_args(self):
@@ -156,6 +157,20 @@ class TransferMeta(BaseTransferMeta):
         """
         self._size = size
 
+    @property
+    def checksum(self):
+        """The checksum of the uploaded object if known
+
+        It is only known for uploads with a ``ChecksumAlgorithm``. For
+        multipart uploads it is the composite checksum of the parts, see
+        ``s3transfer.checksums``.
+        """
+        return self._checksum
+
+    def provide_object_checksum(self, checksum):
+        """A method to provide the checksum of the uploaded object"""
+        self._checksum = checksum
+
 
 class TransferCoordinator:
     """A helper class for managing TransferFuture"""
@@ -505,6 +520,7 @@ class ExecutorFuture:
             than concurrent.futures.Future.add_done_callback that requires
             a single argument for the future.
         """
+
         # The done callback for concurrent.futures.Future will always pass a
         # the future in as the only argument. So we need to create the
         # proper signature wrapper that will invoke the callback provided.
@@ -0,0 +1,187 @@
+# Copyright 2016 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""On-disk journals of multipart transfers, used to resume them.
+
+A journal is a file of JSON lines. The first line is a header describing
+the transfer (the version of the object or file and the part size) and
+every following line records progress as it is made: the upload id and
+the completed parts of an upload, or the offsets of the completed ranges
+of a download.  Entries are appended and flushed as parts complete, so a
+process that dies mid-transfer leaves a journal that is at most a line
+behind; a partially written last line is ignored when it is loaded.
+
+A transfer that completes removes its journal.  A transfer that fails
+keeps it (and, for uploads, leaves the multipart upload open; for
+downloads, leaves the temporary file) so a later transfer of the same
+object and file with ``resume=True`` can skip the parts already done.
+A journal that is not resumed is replaced, and the multipart upload it
+recorded is aborted.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+UPLOAD = 'upload'
+DOWNLOAD = 'download'
+
+
+class TransferJournalStore:
+    """The directory of the journals of a transfer manager's transfers
+
+    :type directory: str
+    :param directory: The directory to store journals in. It is created if
+        it does not exist.
+    """
+
+    def __init__(self, directory):
+        self._directory = os.path.expanduser(directory)
+
+    def _get_transfer_id(self, kind, bucket, key, filename):
+        transfer_id = json.dumps(
+            [kind, bucket, key, os.path.abspath(filename)]
+        )
+        return hashlib.sha256(transfer_id.encode('utf-8')).hexdigest()
+
+    def open(
+        self,
+        kind,
+        bucket,
+        key,
+        filename,
+        identity,
+        settings=None,
+        resume=False,
+        on_replace=None,
+    ):
+        """Open the journal of a transfer
+
+        :type kind: str
+        :param kind: ``UPLOAD`` or ``DOWNLOAD``
+
+        :type identity: dict
+        :param identity: What identifies this version of the object or file,
+            such as its size and ETag or modification time. A previous
+            journal is only resumed if it has the same identity.
+
+        :type settings: dict
+        :param settings: How the transfer is split into parts, such as the
+            part size. These are recorded in a new journal; a resumed
+            journal keeps the settings it was started with.
+
+        :type resume: bool
+        :param resume: If True, the entries of a matching previous journal
+            are returned and appended to. Otherwise, or if there is no
+            matching journal, a new one is started.
+
+        :type on_replace: function
+        :param on_replace: Called with the entries of a previous journal
+            that is replaced by a new one, so what it recorded (such as an
+            open multipart upload) can be cleaned up.
+
+        :rtype: (TransferJournal, dict, list)
+        :returns: The journal, its settings and the entries recorded in it
+            so far.
+        """
+        transfer_id = self._get_transfer_id(kind, bucket, key, filename)
+        path = os.path.join(self._directory, f'{kind}-{transfer_id}.journal')
+        loaded = None
+        if resume or on_replace is not None:
+            loaded = TransferJournal.load(path)
+        if loaded is not None:
+            header, entries = loaded
+            if resume and header.get('identity') == identity:
+                logger.debug(
+                    'Resuming %s of s3://%s/%s from journal %s',
+                    kind,
+                    bucket,
+                    key,
+                    path,
+                )
+                journal = TransferJournal(path, transfer_id)
+                return journal, header.get('settings', {}), entries
+            if on_replace is not None:
+                logger.debug('Replacing journal %s', path)
+                on_replace(entries)
+        if settings is None:
+            settings = {}
+        os.makedirs(self._directory, exist_ok=True)
+        journal = TransferJournal(path, transfer_id)
+        journal.start({'identity': identity, 'settings': settings})
+        return journal, settings, []
+
+
+class TransferJournal:
+    """The journal file of a single transfer"""
+
+    def __init__(self, path, transfer_id):
+        self._path = path
+        self._transfer_id = transfer_id
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def transfer_id(self):
+        """A digest of the object and file, stable across processes"""
+        return self._transfer_id
+
+    @classmethod
+    def load(cls, path):
+        """Read a journal
+
+        :rtype: (dict, list)
+        :returns: The header and entries of the journal, or None if there
+            is no (valid) journal at ``path``.
+        """
+        try:
+            with open(path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return None
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # The last line may have been cut short by a crash.
+                break
+        if not records or not isinstance(records[0], dict):
+            return None
+        return records[0], records[1:]
+
+    def start(self, header):
+        """Start a new journal, replacing any previous one"""
+        self._write(header, mode='w')
+
+    def record(self, entry):
+        """Append an entry to the journal"""
+        self._write(entry, mode='a')
+
+    def _write(self, record, mode):
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        with self._lock:
+            with open(self._path, mode, encoding='utf-8') as f:
+                f.write(line)
+
+    def remove(self):
+        """Remove the journal once its transfer has completed"""
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
@@ -12,10 +12,22 @@
 # language governing permissions and limitations under the License.
 import copy
 import logging
+import os
 import re
 import threading
 
-from s3transfer.bandwidth import BandwidthLimiter, LeakyBucket
+from s3transfer.adaptive import TransferTuner
+from s3transfer.bandwidth import (
+    DEFAULT_BANDWIDTH_CLASS,
+    BandwidthLimiter,
+    LeakyBucket,
+)
+from s3transfer.batch import (
+    BatchCopyTask,
+    BatchDownloadTask,
+    BatchSubmissionTask,
+    BatchUploadTask,
+)
 from s3transfer.constants import ALLOWED_DOWNLOAD_ARGS, KB, MB
 from s3transfer.copies import CopySubmissionTask
 from s3transfer.delete import DeleteSubmissionTask
@@ -29,6 +41,7 @@ from s3transfer.futures import (
     TransferFuture,
     TransferMeta,
 )
+from s3transfer.journal import TransferJournalStore
 from s3transfer.upload import UploadSubmissionTask
 from s3transfer.utils import (
     CallArgs,
@@ -58,6 +71,19 @@ class TransferConfig:
         max_in_memory_upload_chunks=10,
         max_in_memory_download_chunks=10,
         max_bandwidth=None,
+        adaptive_tuning=False,
+        max_adaptive_request_concurrency=32,
+        max_adaptive_memory=256 * MB,
+        use_mmap_uploads=False,
+        use_pwrite_downloads=False,
+        journal_dir=None,
+        resume=False,
+        bandwidth_scheduler=None,
+        bandwidth_class=None,
+        transfer_metrics=None,
+        offload_checksums=False,
+        max_checksum_concurrency=None,
+        max_batch_concurrency=None,
     ):
         """Configurations for the transfer manager
 
@@ -129,6 +155,86 @@ class TransferConfig:
         :param max_bandwidth: The maximum bandwidth that will be consumed
             in uploading and downloading file content. The value is in terms of
             bytes per second.
+
+        :param adaptive_tuning: If True, the number of S3 API data transfer
+            requests in flight and the part size of multipart transfers are
+            tuned from the throughput and latency of completed requests.
+            ``max_request_concurrency`` is then the initial number of
+            requests in flight and ``multipart_chunksize`` the part size
+            used until requests have been measured. See
+            ``s3transfer.adaptive.TransferTuner``.
+
+        :param max_adaptive_request_concurrency: The maximum number of S3 API
+            data transfer requests in flight when ``adaptive_tuning`` is
+            enabled.
+
+        :param max_adaptive_memory: The bound, in bytes, of part data held by
+            in-flight requests when ``adaptive_tuning`` is enabled. Tuned
+            part sizes and concurrency are limited so that their product
+            stays within it.
+
+        :param use_mmap_uploads: If True, the parts of multipart uploads of
+            filenames are read from memory mappings of the file instead of
+            buffered reads. This avoids copying part data in memory and
+            lets part checksums be calculated over the mapping. The file
+            must not be truncated while it is being uploaded.
+
+        :param use_pwrite_downloads: If True, downloads to filenames are
+            written by the threads making the requests, each with
+            ``os.pwrite`` at its offset in a preallocated file, instead of
+            being queued for the single IO thread. This is ignored on
+            platforms without ``os.pwrite``.
+
+        :param journal_dir: The directory to keep transfer journals in. When
+            set, multipart uploads of filenames and ranged downloads to
+            filenames record their progress in a journal: the upload id and
+            completed parts of an upload, the completed ranges of a
+            download. A failed or interrupted transfer then keeps its
+            multipart upload or temporary file instead of cleaning it up.
+            See ``s3transfer.journal``.
+
+        :param resume: If True, transfers with a journal in ``journal_dir``
+            from an earlier attempt continue from it, transferring only the
+            parts it does not record as complete. A journal is only used if
+            the file's size and modification time and the object's ETag
+            are unchanged, and an upload's recorded parts are checked
+            against the parts S3 lists for the upload.
+
+        :param bandwidth_scheduler: A
+            ``s3transfer.bandwidth.BandwidthScheduler`` to share bandwidth
+            with the transfers of other transfer managers, by the weight
+            and priority of their classes. When set, it is used instead of
+            ``max_bandwidth``.
+
+        :param bandwidth_class: The name of the class of the
+            ``bandwidth_scheduler`` to transfer as. By default, its
+            ``default`` class is used.
+
+        :param transfer_metrics: A ``s3transfer.progress.TransferMetrics``
+            to count the bytes, transfers and requests of the transfer
+            manager in. Its progress counters do not take locks, so it is
+            a cheaper way to report the progress of many concurrent
+            transfers than a progress subscriber. It may be shared by
+            several transfer managers.
+
+        :param offload_checksums: If True, the checksums of uploads with a
+            ``ChecksumAlgorithm`` are calculated in a pool of checksum
+            threads as soon as their parts are submitted, instead of by
+            botocore in the threads sending the parts. The upload's
+            ``meta.checksum`` is then set to the checksum of the object,
+            for multipart uploads the composite checksum of its parts. See
+            ``s3transfer.checksums``.
+
+        :param max_checksum_concurrency: The number of threads calculating
+            checksums when ``offload_checksums`` is enabled. By default,
+            the number of CPUs.
+
+        :param max_batch_concurrency: The number of worker threads of each
+            batch transfer (``upload_batch()``, ``download_batch()`` and
+            ``copy_batch()``). Batch workers hold their request threads
+            until the batch is done, so they are always fewer than the
+            request threads, leaving threads for other transfers. By
+            default, half of the request threads.
         """
         self.multipart_threshold = multipart_threshold
         self.multipart_chunksize = multipart_chunksize
@@ -142,10 +248,29 @@ class TransferConfig:
         self.max_in_memory_upload_chunks = max_in_memory_upload_chunks
         self.max_in_memory_download_chunks = max_in_memory_download_chunks
         self.max_bandwidth = max_bandwidth
+        self.adaptive_tuning = adaptive_tuning
+        self.max_adaptive_request_concurrency = (
+            max_adaptive_request_concurrency
+        )
+        self.max_adaptive_memory = max_adaptive_memory
+        self.use_mmap_uploads = use_mmap_uploads
+        self.use_pwrite_downloads = use_pwrite_downloads
+        self.journal_dir = journal_dir
+        self.resume = resume
+        self.bandwidth_scheduler = bandwidth_scheduler
+        self.bandwidth_class = bandwidth_class
+        self.transfer_metrics = transfer_metrics
+        self.offload_checksums = offload_checksums
+        self.max_checksum_concurrency = max_checksum_concurrency
+        self.max_batch_concurrency = max_batch_concurrency
         self._validate_attrs_are_nonzero()
 
     def _validate_attrs_are_nonzero(self):
         for attr, attr_val in self.__dict__.items():
+            if isinstance(attr_val, bool) or not isinstance(
+                attr_val, (int, float)
+            ):
+                continue
             if attr_val is not None and attr_val <= 0:
                 raise ValueError(
                     'Provided parameter %s of value %s must be greater than '
@@ -237,10 +362,34 @@ class TransferManager:
         # A counter to create unique id's for each transfer submitted.
         self._id_counter = 0
 
+        # The component responsible for tuning the number of requests in
+        # flight and part sizes if adaptive tuning is configured.
+        self._transfer_tuner = None
+        max_request_threads = self._config.max_request_concurrency
+        if self._config.adaptive_tuning:
+            self._transfer_tuner = TransferTuner(
+                initial_concurrency=self._config.max_request_concurrency,
+                max_concurrency=self._config.max_adaptive_request_concurrency,
+                max_memory=self._config.max_adaptive_memory,
+            )
+            # The tuner limits the data requests in flight, so there must
+            # be enough threads for its highest limit.
+            max_request_threads = max(
+                max_request_threads,
+                self._config.max_adaptive_request_concurrency,
+            )
+
+        # The journals of transfers, if they are to be resumable.
+        self._journal_store = None
+        if self._config.journal_dir is not None:
+            self._journal_store = TransferJournalStore(
+                self._config.journal_dir
+            )
+
         # The executor responsible for making S3 API transfer requests
         self._request_executor = BoundedExecutor(
             max_size=self._config.max_request_queue_size,
-            max_num_threads=self._config.max_request_concurrency,
+            max_num_threads=max_request_threads,
             tag_semaphores={
                 IN_MEMORY_UPLOAD_TAG: TaskSemaphore(
                     self._config.max_in_memory_upload_chunks
@@ -268,10 +417,31 @@ class TransferManager:
             executor_cls=executor_cls,
         )
 
+        # The executor calculating the checksums of upload parts ahead of
+        # their requests, if checksums are offloaded.
+        self._checksum_executor = None
+        if self._config.offload_checksums:
+            self._checksum_executor = BoundedExecutor(
+                max_size=self._config.max_request_queue_size,
+                max_num_threads=(
+                    self._config.max_checksum_concurrency or os.cpu_count()
+                ),
+                executor_cls=executor_cls,
+            )
+
         # The component responsible for limiting bandwidth usage if it
         # is configured.
         self._bandwidth_limiter = None
-        if self._config.max_bandwidth is not None:
+        if self._config.bandwidth_scheduler is not None:
+            bandwidth_class = self._config.bandwidth_class
+            if bandwidth_class is None:
+                bandwidth_class = DEFAULT_BANDWIDTH_CLASS
+            logger.debug('Setting bandwidth class to %s', bandwidth_class)
+            leaky_bucket = self._config.bandwidth_scheduler.get_leaky_bucket(
+                bandwidth_class
+            )
+            self._bandwidth_limiter = BandwidthLimiter(leaky_bucket)
+        elif self._config.max_bandwidth is not None:
             logger.debug(
                 'Setting max_bandwidth to %s', self._config.max_bandwidth
             )
@@ -288,6 +458,11 @@ class TransferManager:
     def config(self):
         return self._config
 
+    @property
+    def transfer_tuner(self):
+        """The tuner of an adaptive manager, or None."""
+        return self._transfer_tuner
+
     def upload(self, fileobj, bucket, key, extra_args=None, subscribers=None):
         """Uploads a file to S3
 
@@ -330,6 +505,12 @@ class TransferManager:
         extra_main_kwargs = {}
         if self._bandwidth_limiter:
             extra_main_kwargs['bandwidth_limiter'] = self._bandwidth_limiter
+        if self._transfer_tuner:
+            extra_main_kwargs['transfer_tuner'] = self._transfer_tuner
+        if self._journal_store:
+            extra_main_kwargs['journal_store'] = self._journal_store
+        if self._checksum_executor:
+            extra_main_kwargs['checksum_executor'] = self._checksum_executor
         return self._submit_transfer(
             call_args, UploadSubmissionTask, extra_main_kwargs
         )
@@ -378,6 +559,10 @@ class TransferManager:
         extra_main_kwargs = {'io_executor': self._io_executor}
         if self._bandwidth_limiter:
             extra_main_kwargs['bandwidth_limiter'] = self._bandwidth_limiter
+        if self._transfer_tuner:
+            extra_main_kwargs['transfer_tuner'] = self._transfer_tuner
+        if self._journal_store:
+            extra_main_kwargs['journal_store'] = self._journal_store
         return self._submit_transfer(
             call_args, DownloadSubmissionTask, extra_main_kwargs
         )
@@ -481,6 +666,181 @@ class TransferManager:
         )
         return self._submit_transfer(call_args, DeleteSubmissionTask)
 
+    def upload_batch(self, items, extra_args=None, subscribers=None):
+        """Uploads many small files to S3 as a single transfer
+
+        Each file is uploaded with a single PutObject request, made by a
+        pool of ``max_batch_concurrency`` workers that share one
+        transfer future. This avoids the per-transfer overhead of
+        ``upload()``, which dominates for objects of a few kilobytes, but
+        files are never uploaded in parts, so it is meant for files below
+        the ``multipart_threshold``.
+
+        :type items: iterable
+        :param items: The ``(filename, bucket, key)`` tuples to upload.
+            Items are consumed as they are uploaded, so this may be a
+            generator.
+
+        :type extra_args: dict
+        :param extra_args: Extra arguments that may be passed to the
+            client operation of every upload
+
+        :type subscribers: list(s3transfer.subscribers.BaseSubscriber)
+        :param subscribers: The list of subscribers to be invoked for the
+            batch. ``on_progress`` is invoked as each file is uploaded.
+
+        :rtype: s3transfer.futures.TransferFuture
+        :returns: Transfer future representing the batch. Its result is
+            the ``s3transfer.batch.BatchTransferStats`` of the batch. If any
+            file failed to upload, ``result()`` raises a
+            ``s3transfer.exceptions.BatchTransferError`` once the others
+            are done.
+        """
+        if extra_args is None:
+            extra_args = {}
+        self._validate_all_known_args(extra_args, self.ALLOWED_UPLOAD_ARGS)
+        return self._submit_batch(
+            items, extra_args, subscribers, BatchUploadTask
+        )
+
+    def download_batch(self, items, extra_args=None, subscribers=None):
+        """Downloads many small objects from S3 as a single transfer
+
+        Each object is downloaded with a single GetObject request, made by
+        a pool of ``max_batch_concurrency`` workers that share one
+        transfer future, and without the HeadObject request ``download()``
+        makes. Objects are never downloaded in ranges, so this is meant for
+        objects below the ``multipart_threshold``.
+
+        :type items: iterable
+        :param items: The ``(bucket, key, filename)`` tuples to download.
+            Items are consumed as they are downloaded, so this may be a
+            generator.
+
+        :type extra_args: dict
+        :param extra_args: Extra arguments that may be passed to the
+            client operation of every download
+
+        :type subscribers: list(s3transfer.subscribers.BaseSubscriber)
+        :param subscribers: The list of subscribers to be invoked for the
+            batch. ``on_progress`` is invoked as objects are downloaded.
+
+        :rtype: s3transfer.futures.TransferFuture
+        :returns: Transfer future representing the batch. Its result is
+            the ``s3transfer.batch.BatchTransferStats`` of the batch. If any
+            object failed to download, ``result()`` raises a
+            ``s3transfer.exceptions.BatchTransferError`` once the others
+            are done.
+        """
+        if extra_args is None:
+            extra_args = {}
+        self._validate_all_known_args(extra_args, self.ALLOWED_DOWNLOAD_ARGS)
+        return self._submit_batch(
+            items, extra_args, subscribers, BatchDownloadTask
+        )
+
+    def copy_batch(
+        self,
+        items,
+        extra_args=None,
+        subscribers=None,
+        source_client=None,
+        delete_source=False,
+    ):
+        """Copies many objects in S3 as a single transfer
+
+        The objects are copied by a pool of ``max_batch_concurrency``
+        workers that share one transfer future. Objects below the
+        ``multipart_threshold`` are copied with a single CopyObject
+        request, larger ones with UploadPartCopy requests that are spread
+        over the same workers. Requests that fail with transient errors,
+        such as throttling, are retried up to ``num_download_attempts``
+        times. For example, to copy a prefix from a listing, without a
+        HeadObject request per object::
+
+            paginator = client.get_paginator('list_objects_v2')
+            items = (
+                ({'Bucket': 'src', 'Key': obj['Key']}, 'dst', obj['Key'],
+                 obj['Size'])
+                for page in paginator.paginate(Bucket='src', Prefix='p/')
+                for obj in page.get('Contents', [])
+            )
+            manager.copy_batch(items, delete_source=True).result()
+
+        :type items: iterable
+        :param items: The ``(copy_source, bucket, key)`` or
+            ``(copy_source, bucket, key, size)`` tuples to copy, where
+            ``copy_source`` is formatted as for ``copy()``. If the size of
+            an object is not given, it is determined with a HeadObject
+            request. Items are consumed as they are copied, so this may be
+            a generator.
+
+        :type extra_args: dict
+        :param extra_args: Extra arguments that may be passed to the
+            client operations of every copy
+
+        :type subscribers: list(s3transfer.subscribers.BaseSubscriber)
+        :param subscribers: The list of subscribers to be invoked for the
+            batch. ``on_progress`` is invoked as objects and parts are
+            copied.
+
+        :type source_client: botocore or boto3 Client
+        :param source_client: The client to be used for operations at the
+            source objects: the HeadObject requests and the deletion of
+            the sources. If no client is provided, the transfer manager's
+            client is used.
+
+        :type delete_source: bool
+        :param delete_source: If True, each source object is deleted once
+            it is copied, which moves the objects. Sources are deleted with
+            DeleteObjects requests of up to 1000 keys. A source copied onto
+            itself is not deleted.
+
+        :rtype: s3transfer.futures.TransferFuture
+        :returns: Transfer future representing the batch. Its result is
+            the ``s3transfer.batch.BatchTransferStats`` of the batch. If any
+            object failed to copy, or a source failed to be deleted,
+            ``result()`` raises a
+            ``s3transfer.exceptions.BatchTransferError`` once the others
+            are done.
+        """
+        if extra_args is None:
+            extra_args = {}
+        if source_client is None:
+            source_client = self._client
+        self._validate_all_known_args(extra_args, self.ALLOWED_COPY_ARGS)
+        return self._submit_batch(
+            items,
+            extra_args,
+            subscribers,
+            BatchCopyTask,
+            source_client=source_client,
+            delete_source=delete_source,
+        )
+
+    def _submit_batch(
+        self, items, extra_args, subscribers, worker_task_cls, **kwargs
+    ):
+        if subscribers is None:
+            subscribers = []
+        call_args = CallArgs(
+            items=items,
+            extra_args=extra_args,
+            subscribers=subscribers,
+            **kwargs,
+        )
+        extra_main_kwargs = {
+            'worker_task_cls': worker_task_cls,
+            'bucket_validator': self._validate_if_bucket_supported,
+        }
+        if self._bandwidth_limiter:
+            extra_main_kwargs['bandwidth_limiter'] = self._bandwidth_limiter
+        if self._transfer_tuner:
+            extra_main_kwargs['transfer_tuner'] = self._transfer_tuner
+        return self._submit_transfer(
+            call_args, BatchSubmissionTask, extra_main_kwargs
+        )
+
     def _validate_if_bucket_supported(self, bucket):
         # s3 high level operations don't support some resources
         # (eg. S3 Object Lambda) only direct API calls are available
@@ -508,6 +868,13 @@ class TransferManager:
         if not extra_main_kwargs:
             extra_main_kwargs = {}
 
+        # Report the transfer to the metrics, if any, along with the
+        # provided subscribers.
+        if self._config.transfer_metrics is not None:
+            call_args.subscribers = call_args.subscribers + [
+                self._config.transfer_metrics.subscriber
+            ]
+
         # Create a TransferFuture to return back to the user
         transfer_future, components = self._get_future_with_components(
             call_args
@@ -582,6 +949,8 @@ class TransferManager:
         self._client.meta.events.register_last(
             event_name, signal_transferring, unique_id='s3upload-transferring'
         )
+        if self._config.transfer_metrics is not None:
+            self._config.transfer_metrics.register_client(self._client)
 
     def __enter__(self):
         return self
@@ -643,6 +1012,8 @@ class TransferManager:
             self._submission_executor.shutdown()
             self._request_executor.shutdown()
             self._io_executor.shutdown()
+            if self._checksum_executor:
+                self._checksum_executor.shutdown()
 
 
 class TransferCoordinatorController:
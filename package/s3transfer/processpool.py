@@ -191,14 +191,53 @@ that would have been used in the :meth:`botocore.Session.create_client` call:
 This snippet ensures that all clients created by the ``ProcessPoolDownloader``
 are using ``us-west-2`` as their region.
 
+
+Uploading
+=========
+
+The :class:`ProcessPoolUploader` is the counterpart of the
+``ProcessPoolDownloader``. It takes the same ``client_kwargs`` and
+``config``, and returns the same futures. Files are uploaded with
+:meth:`ProcessPoolUploader.upload_file`, in parts with a multipart upload
+if they are at least ``multipart_threshold`` bytes. Each worker process
+reads the part it uploads straight from the file:
+
+.. code:: python
+
+     from s3transfer.processpool import ProcessPoolUploader
+
+     with ProcessPoolUploader() as uploader:
+          uploader.upload_file('myfile', 'mybucket', 'mykey')
+
+
+Data that is already in memory is uploaded with
+:meth:`ProcessPoolUploader.upload_bytes`. The data is copied once into a
+``multiprocessing.shared_memory`` block, which the worker processes
+upload their parts from without it being sent to them through a queue:
+
+.. code:: python
+
+     from s3transfer.processpool import ProcessPoolUploader
+
+     with ProcessPoolUploader() as uploader:
+          uploader.upload_bytes(
+               data, 'mybucket', 'mykey',
+               extra_args={'ChecksumAlgorithm': 'SHA256'})
+
+
+Checksums of the parts are calculated by the worker processes uploading
+them, so they are calculated on as many cores as there are workers.
+
 """
 import collections
 import contextlib
 import logging
 import multiprocessing
+import os
 import signal
 import threading
 from copy import deepcopy
+from multiprocessing import resource_tracker, shared_memory
 
 import botocore.session
 from botocore.config import Config
@@ -207,18 +246,26 @@ from s3transfer.compat import MAXINT, BaseManager
 from s3transfer.constants import ALLOWED_DOWNLOAD_ARGS, MB, PROCESS_USER_AGENT
 from s3transfer.exceptions import CancelledError, RetriesExceededError
 from s3transfer.futures import BaseTransferFuture, BaseTransferMeta
+from s3transfer.manager import TransferManager
+from s3transfer.upload import UploadSubmissionTask
 from s3transfer.utils import (
     S3_RETRYABLE_DOWNLOAD_ERRORS,
     CallArgs,
+    ChunksizeAdjuster,
     OSUtils,
     calculate_num_parts,
     calculate_range_parameter,
+    get_filtered_dict,
 )
 
 logger = logging.getLogger(__name__)
 
 SHUTDOWN_SIGNAL = 'SHUTDOWN'
 
+# How often, in seconds, the shared memory blocks of upload_bytes() calls
+# are checked for being done with.
+SHARED_MEMORY_RELEASE_INTERVAL = 0.1
+
 # The DownloadFileRequest tuple is submitted from the ProcessPoolDownloader
 # to the GetObjectSubmitter in order for the submitter to begin submitting
 # GetObjectJobs to the GetObjectWorkers.
@@ -253,6 +300,47 @@ GetObjectJob = collections.namedtuple(
 )
 
 
+# The UploadFileRequest tuple is submitted from the ProcessPoolUploader
+# to the UploadPartSubmitter in order for the submitter to begin submitting
+# UploadPartJobs to the UploadPartWorkers.
+UploadFileRequest = collections.namedtuple(
+    'UploadFileRequest',
+    [
+        'transfer_id',  # The unique id for the transfer
+        'bucket',  # The bucket to upload the object to
+        'key',  # The key to upload the object to
+        'filename',  # The file to upload, if uploading a file
+        'shared_memory_name',  # The name of the shared memory block to
+        # upload, if uploading bytes
+        'size',  # The size of the data to upload, if known
+        'extra_args',  # Extra arguments to provide to client calls
+    ],
+)
+
+# The UploadPartJob tuple is submitted from the UploadPartSubmitter
+# to the UploadPartWorkers to upload the file or parts of the file.
+UploadPartJob = collections.namedtuple(
+    'UploadPartJob',
+    [
+        'transfer_id',  # The unique id for the transfer
+        'bucket',  # The bucket to upload the object to
+        'key',  # The key to upload the object to
+        'filename',  # The file to read the content from, if any
+        'shared_memory_name',  # The shared memory block to read the content
+        # from, if any
+        'offset',  # The offset of the content in the file or block
+        'size',  # The size of the content
+        'upload_id',  # The id of the multipart upload. If None, the
+        # content is uploaded with a single PutObject call.
+        'part_number',  # The number of the part in the multipart upload
+        'extra_args',  # Extra arguments to provide to the upload call
+        'complete_extra_args',  # Extra arguments to provide to the
+        # CompleteMultipartUpload call. The worker of the final
+        # UploadPartJob will complete the multipart upload.
+    ],
+)
+
+
 @contextlib.contextmanager
 def ignore_ctrl_c():
     original_handler = _add_ignore_handler_for_interrupts()
@@ -273,12 +361,14 @@ class ProcessTransferConfig:
         multipart_chunksize=8 * MB,
         max_request_processes=10,
     ):
-        """Configuration for the ProcessPoolDownloader
+        """Configuration for the ProcessPoolDownloader and
+        ProcessPoolUploader
 
         :param multipart_threshold: The threshold for which ranged downloads
-            occur.
+            and multipart uploads occur.
 
-        :param multipart_chunksize: The chunk size of each ranged download.
+        :param multipart_chunksize: The chunk size of each ranged download
+            or uploaded part.
 
         :param max_request_processes: The maximum number of processes that
             will be making S3 API transfer-related requests at a time.
@@ -486,6 +576,299 @@ class ProcessPoolDownloader:
             worker.join()
 
 
+class ProcessPoolUploader:
+    def __init__(self, client_kwargs=None, config=None):
+        """Uploads S3 objects using process pools
+
+        :type client_kwargs: dict
+        :param client_kwargs: The keyword arguments to provide when
+            instantiating S3 clients. The arguments must match the keyword
+            arguments provided to the
+            `botocore.session.Session.create_client()` method.
+
+        :type config: ProcessTransferConfig
+        :param config: Configuration for the uploader
+        """
+        if client_kwargs is None:
+            client_kwargs = {}
+        self._client_factory = ClientFactory(client_kwargs)
+
+        self._transfer_config = config
+        if config is None:
+            self._transfer_config = ProcessTransferConfig()
+
+        self._upload_request_queue = multiprocessing.Queue(1000)
+        self._worker_queue = multiprocessing.Queue(1000)
+        self._osutil = OSUtils()
+
+        self._started = False
+        self._start_lock = threading.Lock()
+
+        # The shared memory blocks of upload_bytes() calls, by transfer id.
+        # A releaser thread releases them once their transfer is done.
+        self._shared_memory_blocks = {}
+        self._shared_memory_condition = threading.Condition()
+        self._shared_memory_releaser = None
+        self._stop_shared_memory_releaser = False
+
+        # These below are initialized in the start() method
+        self._manager = None
+        self._transfer_monitor = None
+        self._submitter = None
+        self._workers = []
+
+    def upload_file(self, filename, bucket, key, extra_args=None):
+        """Uploads a file to an S3 object
+
+        :type filename: str
+        :param filename: The name of the file to upload.
+
+        :type bucket: str
+        :param bucket: The name of the bucket to upload to
+
+        :type key: str
+        :param key: The name of the key to upload to
+
+        :type extra_args: dict
+        :param extra_args: Extra arguments that may be passed to the
+            client operation
+
+        :rtype: s3transfer.futures.TransferFuture
+        :returns: Transfer future representing the upload
+        """
+        return self._submit_upload(bucket, key, extra_args, filename=filename)
+
+    def upload_bytes(self, data, bucket, key, extra_args=None):
+        """Uploads bytes to an S3 object
+
+        The data is copied into a shared memory block that the worker
+        processes upload it from, so ``data`` can be changed or released
+        once this returns.
+
+        :type data: bytes-like object
+        :param data: The data to upload.
+
+        :type bucket: str
+        :param bucket: The name of the bucket to upload to
+
+        :type key: str
+        :param key: The name of the key to upload to
+
+        :type extra_args: dict
+        :param extra_args: Extra arguments that may be passed to the
+            client operation
+
+        :rtype: s3transfer.futures.TransferFuture
+        :returns: Transfer future representing the upload
+        """
+        view = memoryview(data).cast('B')
+        return self._submit_upload(bucket, key, extra_args, data=view)
+
+    def shutdown(self):
+        """Shutdown the uploader
+
+        It will wait till all uploads are complete before returning.
+        """
+        self._shutdown_if_needed()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, *args):
+        if isinstance(exc_value, KeyboardInterrupt):
+            if self._transfer_monitor is not None:
+                self._transfer_monitor.notify_cancel_all_in_progress()
+        self.shutdown()
+
+    def _submit_upload(
+        self, bucket, key, extra_args, filename=None, data=None
+    ):
+        self._start_if_needed()
+        if extra_args is None:
+            extra_args = {}
+        self._validate_all_known_args(extra_args)
+        transfer_id = self._transfer_monitor.notify_new_transfer()
+        shared_memory_name = None
+        size = None
+        if data is not None:
+            size = data.nbytes
+            shared_memory_name = self._copy_to_shared_memory(transfer_id, data)
+        upload_file_request = UploadFileRequest(
+            transfer_id=transfer_id,
+            bucket=bucket,
+            key=key,
+            filename=filename,
+            shared_memory_name=shared_memory_name,
+            size=size,
+            extra_args=extra_args,
+        )
+        logger.debug(
+            'Submitting upload file request: %s.', upload_file_request
+        )
+        self._upload_request_queue.put(upload_file_request)
+        call_args = CallArgs(
+            bucket=bucket,
+            key=key,
+            filename=filename,
+            extra_args=extra_args,
+        )
+        meta = ProcessPoolTransferMeta(
+            call_args=call_args, transfer_id=transfer_id
+        )
+        return ProcessPoolTransferFuture(
+            monitor=self._transfer_monitor, meta=meta
+        )
+
+    def _copy_to_shared_memory(self, transfer_id, data):
+        # A shared memory block cannot be empty.
+        block = shared_memory.SharedMemory(
+            create=True, size=max(data.nbytes, 1)
+        )
+        block.buf[: data.nbytes] = data
+        with self._shared_memory_condition:
+            self._shared_memory_blocks[transfer_id] = block
+            self._shared_memory_condition.notify()
+        return block.name
+
+    def _release_done_shared_memory_blocks(self):
+        while True:
+            with self._shared_memory_condition:
+                while (
+                    not self._shared_memory_blocks
+                    and not self._stop_shared_memory_releaser
+                ):
+                    self._shared_memory_condition.wait()
+                if self._stop_shared_memory_releaser:
+                    return
+                transfer_ids = list(self._shared_memory_blocks)
+            self._release_shared_memory_blocks(
+                self._transfer_monitor.get_done_transfers(transfer_ids)
+            )
+            with self._shared_memory_condition:
+                self._shared_memory_condition.wait_for(
+                    lambda: self._stop_shared_memory_releaser,
+                    SHARED_MEMORY_RELEASE_INTERVAL,
+                )
+
+    def _release_shared_memory_blocks(self, transfer_ids=None):
+        with self._shared_memory_condition:
+            if transfer_ids is None:
+                transfer_ids = list(self._shared_memory_blocks)
+            blocks = [
+                self._shared_memory_blocks.pop(transfer_id)
+                for transfer_id in transfer_ids
+            ]
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    def _start_if_needed(self):
+        with self._start_lock:
+            if not self._started:
+                self._start()
+
+    def _start(self):
+        if os.name == 'posix':
+            # Start the resource tracker before the worker processes, so
+            # they share it. Shared memory blocks that workers attach to
+            # are then tracked once, and unlinked by this process only.
+            resource_tracker.ensure_running()
+        self._start_transfer_monitor_manager()
+        self._start_submitter()
+        self._start_upload_part_workers()
+        self._start_shared_memory_releaser()
+        self._started = True
+
+    def _validate_all_known_args(self, provided):
+        for kwarg in provided:
+            if kwarg not in TransferManager.ALLOWED_UPLOAD_ARGS:
+                upload_args = ', '.join(TransferManager.ALLOWED_UPLOAD_ARGS)
+                raise ValueError(
+                    f"Invalid extra_args key '{kwarg}', "
+                    f"must be one of: {upload_args}"
+                )
+
+    def _start_transfer_monitor_manager(self):
+        logger.debug('Starting the TransferMonitorManager.')
+        self._manager = TransferMonitorManager()
+        self._manager.start(_add_ignore_handler_for_interrupts)
+        self._transfer_monitor = self._manager.TransferMonitor()
+
+    def _start_submitter(self):
+        logger.debug('Starting the UploadPartSubmitter.')
+        self._submitter = UploadPartSubmitter(
+            transfer_config=self._transfer_config,
+            client_factory=self._client_factory,
+            transfer_monitor=self._transfer_monitor,
+            osutil=self._osutil,
+            upload_request_queue=self._upload_request_queue,
+            worker_queue=self._worker_queue,
+        )
+        self._submitter.start()
+
+    def _start_shared_memory_releaser(self):
+        logger.debug('Starting the shared memory releaser.')
+        self._stop_shared_memory_releaser = False
+        self._shared_memory_releaser = threading.Thread(
+            target=self._release_done_shared_memory_blocks,
+            name='ProcessPoolUploader-shared-memory-releaser',
+            daemon=True,
+        )
+        self._shared_memory_releaser.start()
+
+    def _start_upload_part_workers(self):
+        logger.debug(
+            'Starting %s UploadPartWorkers.',
+            self._transfer_config.max_request_processes,
+        )
+        for _ in range(self._transfer_config.max_request_processes):
+            worker = UploadPartWorker(
+                queue=self._worker_queue,
+                client_factory=self._client_factory,
+                transfer_monitor=self._transfer_monitor,
+                osutil=self._osutil,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _shutdown_if_needed(self):
+        with self._start_lock:
+            if self._started:
+                self._shutdown()
+
+    def _shutdown(self):
+        self._shutdown_submitter()
+        self._shutdown_upload_part_workers()
+        self._shutdown_shared_memory_releaser()
+        self._release_shared_memory_blocks()
+        self._shutdown_transfer_monitor_manager()
+        self._started = False
+
+    def _shutdown_transfer_monitor_manager(self):
+        logger.debug('Shutting down the TransferMonitorManager.')
+        self._manager.shutdown()
+
+    def _shutdown_shared_memory_releaser(self):
+        logger.debug('Shutting down the shared memory releaser.')
+        with self._shared_memory_condition:
+            self._stop_shared_memory_releaser = True
+            self._shared_memory_condition.notify()
+        self._shared_memory_releaser.join()
+
+    def _shutdown_submitter(self):
+        logger.debug('Shutting down the UploadPartSubmitter.')
+        self._upload_request_queue.put(SHUTDOWN_SIGNAL)
+        self._submitter.join()
+
+    def _shutdown_upload_part_workers(self):
+        logger.debug('Shutting down the UploadPartWorkers.')
+        for _ in self._workers:
+            self._worker_queue.put(SHUTDOWN_SIGNAL)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+
 class ProcessPoolTransferFuture(BaseTransferFuture):
     def __init__(self, monitor, meta):
         """The future associated to a submitted process pool transfer request
@@ -613,6 +996,18 @@ class TransferMonitor:
         """
         return self._transfer_states[transfer_id].done
 
+    def get_done_transfers(self, transfer_ids):
+        """Determine which of several transfers are complete
+
+        :param transfer_ids: Unique identifiers of transfers
+        :return: The identifiers of the transfers that are done.
+        """
+        return [
+            transfer_id
+            for transfer_id in transfer_ids
+            if self._transfer_states[transfer_id].done
+        ]
+
     def notify_done(self, transfer_id):
         """Notify a particular transfer is complete
 
@@ -676,6 +1071,24 @@ class TransferMonitor:
         """
         return self._transfer_states[transfer_id].decrement_jobs_to_complete()
 
+    def notify_part_uploaded(self, transfer_id, part):
+        """Notify that a part of a multipart upload was uploaded
+
+        :param transfer_id: Unique identifier for the transfer
+        :param part: The part to complete the multipart upload with::
+
+            {'ETag': etag_value, 'PartNumber': part_number}
+        """
+        self._transfer_states[transfer_id].add_part(part)
+
+    def get_uploaded_parts(self, transfer_id):
+        """Retrieve the uploaded parts of a multipart upload
+
+        :param transfer_id: Unique identifier for the transfer
+        :return: The parts notified for the transfer, sorted by part number
+        """
+        return self._transfer_states[transfer_id].parts
+
 
 class TransferState:
     """Represents the current state of an individual transfer"""
@@ -692,6 +1105,7 @@ class TransferState:
         self._done_event = threading.Event()
         self._job_lock = threading.Lock()
         self._jobs_to_complete = 0
+        self._parts = []
 
     @property
     def done(self):
@@ -724,6 +1138,15 @@ class TransferState:
             self._jobs_to_complete -= 1
             return self._jobs_to_complete
 
+    @property
+    def parts(self):
+        with self._job_lock:
+            return sorted(self._parts, key=lambda part: part['PartNumber'])
+
+    def add_part(self, part):
+        with self._job_lock:
+            self._parts.append(part)
+
 
 class TransferMonitorManager(BaseManager):
     pass
@@ -1006,3 +1429,322 @@ class GetObjectWorker(BaseS3TransferProcess):
         except Exception as e:
             self._transfer_monitor.notify_exception(transfer_id, e)
             self._osutil.remove_file(temp_filename)
+
+
+class UploadPartSubmitter(BaseS3TransferProcess):
+    def __init__(
+        self,
+        transfer_config,
+        client_factory,
+        transfer_monitor,
+        osutil,
+        upload_request_queue,
+        worker_queue,
+    ):
+        """Submit UploadPartJobs to fulfill an upload file request
+
+        :param transfer_config: Configuration for transfers.
+        :param client_factory: ClientFactory for creating S3 clients.
+        :param transfer_monitor: Monitor for notifying and retrieving state
+            of transfer.
+        :param osutil: OSUtils object to use for os-related behavior when
+            performing the transfer.
+        :param upload_request_queue: Queue to retrieve upload file
+            requests.
+        :param worker_queue: Queue to submit UploadPartJobs for workers
+            to perform.
+        """
+        super().__init__(client_factory)
+        self._transfer_config = transfer_config
+        self._transfer_monitor = transfer_monitor
+        self._osutil = osutil
+        self._upload_request_queue = upload_request_queue
+        self._worker_queue = worker_queue
+
+    def _do_run(self):
+        while True:
+            upload_file_request = self._upload_request_queue.get()
+            if upload_file_request == SHUTDOWN_SIGNAL:
+                logger.debug('Submitter shutdown signal received.')
+                return
+            try:
+                self._submit_upload_part_jobs(upload_file_request)
+            except Exception as e:
+                logger.debug(
+                    'Exception caught when submitting jobs for '
+                    'upload file request %s: %s',
+                    upload_file_request,
+                    e,
+                    exc_info=True,
+                )
+                self._transfer_monitor.notify_exception(
+                    upload_file_request.transfer_id, e
+                )
+                self._transfer_monitor.notify_done(
+                    upload_file_request.transfer_id
+                )
+
+    def _submit_upload_part_jobs(self, upload_file_request):
+        size = upload_file_request.size
+        if size is None:
+            size = self._osutil.get_file_size(upload_file_request.filename)
+        if size < self._transfer_config.multipart_threshold:
+            self._submit_put_object_job(upload_file_request, size)
+        else:
+            self._submit_multipart_upload_jobs(upload_file_request, size)
+
+    def _submit_put_object_job(self, upload_file_request, size):
+        self._notify_jobs_to_complete(upload_file_request.transfer_id, 1)
+        self._submit_upload_part_job(
+            upload_file_request,
+            offset=0,
+            size=size,
+            upload_id=None,
+            part_number=None,
+            extra_args=upload_file_request.extra_args,
+        )
+
+    def _submit_multipart_upload_jobs(self, upload_file_request, size):
+        part_size = ChunksizeAdjuster().adjust_chunksize(
+            self._transfer_config.multipart_chunksize, size
+        )
+        num_parts = calculate_num_parts(size, part_size)
+        upload_id = self._client.create_multipart_upload(
+            Bucket=upload_file_request.bucket,
+            Key=upload_file_request.key,
+            **upload_file_request.extra_args,
+        )['UploadId']
+        self._notify_jobs_to_complete(
+            upload_file_request.transfer_id, num_parts
+        )
+        upload_part_args = get_filtered_dict(
+            upload_file_request.extra_args,
+            UploadSubmissionTask.UPLOAD_PART_ARGS,
+        )
+        for i in range(num_parts):
+            offset = i * part_size
+            self._submit_upload_part_job(
+                upload_file_request,
+                offset=offset,
+                size=min(part_size, size - offset),
+                upload_id=upload_id,
+                part_number=i + 1,
+                extra_args=upload_part_args,
+            )
+
+    def _submit_upload_part_job(self, upload_file_request, **job_kwargs):
+        self._worker_queue.put(
+            UploadPartJob(
+                transfer_id=upload_file_request.transfer_id,
+                bucket=upload_file_request.bucket,
+                key=upload_file_request.key,
+                filename=upload_file_request.filename,
+                shared_memory_name=upload_file_request.shared_memory_name,
+                complete_extra_args=get_filtered_dict(
+                    upload_file_request.extra_args,
+                    UploadSubmissionTask.COMPLETE_MULTIPART_ARGS,
+                ),
+                **job_kwargs,
+            )
+        )
+
+    def _notify_jobs_to_complete(self, transfer_id, jobs_to_complete):
+        logger.debug(
+            'Notifying %s job(s) to complete for transfer_id %s.',
+            jobs_to_complete,
+            transfer_id,
+        )
+        self._transfer_monitor.notify_expected_jobs_to_complete(
+            transfer_id, jobs_to_complete
+        )
+
+
+class UploadPartWorker(BaseS3TransferProcess):
+    def __init__(self, queue, client_factory, transfer_monitor, osutil):
+        """Fulfills UploadPartJobs
+
+        Uploads the content of the job from its file or shared memory
+        block, and completes (or aborts, if the transfer failed) the
+        multipart upload if it completes the final job for a particular
+        transfer.
+
+        :param queue: Queue for retrieving UploadPartJob's
+        :param client_factory: ClientFactory for creating S3 clients
+        :param transfer_monitor: Monitor for notifying
+        :param osutil: OSUtils object to use for os-related behavior when
+            performing the transfer.
+        """
+        super().__init__(client_factory)
+        self._queue = queue
+        self._client_factory = client_factory
+        self._transfer_monitor = transfer_monitor
+        self._osutil = osutil
+
+    def _do_run(self):
+        while True:
+            job = self._queue.get()
+            if job == SHUTDOWN_SIGNAL:
+                logger.debug('Worker shutdown signal received.')
+                return
+            if not self._transfer_monitor.get_exception(job.transfer_id):
+                self._run_upload_part_job(job)
+            else:
+                logger.debug(
+                    'Skipping upload part job %s because there was a '
+                    'previous exception.',
+                    job,
+                )
+            remaining = self._transfer_monitor.notify_job_complete(
+                job.transfer_id
+            )
+            logger.debug(
+                '%s jobs remaining for transfer_id %s.',
+                remaining,
+                job.transfer_id,
+            )
+            if not remaining:
+                self._finalize_upload(job)
+
+    def _run_upload_part_job(self, job):
+        try:
+            with self._open_body(job) as body:
+                if job.upload_id is None:
+                    self._client.put_object(
+                        Bucket=job.bucket,
+                        Key=job.key,
+                        Body=body,
+                        **job.extra_args,
+                    )
+                else:
+                    self._do_upload_part(job, body)
+        except Exception as e:
+            logger.debug(
+                'Exception caught when uploading object for '
+                'upload part job %s: %s',
+                job,
+                e,
+                exc_info=True,
+            )
+            self._transfer_monitor.notify_exception(job.transfer_id, e)
+
+    def _open_body(self, job):
+        if job.shared_memory_name is not None:
+            return SharedMemoryChunkReader(
+                job.shared_memory_name, job.offset, job.size
+            )
+        return self._osutil.open_file_chunk_reader(
+            job.filename, job.offset, job.size, callbacks=[]
+        )
+
+    def _do_upload_part(self, job, body):
+        response = self._client.upload_part(
+            Bucket=job.bucket,
+            Key=job.key,
+            UploadId=job.upload_id,
+            PartNumber=job.part_number,
+            Body=body,
+            **job.extra_args,
+        )
+        part = {'ETag': response['ETag'], 'PartNumber': job.part_number}
+        if 'ChecksumAlgorithm' in job.extra_args:
+            algorithm_name = job.extra_args['ChecksumAlgorithm'].upper()
+            checksum_member = f'Checksum{algorithm_name}'
+            if checksum_member in response:
+                part[checksum_member] = response[checksum_member]
+        self._transfer_monitor.notify_part_uploaded(job.transfer_id, part)
+
+    def _finalize_upload(self, job):
+        if job.upload_id is not None:
+            if self._transfer_monitor.get_exception(job.transfer_id):
+                self._abort_multipart_upload(job)
+            else:
+                self._complete_multipart_upload(job)
+        self._transfer_monitor.notify_done(job.transfer_id)
+
+    def _complete_multipart_upload(self, job):
+        try:
+            self._client.complete_multipart_upload(
+                Bucket=job.bucket,
+                Key=job.key,
+                UploadId=job.upload_id,
+                MultipartUpload={
+                    'Parts': self._transfer_monitor.get_uploaded_parts(
+                        job.transfer_id
+                    )
+                },
+                **job.complete_extra_args,
+            )
+        except Exception as e:
+            self._transfer_monitor.notify_exception(job.transfer_id, e)
+            self._abort_multipart_upload(job)
+
+    def _abort_multipart_upload(self, job):
+        try:
+            self._client.abort_multipart_upload(
+                Bucket=job.bucket, Key=job.key, UploadId=job.upload_id
+            )
+        except Exception:
+            logger.debug(
+                'Failed to abort multipart upload %s of transfer_id %s.',
+                job.upload_id,
+                job.transfer_id,
+                exc_info=True,
+            )
+
+
+class SharedMemoryChunkReader:
+    def __init__(self, name, start_byte, size):
+        """A read-only file-like view of a region of a shared memory block
+
+        ``read()`` returns ``memoryview`` slices of the block, so the
+        content is not copied until it is sent.
+
+        :type name: str
+        :param name: The name of the shared memory block
+
+        :type start_byte: int
+        :param start_byte: The first byte of the region
+
+        :type size: int
+        :param size: The size of the region
+        """
+        self._block = shared_memory.SharedMemory(name=name)
+        self._view = self._block.buf[start_byte : start_byte + size]
+        self._position = 0
+
+    def read(self, amount=None):
+        if amount is None or amount < 0:
+            end = len(self._view)
+        else:
+            end = min(self._position + amount, len(self._view))
+        data = self._view[self._position : end]
+        self._position = end
+        return data
+
+    def seek(self, where, whence=0):
+        if whence == 1:
+            where += self._position
+        elif whence == 2:
+            where += len(self._view)
+        self._position = max(0, min(where, len(self._view)))
+
+    def tell(self):
+        return self._position
+
+    def __len__(self):
+        return len(self._view)
+
+    def close(self):
+        self._view.release()
+        try:
+            self._block.close()
+        except BufferError:
+            # Slices returned by read() are still referenced. The mapping
+            # is released once they are.
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
@@ -0,0 +1,339 @@
+# Copyright 2016 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Low-overhead progress and metrics of transfer managers.
+
+Progress subscribers are invoked for every chunk read or written, from
+every transfer thread, so a subscriber that updates shared state (a
+progress bar, say) serializes the transfer threads on its lock.
+``TransferMetrics`` instead accumulates progress in ``ProgressCounter``
+objects, which give each thread its own accumulator: recording progress
+never takes a lock, and the accumulators are only summed when a snapshot
+is taken.  A ``ProgressMonitor`` takes snapshots from its own thread at a
+fixed interval and hands them to a reporting callback, so the cost of
+reporting does not depend on how fast the transfers are going::
+
+    metrics = TransferMetrics()
+    config = TransferConfig(transfer_metrics=metrics)
+    with ProgressMonitor(metrics, print, interval=1):
+        with TransferManager(client, config) as manager:
+            manager.upload('file', 'bucket', 'key')
+"""
+import collections
+import logging
+import math
+import threading
+import time
+import weakref
+
+from s3transfer.subscribers import BaseSubscriber
+
+logger = logging.getLogger(__name__)
+
+TransferMetricsSnapshot = collections.namedtuple(
+    'TransferMetricsSnapshot',
+    [
+        'elapsed',
+        'bytes_transferred',
+        'throughput',
+        'transfers_in_progress',
+        'transfers_completed',
+        'transfers_failed',
+        'requests_in_flight',
+        'requests',
+        'requests_failed',
+        'retries',
+    ],
+)
+TransferMetricsSnapshot.__doc__ = """A point in time view of TransferMetrics
+
+:ivar elapsed: Seconds since the metrics were created.
+:ivar bytes_transferred: Bytes transferred, as reported to progress
+    subscribers. Bytes of failed attempts that are retried are subtracted.
+:ivar throughput: Exponentially weighted moving average of the bytes
+    transferred per second.
+:ivar transfers_in_progress: Transfers queued but not done.
+:ivar transfers_completed: Transfers that succeeded.
+:ivar transfers_failed: Transfers that failed or were cancelled.
+:ivar requests_in_flight: S3 requests being made, including retries.
+:ivar requests: S3 requests completed.
+:ivar requests_failed: S3 requests that failed after their retries.
+:ivar retries: Retried attempts of S3 requests.
+"""
+
+
+class ProgressCounter:
+    """A counter that threads add to without taking a lock
+
+    Every thread adds to its own accumulator, which only that thread
+    writes to. Reading the value sums the accumulators, so it may miss
+    additions made while it is being read, but never loses them. The
+    accumulator of a thread that exits is folded into a base total.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._accumulators = {}
+        self._base = 0
+        self._lock = threading.Lock()
+
+    def add(self, amount):
+        try:
+            accumulator = self._local.accumulator
+        except AttributeError:
+            accumulator = self._new_accumulator()
+        accumulator[0] += amount
+
+    def _new_accumulator(self):
+        accumulator = [0]
+        self._local.accumulator = accumulator
+        # The owner is only referenced by the thread's local storage, which
+        # is cleared when the thread exits.
+        owner = _AccumulatorOwner()
+        self._local.owner = owner
+        with self._lock:
+            self._accumulators[id(accumulator)] = accumulator
+        weakref.finalize(owner, self._fold_accumulator, accumulator)
+        return accumulator
+
+    def _fold_accumulator(self, accumulator):
+        with self._lock:
+            del self._accumulators[id(accumulator)]
+            self._base += accumulator[0]
+
+    @property
+    def value(self):
+        with self._lock:
+            base = self._base
+            accumulators = list(self._accumulators.values())
+        return base + sum(accumulator[0] for accumulator in accumulators)
+
+
+class _AccumulatorOwner:
+    """Ties an accumulator to the lifetime of its thread"""
+
+
+class TransferMetrics:
+    """Counters of the transfers and requests of transfer managers
+
+    Pass it as the ``transfer_metrics`` of a ``TransferConfig``. It may be
+    shared by several managers to aggregate their transfers.
+
+    :type throughput_window: float
+    :param throughput_window: The time constant, in seconds, of the moving
+        average of the throughput. Samples that are this old have about a
+        third of the weight of the latest one.
+    """
+
+    def __init__(self, throughput_window=5.0):
+        self._throughput_window = throughput_window
+        # Marks, in the context of a request, that the request was counted
+        # as started by these metrics.
+        self._context_key = f's3transfer-metrics-{id(self)}'
+        self._bytes_transferred = ProgressCounter()
+        self._transfers_queued = ProgressCounter()
+        self._transfers_completed = ProgressCounter()
+        self._transfers_failed = ProgressCounter()
+        self._requests_started = ProgressCounter()
+        self._requests = ProgressCounter()
+        self._requests_failed = ProgressCounter()
+        self._retries = ProgressCounter()
+        self._subscriber = TransferMetricsSubscriber(self)
+        self._start_time = time.monotonic()
+        self._sample_time = self._start_time
+        self._sample_bytes = 0
+        self._throughput = 0.0
+        self._sample_lock = threading.Lock()
+
+    @property
+    def subscriber(self):
+        """The subscriber that reports transfers to these metrics"""
+        return self._subscriber
+
+    def record_progress(self, bytes_transferred):
+        self._bytes_transferred.add(bytes_transferred)
+
+    def record_transfer_queued(self):
+        self._transfers_queued.add(1)
+
+    def record_transfer_done(self, failed=False):
+        if failed:
+            self._transfers_failed.add(1)
+        else:
+            self._transfers_completed.add(1)
+
+    def register_client(self, client):
+        """Count the requests made by ``client``
+
+        The handlers are registered once per client and metrics, so a
+        client shared by several managers is counted once.
+        """
+        # Count requests as started last, once other handlers can no
+        # longer prevent them from being made.
+        client.meta.events.register_last(
+            'before-call.s3',
+            self._on_before_call,
+            unique_id=f'{self._context_key}-before-call',
+        )
+        client.meta.events.register(
+            'after-call.s3',
+            self._on_after_call,
+            unique_id=f'{self._context_key}-after-call',
+        )
+        client.meta.events.register(
+            'after-call-error.s3',
+            self._on_after_call_error,
+            unique_id=f'{self._context_key}-after-call-error',
+        )
+
+    def _on_before_call(self, context, **kwargs):
+        context[self._context_key] = True
+        self._requests_started.add(1)
+
+    def _on_after_call(self, http_response, context, **kwargs):
+        self._finish_request(context, failed=http_response.status_code >= 300)
+
+    def _on_after_call_error(self, context, **kwargs):
+        self._finish_request(context, failed=True)
+
+    def _finish_request(self, context, failed):
+        # Requests answered by an earlier before-call handler were not
+        # counted as started.
+        if not context.pop(self._context_key, False):
+            return
+        self._requests.add(1)
+        if failed:
+            self._requests_failed.add(1)
+        attempts = context.get('retries', {}).get('attempt', 1)
+        if attempts > 1:
+            self._retries.add(attempts - 1)
+
+    def snapshot(self):
+        """Take a snapshot of the metrics
+
+        :rtype: TransferMetricsSnapshot
+        """
+        now = time.monotonic()
+        bytes_transferred = self._bytes_transferred.value
+        with self._sample_lock:
+            elapsed = now - self._sample_time
+            if elapsed > 0:
+                rate = (bytes_transferred - self._sample_bytes) / elapsed
+                # Weigh the rate by the time it covers, so the average
+                # does not depend on how often snapshots are taken.
+                alpha = 1 - math.exp(-elapsed / self._throughput_window)
+                self._throughput += alpha * (rate - self._throughput)
+                self._sample_time = now
+                self._sample_bytes = bytes_transferred
+            throughput = self._throughput
+        transfers_completed = self._transfers_completed.value
+        transfers_failed = self._transfers_failed.value
+        requests = self._requests.value
+        return TransferMetricsSnapshot(
+            elapsed=now - self._start_time,
+            bytes_transferred=bytes_transferred,
+            throughput=throughput,
+            transfers_in_progress=max(
+                self._transfers_queued.value
+                - transfers_completed
+                - transfers_failed,
+                0,
+            ),
+            transfers_completed=transfers_completed,
+            transfers_failed=transfers_failed,
+            requests_in_flight=max(self._requests_started.value - requests, 0),
+            requests=requests,
+            requests_failed=self._requests_failed.value,
+            retries=self._retries.value,
+        )
+
+    def stats(self):
+        """Return the current counters."""
+        return self.snapshot()._asdict()
+
+
+class TransferMetricsSubscriber(BaseSubscriber):
+    """Reports the progress of a transfer to TransferMetrics"""
+
+    def __init__(self, metrics):
+        self._metrics = metrics
+
+    def on_queued(self, future, **kwargs):
+        self._metrics.record_transfer_queued()
+
+    def on_progress(self, future, bytes_transferred, **kwargs):
+        self._metrics.record_progress(bytes_transferred)
+
+    def on_done(self, future, **kwargs):
+        try:
+            future.result()
+        except Exception:
+            self._metrics.record_transfer_done(failed=True)
+        else:
+            self._metrics.record_transfer_done()
+
+
+class ProgressMonitor:
+    """Reports snapshots of TransferMetrics from a background thread
+
+    :type metrics: TransferMetrics
+    :param metrics: The metrics to report.
+
+    :type callback: function
+    :param callback: Called with a ``TransferMetricsSnapshot`` every
+        ``interval`` seconds, and once more when the monitor is stopped.
+
+    :type interval: float
+    :param interval: The number of seconds between snapshots.
+    """
+
+    def __init__(self, metrics, callback, interval=0.5):
+        self._metrics = metrics
+        self._callback = callback
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='ProgressMonitor', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the monitor and report a final snapshot"""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self._report()
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            self._report()
+
+    def _report(self):
+        try:
+            self._callback(self._metrics.snapshot())
+        except Exception:
+            logger.debug(
+                'Exception raised by progress callback', exc_info=True
+            )
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
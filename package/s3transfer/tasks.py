@@ -13,6 +13,7 @@
 import copy
 import logging
 
+from s3transfer.checksums import combine_part_checksums
 from s3transfer.utils import get_callbacks
 
 logger = logging.getLogger(__name__)
@@ -334,13 +335,15 @@ class SubmissionTask(Task):
 class CreateMultipartUploadTask(Task):
     """Task to initiate a multipart upload"""
 
-    def _main(self, client, bucket, key, extra_args):
+    def _main(self, client, bucket, key, extra_args, journal=None):
         """
         :param client: The client to use when calling CreateMultipartUpload
         :param bucket: The name of the bucket to upload to
         :param key: The name of the key to upload to
         :param extra_args: A dictionary of any extra arguments that may be
             used in the initialization.
+        :param journal: The journal to record the upload id in, if the
+            upload is resumable.
 
         :returns: The upload id of the multipart upload
         """
@@ -350,6 +353,12 @@ class CreateMultipartUploadTask(Task):
         )
         upload_id = response['UploadId']
 
+        if journal is not None:
+            # A journaled upload is left open if it fails, so it can be
+            # resumed.
+            journal.record({'upload_id': upload_id})
+            return upload_id
+
         # Add a cleanup if the multipart upload fails at any point.
         self._transfer_coordinator.add_failure_cleanup(
             client.abort_multipart_upload,
@@ -363,7 +372,19 @@ class CreateMultipartUploadTask(Task):
 class CompleteMultipartUploadTask(Task):
     """Task to complete a multipart upload"""
 
-    def _main(self, client, bucket, key, upload_id, parts, extra_args):
+    def _main(
+        self,
+        client,
+        bucket,
+        key,
+        upload_id,
+        parts,
+        extra_args,
+        completed_parts=None,
+        journal=None,
+        checksum_algorithm=None,
+        transfer_meta=None,
+    ):
         """
         :param client: The client to use when calling CompleteMultipartUpload
         :param bucket: The name of the bucket to upload to
@@ -377,11 +398,38 @@ class CompleteMultipartUploadTask(Task):
             ``UploadPartTask.main()``.
         :param extra_args:  A dictionary of any extra arguments that may be
             used in completing the multipart transfer.
+        :param completed_parts: A list of parts, in the same form as
+            ``parts``, uploaded before the upload was resumed.
+        :param journal: The journal of the upload, removed once it is
+            complete.
+        :param checksum_algorithm: The checksum algorithm of the parts, if
+            the upload has one.
+        :param transfer_meta: The meta of the transfer, provided with the
+            composite checksum of the object if it has a checksum algorithm.
         """
-        client.complete_multipart_upload(
+        if completed_parts:
+            parts = sorted(
+                completed_parts + parts, key=lambda part: part['PartNumber']
+            )
+        response = client.complete_multipart_upload(
             Bucket=bucket,
             Key=key,
             UploadId=upload_id,
             MultipartUpload={'Parts': parts},
             **extra_args,
         )
+        if journal is not None:
+            journal.remove()
+        if checksum_algorithm and transfer_meta is not None:
+            transfer_meta.provide_object_checksum(
+                self._get_object_checksum(checksum_algorithm, parts, response)
+            )
+
+    def _get_object_checksum(self, checksum_algorithm, parts, response):
+        checksum_member = f'Checksum{checksum_algorithm.upper()}'
+        if checksum_member in response:
+            return response[checksum_member]
+        part_checksums = [part.get(checksum_member) for part in parts]
+        if None in part_checksums:
+            return None
+        return combine_part_checksums(part_checksums, checksum_algorithm)
@@ -10,11 +10,20 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import functools
+import hashlib
+import logging
 import math
+import os
 from io import BytesIO
 
+from botocore.exceptions import ClientError
+
+from s3transfer.adaptive import track_request
+from s3transfer.checksums import calculate_checksum
 from s3transfer.compat import readable, seekable
 from s3transfer.futures import IN_MEMORY_UPLOAD_TAG
+from s3transfer.journal import UPLOAD
 from s3transfer.tasks import (
     CompleteMultipartUploadTask,
     CreateMultipartUploadTask,
@@ -23,11 +32,15 @@ from s3transfer.tasks import (
 )
 from s3transfer.utils import (
     ChunksizeAdjuster,
+    DeferredMappedFile,
     DeferredOpenFile,
     get_callbacks,
     get_filtered_dict,
+    invoke_progress_callbacks,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class AggregatedProgressCallback:
     def __init__(self, callbacks, threshold=1024 * 256):
@@ -96,6 +109,15 @@ class InterruptReader:
     def tell(self):
         return self._fileobj.tell()
 
+    def calculate_checksum(self, algorithm):
+        if not hasattr(self._fileobj, 'calculate_checksum'):
+            return None
+        return self._fileobj.calculate_checksum(algorithm)
+
+    def release_file(self):
+        if hasattr(self._fileobj, 'release_file'):
+            self._fileobj.release_file()
+
     def close(self):
         self._fileobj.close()
 
@@ -322,6 +344,30 @@ class UploadFilenameInputManager(UploadInputManager):
         return int(math.ceil(transfer_future.meta.size / float(part_size)))
 
 
+class UploadMappedFilenameInputManager(UploadFilenameInputManager):
+    """Upload utility for filenames that memory-maps upload parts
+
+    Each part is read from a read-only mapping of its region of the file,
+    so the data is handed to the HTTP connection as ``memoryview`` slices
+    of the page cache instead of being copied into new ``bytes`` objects,
+    and part checksums are calculated directly over the mapping.
+
+    The file must not be truncated while it is being uploaded: reading a
+    mapped page past the end of a file raises ``SIGBUS``.
+    """
+
+    @classmethod
+    def is_compatible(cls, upload_source):
+        # Only used in place of UploadFilenameInputManager, when configured.
+        return False
+
+    def _get_upload_part_fileobj_with_full_size(self, fileobj, **kwargs):
+        start_byte = kwargs['start_byte']
+        full_size = kwargs['full_file_size']
+        part_size = min(kwargs['part_size'], full_size - start_byte)
+        return DeferredMappedFile(fileobj, start_byte, part_size), full_size
+
+
 class UploadSeekableInputManager(UploadFilenameInputManager):
     """Upload utility for an open file object"""
 
@@ -529,6 +575,19 @@ class UploadSubmissionTask(SubmissionTask):
         'ExpectedBucketOwner',
     ]
 
+    ABORT_MULTIPART_ARGS = [
+        'RequestPayer',
+        'ExpectedBucketOwner',
+    ]
+
+    LIST_PARTS_ARGS = [
+        'SSECustomerKey',
+        'SSECustomerAlgorithm',
+        'SSECustomerKeyMD5',
+        'RequestPayer',
+        'ExpectedBucketOwner',
+    ]
+
     def _get_upload_input_manager_cls(self, transfer_future):
         """Retrieves a class for managing input for an upload based on file type
 
@@ -563,6 +622,9 @@ class UploadSubmissionTask(SubmissionTask):
         request_executor,
         transfer_future,
         bandwidth_limiter=None,
+        transfer_tuner=None,
+        journal_store=None,
+        checksum_executor=None,
     ):
         """
         :param client: The client associated with the transfer manager
@@ -581,10 +643,35 @@ class UploadSubmissionTask(SubmissionTask):
         :type transfer_future: s3transfer.futures.TransferFuture
         :param transfer_future: The transfer future associated with the
             transfer request that tasks are being submitted for
+
+        :type bandwidth_limiter: s3transfer.bandwidth.BandwidthLimiter
+        :param bandwidth_limiter: The bandwidth limiter to use when
+            uploading streams
+
+        :type transfer_tuner: s3transfer.adaptive.TransferTuner
+        :param transfer_tuner: The tuner to measure requests with and take
+            part sizes from
+
+        :type journal_store: s3transfer.journal.TransferJournalStore
+        :param journal_store: The store to journal multipart uploads of
+            filenames in, so that they can be resumed
+
+        :type checksum_executor: s3transfer.futures.BoundedExecutor
+        :param checksum_executor: The executor to calculate the checksums
+            of uploads with a ``ChecksumAlgorithm`` in, ahead of their
+            requests
         """
-        upload_input_manager = self._get_upload_input_manager_cls(
+        upload_input_manager_cls = self._get_upload_input_manager_cls(
             transfer_future
-        )(osutil, self._transfer_coordinator, bandwidth_limiter)
+        )
+        if (
+            config.use_mmap_uploads
+            and upload_input_manager_cls is UploadFilenameInputManager
+        ):
+            upload_input_manager_cls = UploadMappedFilenameInputManager
+        upload_input_manager = upload_input_manager_cls(
+            osutil, self._transfer_coordinator, bandwidth_limiter
+        )
 
         # Determine the size if it was not provided
         if transfer_future.meta.size is None:
@@ -601,8 +688,14 @@ class UploadSubmissionTask(SubmissionTask):
                 request_executor,
                 transfer_future,
                 upload_input_manager,
+                transfer_tuner,
+                checksum_executor,
             )
         else:
+            # Only uploads of files are journaled: a file can be checked for
+            # changes and its remaining parts read without the earlier ones.
+            if not isinstance(transfer_future.meta.call_args.fileobj, str):
+                journal_store = None
             self._submit_multipart_request(
                 client,
                 config,
@@ -610,6 +703,9 @@ class UploadSubmissionTask(SubmissionTask):
                 request_executor,
                 transfer_future,
                 upload_input_manager,
+                transfer_tuner,
+                journal_store,
+                checksum_executor,
             )
 
     def _submit_upload_request(
@@ -620,6 +716,8 @@ class UploadSubmissionTask(SubmissionTask):
         request_executor,
         transfer_future,
         upload_input_manager,
+        transfer_tuner=None,
+        checksum_executor=None,
     ):
         call_args = transfer_future.meta.call_args
 
@@ -628,6 +726,11 @@ class UploadSubmissionTask(SubmissionTask):
             upload_input_manager, 'put_object'
         )
 
+        fileobj = upload_input_manager.get_put_object_body(transfer_future)
+        pending_main_kwargs = self._submit_checksum_request(
+            config, checksum_executor, fileobj, call_args.extra_args
+        )
+
         # Submit the request of a single upload.
         self._transfer_coordinator.submit(
             request_executor,
@@ -635,18 +738,39 @@ class UploadSubmissionTask(SubmissionTask):
                 transfer_coordinator=self._transfer_coordinator,
                 main_kwargs={
                     'client': client,
-                    'fileobj': upload_input_manager.get_put_object_body(
-                        transfer_future
-                    ),
+                    'fileobj': fileobj,
                     'bucket': call_args.bucket,
                     'key': call_args.key,
                     'extra_args': call_args.extra_args,
+                    'transfer_tuner': transfer_tuner,
+                    'transfer_meta': transfer_future.meta,
                 },
+                pending_main_kwargs=pending_main_kwargs,
                 is_final=True,
             ),
             tag=put_object_tag,
         )
 
+    def _submit_checksum_request(
+        self, config, checksum_executor, fileobj, extra_args
+    ):
+        # Calculate the checksum of the body in the checksum executor, so
+        # it is ready by the time the request that sends the body runs.
+        if checksum_executor is None or 'ChecksumAlgorithm' not in extra_args:
+            return {}
+        checksum_future = self._transfer_coordinator.submit(
+            checksum_executor,
+            CalculateChecksumTask(
+                transfer_coordinator=self._transfer_coordinator,
+                main_kwargs={
+                    'fileobj': fileobj,
+                    'algorithm': extra_args['ChecksumAlgorithm'],
+                    'chunk_size': config.io_chunksize,
+                },
+            ),
+        )
+        return {'checksum': checksum_future}
+
     def _submit_multipart_request(
         self,
         client,
@@ -655,22 +779,49 @@ class UploadSubmissionTask(SubmissionTask):
         request_executor,
         transfer_future,
         upload_input_manager,
+        transfer_tuner=None,
+        journal_store=None,
+        checksum_executor=None,
     ):
         call_args = transfer_future.meta.call_args
 
-        # Submit the request to create a multipart upload.
-        create_multipart_future = self._transfer_coordinator.submit(
-            request_executor,
-            CreateMultipartUploadTask(
-                transfer_coordinator=self._transfer_coordinator,
-                main_kwargs={
-                    'client': client,
-                    'bucket': call_args.bucket,
-                    'key': call_args.key,
-                    'extra_args': call_args.extra_args,
-                },
-            ),
-        )
+        size = transfer_future.meta.size
+        chunksize = config.multipart_chunksize
+        if transfer_tuner is not None:
+            chunksize = transfer_tuner.recommend_chunksize(chunksize, size)
+        adjuster = ChunksizeAdjuster()
+        chunksize = adjuster.adjust_chunksize(chunksize, size)
+
+        journal = None
+        upload_id = None
+        completed_parts = []
+        if journal_store is not None:
+            journaled_upload = self._open_upload_journal(
+                client, config, transfer_future, journal_store, chunksize
+            )
+            journal, chunksize, upload_id, completed_parts = journaled_upload
+
+        upload_id_kwargs = {}
+        pending_upload_id_kwargs = {}
+        if upload_id is not None:
+            # Continue the upload recorded in the journal.
+            upload_id_kwargs['upload_id'] = upload_id
+        else:
+            # Submit the request to create a multipart upload.
+            create_multipart_future = self._transfer_coordinator.submit(
+                request_executor,
+                CreateMultipartUploadTask(
+                    transfer_coordinator=self._transfer_coordinator,
+                    main_kwargs={
+                        'client': client,
+                        'bucket': call_args.bucket,
+                        'key': call_args.key,
+                        'extra_args': call_args.extra_args,
+                        'journal': journal,
+                    },
+                ),
+            )
+            pending_upload_id_kwargs['upload_id'] = create_multipart_future
 
         # Submit requests to upload the parts of the file.
         part_futures = []
@@ -682,30 +833,44 @@ class UploadSubmissionTask(SubmissionTask):
             upload_input_manager, 'upload_part'
         )
 
-        size = transfer_future.meta.size
-        adjuster = ChunksizeAdjuster()
-        chunksize = adjuster.adjust_chunksize(config.multipart_chunksize, size)
         part_iterator = upload_input_manager.yield_upload_part_bodies(
             transfer_future, chunksize
         )
+        completed_part_numbers = {
+            part['PartNumber'] for part in completed_parts
+        }
+        progress_callbacks = get_callbacks(transfer_future, 'progress')
 
         for part_number, fileobj in part_iterator:
+            if part_number in completed_part_numbers:
+                # The part was uploaded before the upload was resumed.
+                invoke_progress_callbacks(
+                    progress_callbacks,
+                    min(chunksize, size - chunksize * (part_number - 1)),
+                )
+                continue
+            main_kwargs = {
+                'client': client,
+                'fileobj': fileobj,
+                'bucket': call_args.bucket,
+                'key': call_args.key,
+                'part_number': part_number,
+                'extra_args': extra_part_args,
+                'transfer_tuner': transfer_tuner,
+                'journal': journal,
+            }
+            main_kwargs.update(upload_id_kwargs)
+            pending_main_kwargs = self._submit_checksum_request(
+                config, checksum_executor, fileobj, extra_part_args
+            )
+            pending_main_kwargs.update(pending_upload_id_kwargs)
             part_futures.append(
                 self._transfer_coordinator.submit(
                     request_executor,
                     UploadPartTask(
                         transfer_coordinator=self._transfer_coordinator,
-                        main_kwargs={
-                            'client': client,
-                            'fileobj': fileobj,
-                            'bucket': call_args.bucket,
-                            'key': call_args.key,
-                            'part_number': part_number,
-                            'extra_args': extra_part_args,
-                        },
-                        pending_main_kwargs={
-                            'upload_id': create_multipart_future
-                        },
+                        main_kwargs=main_kwargs,
+                        pending_main_kwargs=pending_main_kwargs,
                     ),
                     tag=upload_part_tag,
                 )
@@ -714,25 +879,149 @@ class UploadSubmissionTask(SubmissionTask):
         complete_multipart_extra_args = self._extra_complete_multipart_args(
             call_args.extra_args
         )
+        main_kwargs = {
+            'client': client,
+            'bucket': call_args.bucket,
+            'key': call_args.key,
+            'extra_args': complete_multipart_extra_args,
+            'completed_parts': completed_parts,
+            'journal': journal,
+            'checksum_algorithm': call_args.extra_args.get(
+                'ChecksumAlgorithm'
+            ),
+            'transfer_meta': transfer_future.meta,
+        }
+        main_kwargs.update(upload_id_kwargs)
+        pending_main_kwargs = {'parts': part_futures}
+        pending_main_kwargs.update(pending_upload_id_kwargs)
         # Submit the request to complete the multipart upload.
         self._transfer_coordinator.submit(
             request_executor,
             CompleteMultipartUploadTask(
                 transfer_coordinator=self._transfer_coordinator,
-                main_kwargs={
-                    'client': client,
-                    'bucket': call_args.bucket,
-                    'key': call_args.key,
-                    'extra_args': complete_multipart_extra_args,
-                },
-                pending_main_kwargs={
-                    'upload_id': create_multipart_future,
-                    'parts': part_futures,
-                },
+                main_kwargs=main_kwargs,
+                pending_main_kwargs=pending_main_kwargs,
                 is_final=True,
             ),
         )
 
+    def _open_upload_journal(
+        self, client, config, transfer_future, journal_store, chunksize
+    ):
+        call_args = transfer_future.meta.call_args
+        # The journal is only resumed for the same contents of the file,
+        # uploaded with the same arguments.
+        identity = {
+            'size': transfer_future.meta.size,
+            'mtime_ns': os.stat(call_args.fileobj).st_mtime_ns,
+            'extra_args': hashlib.sha256(
+                repr(sorted(call_args.extra_args.items())).encode('utf-8')
+            ).hexdigest(),
+        }
+        journal, settings, entries = journal_store.open(
+            UPLOAD,
+            call_args.bucket,
+            call_args.key,
+            call_args.fileobj,
+            identity,
+            {'chunksize': chunksize},
+            resume=config.resume,
+            on_replace=functools.partial(
+                self._abort_journaled_uploads, client, call_args
+            ),
+        )
+        upload_id = None
+        journaled_parts = {}
+        for entry in entries:
+            if 'upload_id' in entry:
+                upload_id = entry['upload_id']
+                journaled_parts = {}
+            elif 'part' in entry:
+                part = entry['part']
+                journaled_parts[part['PartNumber']] = part
+        if upload_id is None:
+            return journal, settings['chunksize'], None, []
+
+        completed_parts = self._get_completed_parts(
+            client, call_args, upload_id, journaled_parts
+        )
+        if completed_parts is None:
+            # The upload was aborted or completed since, so start over.
+            journal, settings, _ = journal_store.open(
+                UPLOAD,
+                call_args.bucket,
+                call_args.key,
+                call_args.fileobj,
+                identity,
+                {'chunksize': chunksize},
+            )
+            return journal, settings['chunksize'], None, []
+        return journal, settings['chunksize'], upload_id, completed_parts
+
+    def _abort_journaled_uploads(self, client, call_args, entries):
+        # The multipart upload of a journal that is replaced could no longer
+        # be resumed, so it would be left open indefinitely.
+        for entry in entries:
+            if 'upload_id' not in entry:
+                continue
+            logger.debug(
+                'Aborting multipart upload %s of replaced journal of '
+                's3://%s/%s',
+                entry['upload_id'],
+                call_args.bucket,
+                call_args.key,
+            )
+            try:
+                client.abort_multipart_upload(
+                    Bucket=call_args.bucket,
+                    Key=call_args.key,
+                    UploadId=entry['upload_id'],
+                    **get_filtered_dict(
+                        call_args.extra_args, self.ABORT_MULTIPART_ARGS
+                    ),
+                )
+            except Exception as e:
+                # The upload may have been completed or aborted since.
+                if (
+                    isinstance(e, ClientError)
+                    and e.response.get('Error', {}).get('Code')
+                    == 'NoSuchUpload'
+                ):
+                    continue
+                logger.warning(
+                    'Failed to abort multipart upload %s of s3://%s/%s, it '
+                    'may need to be aborted manually: %s',
+                    entry['upload_id'],
+                    call_args.bucket,
+                    call_args.key,
+                    e,
+                )
+
+    def _get_completed_parts(self, client, call_args, upload_id, parts):
+        # Only trust journaled parts that S3 still has with the same ETag.
+        uploaded_etags = {}
+        paginator = client.get_paginator('list_parts')
+        try:
+            for page in paginator.paginate(
+                Bucket=call_args.bucket,
+                Key=call_args.key,
+                UploadId=upload_id,
+                **get_filtered_dict(
+                    call_args.extra_args, self.LIST_PARTS_ARGS
+                ),
+            ):
+                for part in page.get('Parts', []):
+                    uploaded_etags[part['PartNumber']] = part['ETag']
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == 'NoSuchUpload':
+                return None
+            raise
+        return [
+            part
+            for part_number, part in sorted(parts.items())
+            if uploaded_etags.get(part_number) == part['ETag']
+        ]
+
     def _extra_upload_part_args(self, extra_args):
         # Only the args in UPLOAD_PART_ARGS actually need to be passed
         # onto the upload_part calls.
@@ -748,10 +1037,48 @@ class UploadSubmissionTask(SubmissionTask):
         return tag
 
 
+class CalculateChecksumTask(Task):
+    """Task to calculate the checksum of an upload body ahead of its
+    request"""
+
+    def _main(self, fileobj, algorithm, chunk_size):
+        """
+        :param fileobj: The body to calculate the checksum of. It is
+            rewound once the checksum is calculated.
+        :param algorithm: The ``ChecksumAlgorithm`` of the upload
+        :param chunk_size: The amount to read from the body at a time
+
+        :returns: The base64 encoded checksum, or None if the algorithm is
+            not supported, in which case botocore calculates it.
+        """
+        return calculate_checksum(fileobj, algorithm, chunk_size)
+
+
+def _with_checksum(extra_args, checksum):
+    # A checksum member in the request tells botocore not to calculate the
+    # checksum itself.
+    if checksum is None:
+        return extra_args
+    extra_args = dict(extra_args)
+    algorithm_name = extra_args['ChecksumAlgorithm'].upper()
+    extra_args[f'Checksum{algorithm_name}'] = checksum
+    return extra_args
+
+
 class PutObjectTask(Task):
     """Task to do a nonmultipart upload"""
 
-    def _main(self, client, fileobj, bucket, key, extra_args):
+    def _main(
+        self,
+        client,
+        fileobj,
+        bucket,
+        key,
+        extra_args,
+        transfer_tuner=None,
+        checksum=None,
+        transfer_meta=None,
+    ):
         """
         :param client: The client to use when calling PutObject
         :param fileobj: The file to upload.
@@ -759,16 +1086,40 @@ class PutObjectTask(Task):
         :param key: The name of the key to upload to
         :param extra_args: A dictionary of any extra arguments that may be
             used in the upload.
+        :param transfer_tuner: The tuner to measure the request with, if
+            any.
+        :param checksum: The checksum of the body, if it was calculated
+            ahead of the request.
+        :param transfer_meta: The meta of the transfer, provided with the
+            checksum of the object if it has a checksum algorithm.
         """
-        with fileobj as body:
-            client.put_object(Bucket=bucket, Key=key, Body=body, **extra_args)
+        extra_args = _with_checksum(extra_args, checksum)
+        with fileobj as body, track_request(transfer_tuner, len(body)):
+            response = client.put_object(
+                Bucket=bucket, Key=key, Body=body, **extra_args
+            )
+        if 'ChecksumAlgorithm' in extra_args and transfer_meta is not None:
+            algorithm_name = extra_args['ChecksumAlgorithm'].upper()
+            transfer_meta.provide_object_checksum(
+                response.get(f'Checksum{algorithm_name}', checksum)
+            )
 
 
 class UploadPartTask(Task):
     """Task to upload a part in a multipart upload"""
 
     def _main(
-        self, client, fileobj, bucket, key, upload_id, part_number, extra_args
+        self,
+        client,
+        fileobj,
+        bucket,
+        key,
+        upload_id,
+        part_number,
+        extra_args,
+        transfer_tuner=None,
+        journal=None,
+        checksum=None,
     ):
         """
         :param client: The client to use when calling PutObject
@@ -780,6 +1131,12 @@ class UploadPartTask(Task):
             upload
         :param extra_args: A dictionary of any extra arguments that may be
             used in the upload.
+        :param transfer_tuner: The tuner to measure the request with, if
+            any.
+        :param journal: The journal to record the uploaded part in, if the
+            upload is resumable.
+        :param checksum: The checksum of the part, if it was calculated
+            ahead of the request.
 
         :rtype: dict
         :returns: A dictionary representing a part::
@@ -789,7 +1146,11 @@ class UploadPartTask(Task):
             This value can be appended to a list to be used to complete
             the multipart upload.
         """
-        with fileobj as body:
+        if checksum is not None:
+            extra_args = _with_checksum(extra_args, checksum)
+        elif 'ChecksumAlgorithm' in extra_args:
+            extra_args = self._with_precalculated_checksum(fileobj, extra_args)
+        with fileobj as body, track_request(transfer_tuner, len(body)):
             response = client.upload_part(
                 Bucket=bucket,
                 Key=key,
@@ -805,4 +1166,19 @@ class UploadPartTask(Task):
             checksum_member = f'Checksum{algorithm_name}'
             if checksum_member in response:
                 part_metadata[checksum_member] = response[checksum_member]
+            elif checksum is not None:
+                part_metadata[checksum_member] = checksum
+        if journal is not None:
+            journal.record({'part': part_metadata})
         return part_metadata
+
+    def _with_precalculated_checksum(self, fileobj, extra_args):
+        # Bodies that can calculate their checksum without being read (such
+        # as memory-mapped parts) provide it up front, so botocore does not
+        # have to read the body an extra time to calculate it.
+        if not hasattr(fileobj, 'calculate_checksum'):
+            return extra_args
+        algorithm_name = extra_args['ChecksumAlgorithm'].upper()
+        return _with_checksum(
+            extra_args, fileobj.calculate_checksum(algorithm_name)
+        )
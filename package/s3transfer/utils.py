@@ -10,17 +10,22 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import base64
 import functools
+import hashlib
 import logging
 import math
+import mmap
 import os
 import random
 import socket
 import stat
 import string
 import threading
+import zlib
 from collections import defaultdict
 
+from botocore.compat import HAS_CRT
 from botocore.exceptions import IncompleteReadError, ReadTimeoutError
 
 from s3transfer.compat import SOCKET_ERROR, fallocate, rename_file
@@ -33,6 +38,11 @@ MAX_SINGLE_UPLOAD_SIZE = 5 * (1024**3)
 MIN_UPLOAD_CHUNKSIZE = 5 * (1024**2)
 logger = logging.getLogger(__name__)
 
+if HAS_CRT:
+    from awscrt import checksums as crt_checksums
+else:
+    crt_checksums = None
+
 
 S3_RETRYABLE_DOWNLOAD_ERRORS = (
     socket.timeout,
@@ -43,7 +53,7 @@ S3_RETRYABLE_DOWNLOAD_ERRORS = (
 
 
 def random_file_extension(num_digits=8):
-    return ''.join(random.choice(string.hexdigits) for _ in range(num_digits))
+    return ''.join(random.choices(string.hexdigits, k=num_digits))
 
 
 def signal_not_transferring(request, operation_name, **kwargs):
@@ -312,8 +322,10 @@ class OSUtils:
             return True
         return False
 
-    def get_temp_filename(self, filename):
-        suffix = os.extsep + random_file_extension()
+    def get_temp_filename(self, filename, extension=None):
+        if extension is None:
+            extension = random_file_extension()
+        suffix = os.extsep + extension
         path = os.path.dirname(filename)
         name = os.path.basename(filename)
         temp_filename = name[: self._MAX_FILENAME_LEN - len(suffix)] + suffix
@@ -383,6 +395,16 @@ class DeferredOpenFile:
             return self._start_byte
         return self._fileobj.tell()
 
+    def release_file(self):
+        """Close the file until it is needed again
+
+        The file is reopened at the same position when it is next used.
+        """
+        if self._fileobj is not None:
+            self._start_byte = self._fileobj.tell()
+            self._fileobj.close()
+            self._fileobj = None
+
     def close(self):
         if self._fileobj:
             self._fileobj.close()
@@ -395,6 +417,187 @@ class DeferredOpenFile:
         self.close()
 
 
+class PositionalFileWriter:
+    def __init__(self, filename, size, osutil, preallocated=False):
+        """A file that is written to at explicit offsets from many threads
+
+        The file is preallocated to its final size when it is first written
+        to, and each write is a single ``os.pwrite`` call at its offset, so
+        threads neither share a file position nor need to be serialized.
+        This is only available on platforms that have ``os.pwrite``.
+
+        :type filename: str
+        :param filename: The name of the file to write
+
+        :type size: int
+        :param size: The final size of the file
+
+        :type osutil: s3transfer.utils.OSUtils
+        :param osutil: The os utility used to allocate and open the file
+
+        :type preallocated: bool
+        :param preallocated: If True, the file already exists with its final
+            size and is written to as it is, keeping its contents.
+        """
+        self._filename = filename
+        self._size = size
+        self._osutil = osutil
+        self._preallocated = preallocated
+        self._fileobj = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def is_supported(cls):
+        return hasattr(os, 'pwrite')
+
+    @property
+    def name(self):
+        return self._filename
+
+    def _open_if_needed(self):
+        if self._fileobj is None:
+            with self._lock:
+                if self._fileobj is None:
+                    self._fileobj = self._open()
+        return self._fileobj.fileno()
+
+    def _open(self):
+        if not self._size:
+            return self._osutil.open(self._filename, 'wb')
+        if not self._preallocated:
+            self._osutil.allocate(self._filename, self._size)
+        return self._osutil.open(self._filename, 'rb+')
+
+    def write_at(self, data, offset):
+        """Write all of ``data`` at ``offset``"""
+        fd = self._open_if_needed()
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+
+    def close(self):
+        with self._lock:
+            if self._fileobj is not None:
+                self._fileobj.close()
+
+
+class DeferredMappedFile:
+    def __init__(self, filename, start_byte, size):
+        """A read-only, memory-mapped region of a file
+
+        It is a drop-in replacement for ``DeferredOpenFile`` when reading
+        a known region of a file: the region is mapped when first needed
+        and ``read()`` returns ``memoryview`` slices of the mapping instead
+        of copying the data into new ``bytes``. Positions are relative to
+        the start of the file, like those of the file being replaced.
+
+        :type filename: str
+        :param filename: The name of the file to map
+
+        :type start_byte: int
+        :param start_byte: The first byte of the region
+
+        :type size: int
+        :param size: The size of the region
+        """
+        self._filename = filename
+        self._start_byte = start_byte
+        self._size = size
+        self._mmap = None
+        self._view = None
+        self._position = 0
+
+    def _map_if_needed(self):
+        if self._view is not None:
+            return
+        # Mappings must start at a multiple of the allocation granularity.
+        offset = self._start_byte - (
+            self._start_byte % mmap.ALLOCATIONGRANULARITY
+        )
+        delta = self._start_byte - offset
+        with open(self._filename, 'rb') as f:
+            self._mmap = mmap.mmap(
+                f.fileno(),
+                length=delta + self._size,
+                offset=offset,
+                access=mmap.ACCESS_READ,
+            )
+        self._view = memoryview(self._mmap)[delta : delta + self._size]
+
+    @property
+    def name(self):
+        return self._filename
+
+    def read(self, amount=None):
+        self._map_if_needed()
+        start = self._position
+        if amount is None:
+            end = self._size
+        else:
+            end = min(start + amount, self._size)
+        self._position = max(start, end)
+        return self._view[start:end]
+
+    def seek(self, where, whence=0):
+        if whence == 1:
+            where += self._start_byte + self._position
+        elif whence == 2:
+            where += self._start_byte + self._size
+        self._position = max(where - self._start_byte, 0)
+
+    def tell(self):
+        return self._start_byte + self._position
+
+    def calculate_checksum(self, algorithm):
+        """Calculate the checksum of the whole region
+
+        :type algorithm: str
+        :param algorithm: The name of the algorithm, one of ``md5``,
+            ``crc32``, ``crc32c`` (only if the CRT is installed), ``sha1``
+            or ``sha256``.
+
+        :returns: The base64 encoded checksum, or None if the algorithm is
+            not supported.
+        """
+        self._map_if_needed()
+        algorithm = algorithm.lower()
+        if algorithm == 'crc32':
+            digest = (zlib.crc32(self._view) & 0xFFFFFFFF).to_bytes(4, 'big')
+        elif algorithm == 'crc32c' and crt_checksums is not None:
+            digest = crt_checksums.crc32c(self._view).to_bytes(4, 'big')
+        elif algorithm in ('md5', 'sha1', 'sha256'):
+            digest = hashlib.new(algorithm, self._view).digest()
+        else:
+            return None
+        return base64.b64encode(digest).decode('ascii')
+
+    def release_file(self):
+        """Unmap the region until it is needed again"""
+        self.close()
+
+    def close(self):
+        if self._view is None:
+            return
+        self._view.release()
+        self._view = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Slices returned by read() are still referenced, the mapping
+            # is closed once they are garbage collected.
+            pass
+        self._mmap = None
+
+    def __enter__(self):
+        self._map_if_needed()
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+
 class ReadFileChunk:
     def __init__(
         self,
@@ -514,6 +717,24 @@ class ReadFileChunk:
             invoke_progress_callbacks(self._callbacks, len(data))
         return data
 
+    def calculate_checksum(self, algorithm):
+        """Calculate the checksum of the chunk without reading it
+
+        This is only possible when the underlying file-like object supports
+        it, such as a ``DeferredMappedFile``.
+
+        :returns: The base64 encoded checksum, or None if it cannot be
+            calculated.
+        """
+        if not hasattr(self._fileobj, 'calculate_checksum'):
+            return None
+        return self._fileobj.calculate_checksum(algorithm)
+
+    def release_file(self):
+        """Release the file underlying the chunk until it is read again"""
+        if hasattr(self._fileobj, 'release_file'):
+            self._fileobj.release_file()
+
     def signal_transferring(self):
         self.enable_callback()
         if hasattr(self._fileobj, 'signal_transferring'):
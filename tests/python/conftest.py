@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The Python packages are vendored in package/, as deployed.
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, 'package')
+)
@@ -0,0 +1,250 @@
+"""Tests of select_object_records against a local fake event-stream server."""
+import binascii
+import struct
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import boto3
+import pytest
+from boto3.exceptions import S3SelectIncompleteError
+from boto3.s3.query import RecordSplitter
+from botocore.config import Config
+
+
+def _encode_header(name, value):
+    name = name.encode('utf-8')
+    value = value.encode('utf-8')
+    # Header value type 7 is a string.
+    return (
+        struct.pack('!B', len(name))
+        + name
+        + struct.pack('!BH', 7, len(value))
+        + value
+    )
+
+
+def encode_event(event_type, payload=b'', content_type=None):
+    """Encode an event as an AWS event-stream message."""
+    headers = _encode_header(':message-type', 'event')
+    headers += _encode_header(':event-type', event_type)
+    if content_type is not None:
+        headers += _encode_header(':content-type', content_type)
+    total_length = 12 + len(headers) + len(payload) + 4
+    prelude = struct.pack('!II', total_length, len(headers))
+    prelude += struct.pack('!I', binascii.crc32(prelude))
+    message = prelude + headers + payload
+    return message + struct.pack('!I', binascii.crc32(message))
+
+
+def records_event(payload):
+    return encode_event('Records', payload, 'application/octet-stream')
+
+
+def stats_event(scanned, processed, returned):
+    payload = (
+        '<Stats><BytesScanned>%d</BytesScanned>'
+        '<BytesProcessed>%d</BytesProcessed>'
+        '<BytesReturned>%d</BytesReturned></Stats>'
+        % (scanned, processed, returned)
+    ).encode('utf-8')
+    return encode_event('Stats', payload, 'text/xml')
+
+
+def end_event():
+    return encode_event('End')
+
+
+class FakeSelectHandler(BaseHTTPRequestHandler):
+    """Answers SelectObjectContent requests with the server's events.
+
+    If the server has no events, it streams records until the client
+    disconnects.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.requests.append(self.path)
+        self.send_response(200)
+        if self.server.events is not None:
+            body = b''.join(self.server.events)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        chunk = records_event(b'{"n": 1}\n' * 100)
+        try:
+            while True:
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+                self.wfile.flush()
+        except OSError:
+            self.server.disconnected.set()
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeSelectHandler)
+    server.daemon_threads = True
+    server.events = None
+    server.requests = []
+    server.disconnected = threading.Event()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def client(server):
+    return boto3.client(
+        's3',
+        endpoint_url='http://127.0.0.1:%d' % server.server_port,
+        region_name='us-east-1',
+        aws_access_key_id='foo',
+        aws_secret_access_key='bar',
+        config=Config(
+            s3={'addressing_style': 'path'}, retries={'max_attempts': 0}
+        ),
+    )
+
+
+def split_payload(data, *offsets):
+    bounds = [0, *offsets, len(data)]
+    return [
+        records_event(data[start:end])
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+
+def test_json_lines(server, client):
+    data = (
+        '{"id": 1, "title": "caf\u00e9"}\n'
+        '{"id": 2, "title": "na\u00efve"}\n'
+        '{"id": 3, "title": "end"}\n'
+    ).encode('utf-8')
+    # Split within a record and within a multi-byte character.
+    server.events = split_payload(data, 10, data.index(b'\xc3') + 1, 40)
+    server.events += [stats_event(100, 90, len(data)), end_event()]
+    stats = []
+
+    records = list(
+        client.select_object_records(
+            'bucket',
+            'key.jsonl',
+            'SELECT * FROM S3Object s',
+            InputSerialization={'JSON': {'Type': 'LINES'}},
+            StatsCallback=stats.append,
+        )
+    )
+
+    assert records == [
+        {'id': 1, 'title': 'caf\u00e9'},
+        {'id': 2, 'title': 'na\u00efve'},
+        {'id': 3, 'title': 'end'},
+    ]
+    assert stats == [
+        {
+            'BytesScanned': 100,
+            'BytesProcessed': 90,
+            'BytesReturned': len(data),
+        }
+    ]
+    assert server.requests[0].startswith('/bucket/key.jsonl?select')
+
+
+def test_csv_quoted_newlines_across_chunks(server, client):
+    data = b'1,"line one\nline two"\n2,"say ""hi""\nbye"\n3,plain\n'
+    expected = [
+        {'id': '1', 'text': 'line one\nline two'},
+        {'id': '2', 'text': 'say "hi"\nbye'},
+        {'id': '3', 'text': 'plain'},
+    ]
+    for offset in range(1, len(data)):
+        server.events = split_payload(data, offset) + [end_event()]
+        records = list(
+            client.select_object_records(
+                'bucket',
+                'key.csv',
+                'SELECT s._1, s._2 FROM S3Object s',
+                InputSerialization={'CSV': {}},
+                OutputSerialization={'CSV': {}},
+                FieldNames=['id', 'text'],
+            )
+        )
+        assert records == expected, offset
+
+
+def test_csv_escaped_quotes_across_chunks(server, client):
+    data = b'1,"a \\" quote\nand more"\n2,"\\"\n\\""\n3,"x\\\\"\n'
+    expected = [
+        ['1', 'a " quote\nand more'],
+        ['2', '"\n"'],
+        ['3', 'x\\'],
+    ]
+    for offset in range(1, len(data)):
+        server.events = split_payload(data, offset) + [end_event()]
+        records = list(
+            client.select_object_records(
+                'bucket',
+                'key.csv',
+                'SELECT * FROM S3Object s',
+                InputSerialization={'CSV': {}},
+                OutputSerialization={'CSV': {'QuoteEscapeCharacter': '\\'}},
+            )
+        )
+        assert records == expected, offset
+
+
+def test_missing_end_event_raises(server, client):
+    server.events = [records_event(b'{"id": 1}\n')]
+
+    records = client.select_object_records(
+        'bucket',
+        'key.jsonl',
+        'SELECT * FROM S3Object s',
+        InputSerialization={'JSON': {'Type': 'LINES'}},
+    )
+
+    assert next(records) == {'id': 1}
+    with pytest.raises(S3SelectIncompleteError):
+        next(records)
+
+
+def test_early_close_releases_connection(server, client):
+    records = client.select_object_records(
+        'bucket',
+        'key.jsonl',
+        'SELECT * FROM S3Object s',
+        InputSerialization={'JSON': {'Type': 'LINES'}},
+    )
+
+    assert [next(records) for _ in range(3)] == [{'n': 1}] * 3
+    records.close()
+
+    # The server streams records until the connection is closed.
+    assert server.disconnected.wait(10)
+
+
+@pytest.mark.parametrize(
+    'escape_char, piece, expected',
+    [
+        (None, b'1,"a""b"', False),
+        (None, b'1,"a""b', True),
+        (b'\\', b'1,"a\\"b"', False),
+        (b'\\', b'1,"a\\"b', True),
+        (b'\\', b'1,"a\\\\"', False),
+        (b'\\', b'1,a\\,"b', True),
+    ],
+)
+def test_record_splitter_open_quote(escape_char, piece, expected):
+    splitter = RecordSplitter(b'\n', b'"', escape_char)
+
+    assert splitter._has_open_quote(piece) is expected